@@ -0,0 +1,33 @@
+from app.indexes.ngram_index import NgramIndex
+from app.indexes.fuzzy_index import DeletionIndex
+from app.indexes.company_name_index import (
+    CompanyNameIndex,
+    company_name_index,
+)
+from app.indexes.tag_index import (
+    TagIndex,
+    normalize_tag,
+    tag_index,
+)
+from app.indexes.tag_facets import (
+    TagFacets,
+    tag_facets,
+)
+from app.indexes.language_registry import (
+    LanguageRegistry,
+    language_registry,
+)
+
+__all__ = [
+    "NgramIndex",
+    "DeletionIndex",
+    "CompanyNameIndex",
+    "company_name_index",
+    "TagIndex",
+    "normalize_tag",
+    "tag_index",
+    "TagFacets",
+    "tag_facets",
+    "LanguageRegistry",
+    "language_registry",
+]
@@ -0,0 +1,340 @@
+import heapq
+from typing import Dict, List, Optional, Tuple, Iterable
+
+from app.indexes.ngram_index import NgramIndex
+from app.indexes.fuzzy_index import DeletionIndex
+from app.indexes import hangul
+
+
+# LIKE 패턴에서 특수 의미를 갖는 문자
+LIKE_SPECIAL_CHARS = ("%", "_", "\\")
+
+# 매칭 등급 (작을수록 상위)
+MATCH_EXACT = 0
+MATCH_PREFIX = 1
+MATCH_INFIX = 2
+MATCH_JAMO_PREFIX = 3
+MATCH_JAMO_INFIX = 4
+MATCH_CHOSUNG_PREFIX = 5
+MATCH_CHOSUNG_INFIX = 6
+MATCH_FUZZY = 7 # + 편집 거리
+
+# 오타 허용 검색 최대 편집 거리
+FUZZY_MAX_DISTANCE = 2
+
+
+def match_rank(
+    name: str,
+    query: str,
+):
+    """
+    자동완성 매칭 등급
+        - 완전 일치 > 접두 일치 > 부분 일치
+    """
+    if name == query:
+        return MATCH_EXACT
+    if name.startswith(query):
+        return MATCH_PREFIX
+    return MATCH_INFIX
+
+
+class _CompanyNameData:
+    """
+    CompanyNameIndex 내부 자료 (재구축 시 통째로 교체)
+    """
+
+    def __init__(self, n: int):
+        self.n: int = n
+
+        # language_type -> NgramIndex(name_id -> name)
+        self.partitions: Dict[str, NgramIndex] = {}
+
+        # name_id -> company_id, name
+        self.name_companies: Dict[int, int] = {}
+        self.name_texts: Dict[int, str] = {}
+
+        # name -> company_id (같은 이름이면 마지막에 등록된 회사)
+        self.exact_companies: Dict[str, int] = {}
+
+        # company_id -> [(name_id, language_type, name), ...] (name_id 순)
+        self.company_names: Dict[int, List[Tuple[int, str, str]]] = {}
+
+        # 한글 회사명의 자모 분해 / 초성 문자열 색인 (name_id -> 변환 문자열)
+        self.jamo_index: NgramIndex = NgramIndex(n=3)
+        self.chosung_index: NgramIndex = NgramIndex(n=2)
+
+        # 오타 허용 검색용 삭제 색인 (name_id -> 회사명)
+        self.fuzzy_index: DeletionIndex = DeletionIndex(max_distance=FUZZY_MAX_DISTANCE)
+
+    def add(
+        self,
+        name_id: int,
+        company_id: int,
+        name: Optional[str],
+        language_type: str,
+    ):
+        # NULL 회사명은 LIKE에 매칭되지 않고, 빈 회사명은 출력하지 않음
+        if not name or name_id in self.name_companies:
+            return
+
+        if language_type not in self.partitions:
+            self.partitions[language_type] = NgramIndex(n=self.n)
+        self.partitions[language_type].add(name_id, name)
+        self.name_companies[name_id] = company_id
+
+        names = self.company_names.setdefault(company_id, [])
+        names.append((name_id, language_type, name))
+        names.sort()
+        self.name_texts[name_id] = name
+        self.exact_companies[name] = max(company_id, self.exact_companies.get(name, 0))
+        self.fuzzy_index.add(name_id, name)
+
+        if hangul.has_syllable(name):
+            self.jamo_index.add(name_id, hangul.decompose(name))
+            self.chosung_index.add(name_id, hangul.chosung(name))
+
+
+class CompanyNameIndex:
+    """
+    회사명 자동완성용 인메모리 색인
+        - 언어(language_type)별로 NgramIndex 파티션을 유지
+        - 모든 언어의 회사명에서 검색하고, 회사별로 요청 언어의 회사명을 반환
+        - 한글 회사명은 자모 분해 / 초성 문자열도 색인
+            - 초성 질의("ㅇㅌㄷ"), 입력 중인 음절("원티ㄷ", "원틷")도 색인 조회로 처리
+        - 오타 허용 검색(편집 거리 2 이내)용 삭제 색인 유지 (일치 결과가 없을 때만 사용)
+        - 애플리케이션 시작 시(lifespan) 전체 회사명으로 구축
+        - CompanyRepository.add_new_company 에서 새 회사명을 추가
+        - 프로세스 단위 색인이므로 다른 프로세스의 쓰기는 재구축 시 반영됨
+    """
+
+    def __init__(self, n: int = 2):
+        self.n: int = n
+        self._data: _CompanyNameData = _CompanyNameData(n=n)
+        self._is_loaded: bool = False
+
+        # 재구축 중에 들어온 추가분 (재구축 완료 시 다시 반영)
+        self._pending: Optional[List[Tuple[int, int, str, str]]] = None
+
+    @property
+    def is_loaded(self):
+        return self._is_loaded
+
+    def can_serve(
+        self,
+        query: str,
+    ):
+        """
+        색인으로 LIKE '%query%'와 동일한 결과를 낼 수 있는지 확인
+            - 와일드카드 문자가 포함된 질의는 DB로 처리
+        """
+        return not any(ch in query for ch in LIKE_SPECIAL_CHARS)
+
+    def begin_rebuild(self):
+        """
+        재구축 시작 표시
+            - DB 조회 ~ rebuild 사이에 추가된 회사명을 잃지 않기 위함
+        """
+        self._pending = []
+
+    def rebuild(
+        self,
+        rows: Iterable[Tuple[int, int, str, str]],
+    ):
+        """
+        전체 색인 재구축
+
+        Args:
+            - rows: (name_id, company_id, name, language_type) 목록
+        """
+        data = _CompanyNameData(n=self.n)
+        for name_id, company_id, name, language_type in rows:
+            data.add(name_id, company_id, name, language_type)
+
+        for name_id, company_id, name, language_type in self._pending or []:
+            data.add(name_id, company_id, name, language_type)
+
+        self._data = data
+        self._pending = None
+        self._is_loaded = True
+
+    def add(
+        self,
+        name_id: int,
+        company_id: int,
+        name: Optional[str],
+        language_type: str,
+    ):
+        """
+        회사명 추가
+        """
+        if self._pending is not None:
+            self._pending.append((name_id, company_id, name, language_type))
+        self._data.add(name_id, company_id, name, language_type)
+
+    def exact_company_id(
+        self,
+        name: str,
+    ):
+        """
+        회사명과 정확히 일치하는 회사 id (같은 이름이면 마지막에 등록된 회사)
+
+        Returns:
+            - int: 회사 id (없으면 0)
+        """
+        return self._data.exact_companies.get(name, 0)
+
+    def display_name(
+        self,
+        company_id: int,
+        language: str,
+    ):
+        """
+        회사의 출력용 회사명
+            - 요청 언어의 회사명, 없으면 노출 가능한(빈 문자열이 아닌) 다른 언어 회사명
+        """
+        fallback: Optional[str] = None
+        for _, language_type, name in self._data.company_names.get(company_id, []):
+            if language_type == language:
+                return name
+            if fallback is None:
+                fallback = name
+
+        return fallback
+
+    def _top_companies(
+        self,
+        best_keys: Dict[int, Tuple[int, int, int]],
+        language: str,
+        limit: int,
+        after: Optional[Tuple[int, int, int]],
+    ):
+        """
+        회사별 정렬 키에서 after 이후 상위 limit개 선택 (heap 기반 top-k)
+        """
+        candidates: List[Tuple[Tuple[int, int, int], int]] = [
+            (key, company_id) for company_id, key in best_keys.items()
+            if after is None or key > after
+        ]
+
+        return [
+            (key, self.display_name(company_id, language))
+            for key, company_id in heapq.nsmallest(limit, candidates)
+        ]
+
+    def search(
+        self,
+        query: str,
+        language: str,
+        limit: int,
+        after: Optional[Tuple[int, int, int]] = None,
+    ):
+        """
+        회사명 부분 일치 검색 (관련도 순 상위 limit개)
+            - 모든 언어의 회사명에서 검색, 회사별로 가장 잘 맞는 회사명 기준으로 정렬
+            - 정렬 키: (매칭 등급, 회사명 길이, name_id)
+            - 전체 정렬 대신 heap 기반 top-k 선택
+
+        Args:
+            - query (str): 검색할 회사명
+            - language (str): 출력 언어
+            - limit (int): 최대 결과 수
+            - after (Tuple[int, int, int]): 이전 페이지 마지막 정렬 키
+
+        Returns:
+            - List[Tuple[Tuple[int, int, int], str]]: (정렬 키, 출력 회사명) 리스트
+        """
+        data = self._data
+
+        # 회사별 최상위 정렬 키
+        best_keys: Dict[int, Tuple[int, int, int]] = {}
+
+        def update(name_id: int, rank: int):
+            name: str = data.name_texts[name_id]
+            key = (rank, len(name), name_id)
+            company_id: int = data.name_companies[name_id]
+            if company_id not in best_keys or key < best_keys[company_id]:
+                best_keys[company_id] = key
+
+        # 부분 일치 (LIKE '%query%')
+        for partition in data.partitions.values():
+            for name_id in partition.match(query):
+                update(name_id, match_rank(partition.get_text(name_id), query))
+
+        if hangul.is_chosung_query(query):
+            # 초성 일치
+            for name_id in data.chosung_index.match(query):
+                is_prefix: bool = data.chosung_index.get_text(name_id).startswith(query)
+                update(name_id, MATCH_CHOSUNG_PREFIX if is_prefix else MATCH_CHOSUNG_INFIX)
+
+        elif hangul.has_jamo(query) or (query and hangul.is_composing(query[-1])):
+            # 입력 중인 음절 -> 자모 단위 일치
+            jamo_query: str = hangul.decompose(query)
+            for name_id in data.jamo_index.match(jamo_query):
+                is_prefix: bool = data.jamo_index.get_text(name_id).startswith(jamo_query)
+                update(name_id, MATCH_JAMO_PREFIX if is_prefix else MATCH_JAMO_INFIX)
+
+        return self._top_companies(best_keys, language, limit, after)
+
+    def fuzzy_search(
+        self,
+        query: str,
+        language: str,
+        limit: int,
+        after: Optional[Tuple[int, int, int]] = None,
+    ):
+        """
+        오타 허용 회사명 검색 (편집 거리 FUZZY_MAX_DISTANCE 이내)
+            - 정렬 키: (MATCH_FUZZY + 편집 거리, 회사명 길이, name_id)
+
+        Args:
+            - query (str): 검색할 회사명
+            - language (str): 출력 언어
+            - limit (int): 최대 결과 수
+            - after (Tuple[int, int, int]): 이전 페이지 마지막 정렬 키
+
+        Returns:
+            - List[Tuple[Tuple[int, int, int], str]]: (정렬 키, 출력 회사명) 리스트
+        """
+        data = self._data
+
+        best_keys: Dict[int, Tuple[int, int, int]] = {}
+        for distance, name_id in data.fuzzy_index.search(query):
+            key = (MATCH_FUZZY + distance, len(data.name_texts[name_id]), name_id)
+            company_id: int = data.name_companies[name_id]
+            if company_id not in best_keys or key < best_keys[company_id]:
+                best_keys[company_id] = key
+
+        return self._top_companies(best_keys, language, limit, after)
+
+    def fuzzy_company_id(
+        self,
+        query: str,
+    ):
+        """
+        오타 허용 회사 id 조회
+            - 편집 거리가 가장 가까운 회사명의 회사 id
+            - 가장 가까운 거리에 여러 회사가 있으면 어느 회사인지 알 수 없으므로 0
+
+        Returns:
+            - int: 회사 id (없거나 모호하면 0)
+        """
+        data = self._data
+
+        matches: List[Tuple[int, int]] = data.fuzzy_index.search(query)
+        if not matches:
+            return 0
+
+        best_distance: int = matches[0][0]
+        company_ids = {
+            data.name_companies[name_id]
+            for distance, name_id in matches
+            if distance == best_distance
+        }
+        if len(company_ids) > 1:
+            return 0
+
+        return company_ids.pop()
+
+
+# 프로세스 공용 색인
+company_name_index = CompanyNameIndex()
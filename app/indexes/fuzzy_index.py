@@ -0,0 +1,141 @@
+from collections import defaultdict
+from typing import Dict, List, Set, Tuple
+
+
+def edit_distance(
+    source: str,
+    target: str,
+    max_distance: int,
+):
+    """
+    편집 거리 (인접 문자 교환 포함, Optimal String Alignment)
+        - max_distance를 넘으면 바로 max_distance + 1 반환
+
+    Returns:
+        - int: 편집 거리
+    """
+    if abs(len(source) - len(target)) > max_distance:
+        return max_distance + 1
+
+    prev_prev: List[int] = []
+    prev: List[int] = list(range(len(target) + 1))
+    for i in range(1, len(source) + 1):
+        curr: List[int] = [i] + [0] * len(target)
+        for j in range(1, len(target) + 1):
+            cost = 0 if source[i - 1] == target[j - 1] else 1
+            curr[j] = min(
+                prev[j] + 1,
+                curr[j - 1] + 1,
+                prev[j - 1] + cost,
+            )
+            if (
+                i > 1 and j > 1
+                and source[i - 1] == target[j - 2]
+                and source[i - 2] == target[j - 1]
+            ):
+                curr[j] = min(curr[j], prev_prev[j - 2] + 1)
+
+        if min(curr) > max_distance:
+            return max_distance + 1
+        prev_prev, prev = prev, curr
+
+    return prev[-1]
+
+
+class DeletionIndex:
+    """
+    오타 허용 검색용 삭제 색인 (SymSpell 방식)
+        - 문서 앞부분(prefix_length)에서 max_distance개까지 문자를 지운 변형을 모두 색인
+        - 검색 시 질의의 삭제 변형만 조회 -> 후보를 실제 편집 거리로 검증
+        - 조회 비용은 질의 길이와 max_distance에만 비례 (전체 문서 순회 없음)
+        - 대소문자는 구분하지 않음
+    """
+
+    def __init__(
+        self,
+        max_distance: int = 2,
+        prefix_length: int = 7,
+    ):
+        self.max_distance: int = max_distance
+        self.prefix_length: int = prefix_length
+        self._texts: Dict[int, str] = {}
+        self._deletes: Dict[str, Set[int]] = defaultdict(set)
+
+    def __len__(self):
+        return len(self._texts)
+
+    def _variants(self, text: str) -> Set[str]:
+        variants: Set[str] = {text[:self.prefix_length]}
+        frontier: Set[str] = set(variants)
+        for _ in range(self.max_distance):
+            next_frontier: Set[str] = set()
+            for word in frontier:
+                for i in range(len(word)):
+                    next_frontier.add(word[:i] + word[i + 1:])
+            next_frontier -= variants
+            variants |= next_frontier
+            frontier = next_frontier
+
+        return variants
+
+    def add(
+        self,
+        doc_id: int,
+        text: str,
+    ):
+        """
+        문서 색인 (이미 있는 doc_id는 갱신)
+        """
+        if doc_id in self._texts:
+            self.remove(doc_id)
+
+        normalized: str = text.casefold()
+        self._texts[doc_id] = normalized
+        for variant in self._variants(normalized):
+            self._deletes[variant].add(doc_id)
+
+    def remove(
+        self,
+        doc_id: int,
+    ):
+        """
+        문서 색인 제거
+        """
+        normalized = self._texts.pop(doc_id, None)
+        if normalized is None:
+            return
+
+        for variant in self._variants(normalized):
+            posting = self._deletes.get(variant)
+            if posting is None:
+                continue
+            posting.discard(doc_id)
+            if not posting:
+                del self._deletes[variant]
+
+    def search(
+        self,
+        query: str,
+        max_distance: int = None,
+    ):
+        """
+        편집 거리 max_distance 이내의 문서 조회
+
+        Returns:
+            - List[Tuple[int, int]]: (편집 거리, doc_id) 리스트 (가까운 순)
+        """
+        if max_distance is None or max_distance > self.max_distance:
+            max_distance = self.max_distance
+
+        normalized: str = query.casefold()
+        candidates: Set[int] = set()
+        for variant in self._variants(normalized):
+            candidates |= self._deletes.get(variant, set())
+
+        results: List[Tuple[int, int]] = []
+        for doc_id in candidates:
+            distance = edit_distance(normalized, self._texts[doc_id], max_distance)
+            if distance <= max_distance:
+                results.append((distance, doc_id))
+
+        return sorted(results)
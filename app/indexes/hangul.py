@@ -0,0 +1,107 @@
+# 한글 자모 분해 / 초성 추출
+#   - 자모는 키보드 입력 단위(호환 자모, ㄱ~ㅣ)로 변환
+#   - 겹모음(ㅘ), 겹받침(ㄳ)은 입력 순서대로 나눔 -> 입력 중인 음절도 접두 일치로 매칭
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+CHOSUNG = [
+    "ㄱ", "ㄲ", "ㄴ", "ㄷ", "ㄸ", "ㄹ", "ㅁ", "ㅂ", "ㅃ", "ㅅ",
+    "ㅆ", "ㅇ", "ㅈ", "ㅉ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+]
+JUNGSUNG = [
+    "ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅗㅏ",
+    "ㅗㅐ", "ㅗㅣ", "ㅛ", "ㅜ", "ㅜㅓ", "ㅜㅔ", "ㅜㅣ", "ㅠ", "ㅡ", "ㅡㅣ",
+    "ㅣ",
+]
+JONGSUNG = [
+    "", "ㄱ", "ㄲ", "ㄱㅅ", "ㄴ", "ㄴㅈ", "ㄴㅎ", "ㄷ", "ㄹ", "ㄹㄱ",
+    "ㄹㅁ", "ㄹㅂ", "ㄹㅅ", "ㄹㅌ", "ㄹㅍ", "ㄹㅎ", "ㅁ", "ㅂ", "ㅂㅅ", "ㅅ",
+    "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+]
+
+# 호환 자모 중 겹모음 / 겹받침 (직접 입력된 경우)
+COMPOUND_JAMO = {
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ",
+    "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ", "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ",
+    "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ",
+    "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+}
+
+# 호환 자모 범위 (ㄱ ~ ㅣ), 자음 범위 (ㄱ ~ ㅎ)
+JAMO_FIRST, JAMO_LAST = 0x3131, 0x3163
+CONSONANT_FIRST, CONSONANT_LAST = 0x3131, 0x314E
+
+
+def is_syllable(ch: str):
+    return HANGUL_BASE <= ord(ch) <= HANGUL_LAST
+
+
+def is_jamo(ch: str):
+    return JAMO_FIRST <= ord(ch) <= JAMO_LAST
+
+
+def is_consonant(ch: str):
+    return CONSONANT_FIRST <= ord(ch) <= CONSONANT_LAST
+
+
+def has_syllable(text: str):
+    return any(is_syllable(ch) for ch in text)
+
+
+def has_jamo(text: str):
+    return any(is_jamo(ch) for ch in text)
+
+
+def is_composing(ch: str):
+    """
+    입력 중일 수 있는 음절인지 확인
+        - 받침이 있는 음절: 다음 음절의 초성이거나 겹받침을 입력 중일 수 있음 ("원틷" -> "원티드")
+        - 받침 없는 ㅗ/ㅜ/ㅡ 음절: 겹모음을 입력 중일 수 있음 ("오" -> "와")
+    """
+    if not is_syllable(ch):
+        return False
+
+    code = ord(ch) - HANGUL_BASE
+    if code % 28 != 0:
+        return True
+    return JUNGSUNG[(code % 588) // 28] in ("ㅗ", "ㅜ", "ㅡ")
+
+
+def is_chosung_query(text: str):
+    """
+    초성만으로 이루어진 질의인지 확인 (공백 제외)
+    """
+    chars = [ch for ch in text if not ch.isspace()]
+    return bool(chars) and all(is_consonant(ch) for ch in chars)
+
+
+def decompose(text: str):
+    """
+    문자열을 자모 단위로 분해
+        - "원티드" -> "ㅇㅜㅓㄴㅌㅣㄷㅡ"
+        - 한글 음절이 아닌 문자는 그대로 유지
+    """
+    results = []
+    for ch in text:
+        if is_syllable(ch):
+            code = ord(ch) - HANGUL_BASE
+            results.append(CHOSUNG[code // 588])
+            results.append(JUNGSUNG[(code % 588) // 28])
+            results.append(JONGSUNG[code % 28])
+        else:
+            results.append(COMPOUND_JAMO.get(ch, ch))
+
+    return "".join(results)
+
+
+def chosung(text: str):
+    """
+    문자열의 초성 추출
+        - "원티드랩" -> "ㅇㅌㄷㄹ"
+        - 한글 음절이 아닌 문자는 그대로 유지
+    """
+    return "".join(
+        CHOSUNG[(ord(ch) - HANGUL_BASE) // 588] if is_syllable(ch) else ch
+        for ch in text
+    )
@@ -0,0 +1,103 @@
+from typing import Dict, Iterable, Optional, Tuple
+
+
+class LanguageRegistry:
+    """
+    언어 language_type <-> id 레지스트리 (인메모리)
+        - 언어는 거의 바뀌지 않으므로 애플리케이션 시작 시(lifespan) 한 번 조회해서 보관
+        - CompanyRepository.add_new_language 에서 commit 이후 등록
+        - 같은 language_type이 여러 행이면 id가 가장 작은 행 사용 (unique 인덱스 이전 데이터)
+        - 언어는 삭제되지 않으므로 재구축 시 기존 항목과 합침 (조회 중에 등록된 언어를 잃지 않음)
+        - 갱신은 await 없이 한 번에 끝나므로 같은 이벤트 루프의 요청끼리 lock 불필요
+    """
+
+    def __init__(self):
+        # language_type -> id
+        self._ids: Dict[str, int] = {}
+
+        # id -> language_type (중복 행의 id 포함)
+        self._types: Dict[int, str] = {}
+        self._is_loaded: bool = False
+
+    @property
+    def is_loaded(self):
+        return self._is_loaded
+
+    def rebuild(
+        self,
+        rows: Iterable[Tuple[str, int]],
+    ):
+        """
+        전체 재구축
+
+        Args:
+            - rows: (language_type, id) 목록
+        """
+        for language_type, language_id in rows:
+            self.register(language_type, language_id)
+        self._is_loaded = True
+
+    def register(
+        self,
+        language_type: str,
+        language_id: int,
+    ):
+        """
+        언어 등록 (이미 더 작은 id로 등록되어 있으면 id -> language_type만 추가)
+        """
+        self._types[language_id] = language_type
+        current_id = self._ids.get(language_type)
+        if current_id is None or language_id < current_id:
+            self._ids[language_type] = language_id
+
+    def get_id(
+        self,
+        language_type: str,
+    ):
+        """
+        언어 id (없으면 None)
+        """
+        return self._ids.get(language_type)
+
+    def get_type(
+        self,
+        language_id: int,
+    ):
+        """
+        language_type (없으면 None)
+        """
+        return self._types.get(language_id)
+
+    def get_ids(
+        self,
+        language_types: Iterable[str],
+    ):
+        """
+        등록된 언어만 id 조회
+
+        Returns:
+            - Dict[str, int]: language_type -> id
+        """
+        language_ids: Dict[str, int] = {}
+        for language_type in language_types:
+            language_id: Optional[int] = self._ids.get(language_type)
+            if language_id is not None:
+                language_ids[language_type] = language_id
+        return language_ids
+
+    def stats(self):
+        """
+        레지스트리 통계
+
+        Returns:
+            - Dict[str, Any]: 언어 수, 언어 행 수
+        """
+        return {
+            "is_loaded": self._is_loaded,
+            "languages": len(self._ids),
+            "rows": len(self._types),
+        }
+
+
+# 프로세스 공용 레지스트리
+language_registry = LanguageRegistry()
@@ -0,0 +1,115 @@
+from collections import defaultdict
+from typing import Dict, List, Set, Iterable
+
+
+class NgramIndex:
+    """
+    부분 문자열 검색용 n-gram 역색인
+        - 문서(doc_id, text)를 1-gram과 n-gram 단위로 색인
+        - 질의의 gram posting을 작은 것부터 교집합 -> 후보를 부분 문자열 여부로 검증
+        - 검증 단계가 있으므로 결과는 `text LIKE '%query%'`와 동일
+    """
+
+    def __init__(self, n: int = 2):
+        self.n: int = n
+        self._texts: Dict[int, str] = {}
+        self._postings: Dict[str, Set[int]] = defaultdict(set)
+
+    def __len__(self):
+        return len(self._texts)
+
+    def _grams(self, text: str) -> Set[str]:
+        # 1-gram은 질의 길이가 n보다 짧은 경우에 사용
+        grams: Set[str] = set(text)
+        grams.update(text[i:i + self.n] for i in range(len(text) - self.n + 1))
+        return grams
+
+    def add(
+        self,
+        doc_id: int,
+        text: str,
+    ):
+        """
+        문서 색인 (이미 있는 doc_id는 갱신)
+        """
+        if doc_id in self._texts:
+            self.remove(doc_id)
+
+        self._texts[doc_id] = text
+        for gram in self._grams(text):
+            self._postings[gram].add(doc_id)
+
+    def remove(
+        self,
+        doc_id: int,
+    ):
+        """
+        문서 색인 제거
+        """
+        text = self._texts.pop(doc_id, None)
+        if text is None:
+            return
+
+        for gram in self._grams(text):
+            posting = self._postings.get(gram)
+            if posting is None:
+                continue
+            posting.discard(doc_id)
+            if not posting:
+                del self._postings[gram]
+
+    def get_text(
+        self,
+        doc_id: int,
+    ):
+        return self._texts.get(doc_id)
+
+    def match(
+        self,
+        query: str,
+    ):
+        """
+        query를 부분 문자열로 포함하는 문서 id 조회 (정렬하지 않음)
+
+        Returns:
+            - Set[int]: doc_id 집합
+        """
+        if not query:
+            return set(self._texts)
+
+        if len(query) >= self.n:
+            query_grams: Iterable[str] = self._grams(query) - set(query)
+        else:
+            query_grams = set(query)
+
+        postings: List[Set[int]] = []
+        for gram in query_grams:
+            posting = self._postings.get(gram)
+            if not posting:
+                return set()
+            postings.append(posting)
+
+        # 작은 posting부터 교집합
+        postings.sort(key=len)
+        candidates: Set[int] = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                return set()
+
+        return {
+            doc_id for doc_id in candidates
+            if query in self._texts[doc_id]
+        }
+
+    def search(
+        self,
+        query: str,
+    ):
+        """
+        query를 부분 문자열로 포함하는 문서 id 조회
+
+        Returns:
+            - List[int]: doc_id 오름차순 리스트
+        """
+        return sorted(self.match(query))
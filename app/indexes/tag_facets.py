@@ -0,0 +1,215 @@
+import heapq
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class TagFacets:
+    """
+    언어별 태그 -> 회사 수 집계 (인메모리 카운터)
+        - tbl_tags는 (tag_name, company_id, language_id) 유일 -> 태그 행 수 = 회사 수
+        - 애플리케이션 시작 시(lifespan) GROUP BY 한 번으로 구축, 이후 조회는 DB를 거치지 않음
+        - CompanyRepository.add_new_tag / delete_tag_info 에서 commit 이후 증감
+            - 증감분은 태그 행 id(tbl_tags.id)와 함께 받음 -> 재구축 시 집계에 이미 반영된 증감분은 건너뜀
+        - 상위 태그 목록은 언어별로 정렬해 두고, 증감 시 bisect로 해당 태그 위치만 갱신
+            -> 조회 시간은 태그 행 수와 무관, 증감 시 다시 정렬하지 않음
+        - 태그명 자동완성용으로 언어별 태그명을 정렬된 배열로 유지 (bisect로 접두 범위 조회)
+        - POST /tags/facets/rebuild (관리자 토큰 필요) 로 DB 기준 재구축 (카운터가 어긋난 경우)
+        - 프로세스 단위 집계이므로 다른 프로세스의 쓰기는 재구축 시 반영됨
+    """
+
+    def __init__(self):
+        # language_type -> tag_name -> 회사 수
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._is_loaded: bool = False
+
+        # language_type -> [(대소문자 무시 태그명, tag_name), ...] (정렬됨, 자동완성용)
+        self._prefixes: Dict[str, List[Tuple[str, str]]] = {}
+
+        # language_type -> [(-회사 수, tag_name), ...] (정렬됨, 증감 시 갱신)
+        self._ranked: Dict[str, List[Tuple[int, str]]] = {}
+
+        # 재구축 중에 들어온 증감분 (tag_row_id, language_type, tag_name, delta)
+        self._pending: Optional[List[Tuple[int, str, str, int]]] = None
+
+    @property
+    def is_loaded(self):
+        return self._is_loaded
+
+    def begin_rebuild(self):
+        """
+        재구축 시작 표시
+            - DB 조회 ~ rebuild 사이의 추가/삭제를 잃지 않기 위함
+        """
+        self._pending = []
+
+    def pending_row_ids(self):
+        """
+        재구축 중에 들어온 증감분의 태그 행 id (집계에 반영되었는지 확인용)
+        """
+        return [row_id for row_id, _, _, _ in self._pending or []]
+
+    def rebuild(
+        self,
+        rows: Iterable[Tuple[str, str, int]],
+        present_row_ids: Iterable[int] = (),
+    ):
+        """
+        전체 재구축
+            - 재구축 중에 들어온 증감분은 태그 행 id 기준으로 집계에 없는 것만 다시 반영
+                - 추가: 집계 시점에 이미 있던 행은 건너뜀
+                - 삭제: 집계 시점에 있던 행(또는 앞서 다시 반영한 추가분)만 반영
+
+        Args:
+            - rows: (language_type, tag_name, 회사 수) 목록
+            - present_row_ids: pending_row_ids() 중 집계와 같은 스냅샷에 있던 태그 행 id
+        """
+        counts: Dict[str, Dict[str, int]] = {}
+        for language_type, tag_name, company_count in rows:
+            counts.setdefault(language_type, {})[tag_name] = company_count
+
+        pending = self._pending or []
+        self._counts = counts
+        self._prefixes = {
+            language_type: sorted((tag_name.casefold(), tag_name) for tag_name in tag_counts)
+            for language_type, tag_counts in counts.items()
+        }
+        self._ranked = {
+            language_type: sorted((-company_count, tag_name) for tag_name, company_count in tag_counts.items())
+            for language_type, tag_counts in counts.items()
+        }
+        self._pending = None
+
+        present = set(present_row_ids)
+        for row_id, language_type, tag_name, delta in pending:
+            if delta > 0 and row_id not in present:
+                self._apply(language_type, tag_name, delta)
+                present.add(row_id)
+            elif delta < 0 and row_id in present:
+                self._apply(language_type, tag_name, delta)
+                present.discard(row_id)
+        self._is_loaded = True
+
+    def _apply(
+        self,
+        language_type: str,
+        tag_name: str,
+        delta: int,
+    ):
+        counts = self._counts.setdefault(language_type, {})
+        prefixes = self._prefixes.setdefault(language_type, [])
+        ranked = self._ranked.setdefault(language_type, [])
+        entry = (tag_name.casefold(), tag_name)
+        previous_count = counts.get(tag_name, 0)
+        company_count = previous_count + delta
+
+        # 상위 태그 목록에서 이전 회사 수 위치를 빼고 새 회사 수 위치에 넣음
+        if previous_count > 0:
+            i = bisect_left(ranked, (-previous_count, tag_name))
+            if i < len(ranked) and ranked[i] == (-previous_count, tag_name):
+                del ranked[i]
+
+        if company_count > 0:
+            if tag_name not in counts:
+                insort(prefixes, entry)
+            counts[tag_name] = company_count
+            insort(ranked, (-company_count, tag_name))
+        elif counts.pop(tag_name, None) is not None:
+            i = bisect_left(prefixes, entry)
+            if i < len(prefixes) and prefixes[i] == entry:
+                del prefixes[i]
+
+    def add(
+        self,
+        tag_row_id: int,
+        language_type: str,
+        tag_name: str,
+    ):
+        """
+        태그 행 추가 (회사 수 + 1)
+        """
+        if self._pending is not None:
+            self._pending.append((tag_row_id, language_type, tag_name, 1))
+        self._apply(language_type, tag_name, 1)
+
+    def remove(
+        self,
+        tag_row_id: int,
+        language_type: str,
+        tag_name: str,
+    ):
+        """
+        태그 행 삭제 (회사 수 - 1)
+        """
+        if self._pending is not None:
+            self._pending.append((tag_row_id, language_type, tag_name, -1))
+        self._apply(language_type, tag_name, -1)
+
+    def count(
+        self,
+        language_type: str,
+        tag_name: str,
+    ):
+        """
+        태그가 등록된 회사 수
+        """
+        return self._counts.get(language_type, {}).get(tag_name, 0)
+
+    def top(
+        self,
+        language_type: str,
+        limit: int,
+    ):
+        """
+        회사 수가 많은 태그 limit개
+
+        Returns:
+            - List[Tuple[str, int]]: (tag_name, 회사 수) 리스트 (회사 수 내림차순, 태그명 오름차순)
+        """
+        ranked = self._ranked.get(language_type, [])
+        return [(tag_name, -negative_count) for negative_count, tag_name in ranked[:limit]]
+
+    def autocomplete(
+        self,
+        language_type: str,
+        prefix: str,
+        limit: int,
+    ):
+        """
+        접두어로 시작하는 태그 중 회사 수가 많은 태그 limit개 (대소문자 무시)
+            - 정렬된 태그명 배열에서 bisect로 접두 범위만 조회
+
+        Returns:
+            - List[Tuple[str, int]]: (tag_name, 회사 수) 리스트 (회사 수 내림차순, 태그명 오름차순)
+        """
+        prefixes = self._prefixes.get(language_type, [])
+        counts = self._counts.get(language_type, {})
+        key = prefix.casefold()
+
+        candidates: List[Tuple[int, str]] = []
+        for i in range(bisect_left(prefixes, (key,)), len(prefixes)):
+            folded, tag_name = prefixes[i]
+            if not folded.startswith(key):
+                break
+            candidates.append((-counts[tag_name], tag_name))
+
+        return [
+            (tag_name, -negative_count)
+            for negative_count, tag_name in heapq.nsmallest(limit, candidates)
+        ]
+
+    def stats(self):
+        """
+        집계 통계
+
+        Returns:
+            - Dict[str, Any]: 언어 수, (언어, 태그) 카운터 수
+        """
+        return {
+            "is_loaded": self._is_loaded,
+            "languages": len(self._counts),
+            "counters": sum(len(counts) for counts in self._counts.values()),
+        }
+
+
+# 프로세스 공용 집계
+tag_facets = TagFacets()
@@ -0,0 +1,422 @@
+import sys
+import unicodedata
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def normalize_tag(tag_name: str):
+    """
+    태그명 정규화 (NFKC, 앞뒤 공백 제거, 대소문자 무시)
+        - "  Tag_1 " -> "tag_1", "ｔａｇ＿１" -> "tag_1"
+    """
+    return unicodedata.normalize("NFKC", tag_name).strip().casefold()
+
+
+def _merge_postings(
+    left: array,
+    left_counts: array,
+    right: array,
+    right_counts: array,
+):
+    """
+    정렬된 회사 id 배열 병합 (회사 id별 태그 행 수 배열도 같은 순서로 병합, 양쪽에 있으면 합산)
+
+    Returns:
+        - (병합된 회사 id 배열, 병합된 태그 행 수 배열)
+    """
+    merged = array("I")
+    merged_counts = array("H")
+    i = j = 0
+    while i < len(left) and j < len(right):
+        if left[i] < right[j]:
+            merged.append(left[i])
+            merged_counts.append(left_counts[i])
+            i += 1
+        elif left[i] > right[j]:
+            merged.append(right[j])
+            merged_counts.append(right_counts[j])
+            j += 1
+        else:
+            merged.append(left[i])
+            merged_counts.append(left_counts[i] + right_counts[j])
+            i += 1
+            j += 1
+    merged.extend(left[i:])
+    merged_counts.extend(left_counts[i:])
+    merged.extend(right[j:])
+    merged_counts.extend(right_counts[j:])
+
+    return merged, merged_counts
+
+
+class _TagIndexData:
+    """
+    TagIndex 내부 자료 (재구축 시 통째로 교체)
+    """
+
+    def __init__(self):
+        # 정규화된 태그명 -> 태그 id (등록 순서대로 0, 1, 2, ...)
+        self.tag_ids: Dict[str, int] = {}
+
+        # 태그 id -> 부모 태그 id (union-find, 루트가 대표 태그 id)
+        self.parents: array = array("I")
+
+        # 대표 태그 id -> 같은 의미의 정규화된 태그명 목록
+        self.members: Dict[int, List[str]] = {}
+
+        # 대표 태그 id -> 정렬된 company_id 배열 (중복 없음)
+        self.postings: Dict[int, array] = {}
+
+        # 대표 태그 id -> postings와 같은 위치의 태그 행 수 (unsigned short)
+        #   - 한 회사에 같은 의미의 태그가 여러 언어로 등록된 경우 2 이상 (ex: ko "태그_1", en "tag_1")
+        #   - 마지막 행이 삭제될 때만 회사 id를 뺌
+        self.counts: Dict[int, array] = {}
+
+        self.rows: int = 0
+
+    def tag_id(
+        self,
+        key: str,
+    ):
+        tag_id = self.tag_ids.get(key)
+        if tag_id is None:
+            tag_id = len(self.parents)
+            self.tag_ids[key] = tag_id
+            self.parents.append(tag_id)
+            self.members[tag_id] = [key]
+        return tag_id
+
+    def find(
+        self,
+        tag_id: int,
+    ):
+        root = tag_id
+        while self.parents[root] != root:
+            root = self.parents[root]
+        while self.parents[tag_id] != root:
+            self.parents[tag_id], tag_id = root, self.parents[tag_id]
+        return root
+
+    def union(
+        self,
+        left_id: int,
+        right_id: int,
+    ):
+        left_root, right_root = self.find(left_id), self.find(right_id)
+        if left_root == right_root:
+            return
+
+        # 태그명이 많은 쪽으로 병합
+        if len(self.members[left_root]) < len(self.members[right_root]):
+            left_root, right_root = right_root, left_root
+        self.parents[right_root] = left_root
+        self.members[left_root].extend(self.members.pop(right_root))
+
+        # 회사 id 배열, 태그 행 수 배열 병합 (두 묶음의 크기에 비례)
+        right_posting = self.postings.pop(right_root, None)
+        right_counts = self.counts.pop(right_root, None)
+        if right_posting is None:
+            return
+        left_posting = self.postings.get(left_root)
+        if left_posting is None:
+            self.postings[left_root], self.counts[left_root] = right_posting, right_counts
+            return
+        self.postings[left_root], self.counts[left_root] = _merge_postings(
+            left_posting,
+            self.counts[left_root],
+            right_posting,
+            right_counts,
+        )
+
+    def add(
+        self,
+        key: str,
+        company_id: int,
+    ):
+        root = self.find(self.tag_id(key))
+        self.rows += 1
+        posting = self.postings.get(root)
+        if posting is None:
+            self.postings[root] = array("I", [company_id])
+            self.counts[root] = array("H", [1])
+            return
+
+        counts = self.counts[root]
+        i = bisect_left(posting, company_id)
+        if i < len(posting) and posting[i] == company_id:
+            counts[i] += 1
+        else:
+            posting.insert(i, company_id)
+            counts.insert(i, 1)
+
+    def relate(
+        self,
+        keys: List[str],
+    ):
+        for key in keys[1:]:
+            self.union(self.tag_id(keys[0]), self.tag_id(key))
+
+    def remove(
+        self,
+        key: str,
+        company_id: int,
+    ):
+        root = self.canonical_id(key)
+        posting = self.postings.get(root) if root is not None else None
+        if posting is None:
+            return
+
+        i = bisect_left(posting, company_id)
+        if i == len(posting) or posting[i] != company_id:
+            return
+
+        self.rows -= 1
+        counts = self.counts[root]
+        if counts[i] > 1:
+            counts[i] -= 1
+            return
+
+        del posting[i]
+        del counts[i]
+        if not posting:
+            del self.postings[root]
+            del self.counts[root]
+
+    def canonical_id(
+        self,
+        key: str,
+    ):
+        tag_id = self.tag_ids.get(key)
+        return self.find(tag_id) if tag_id is not None else None
+
+
+class TagIndex:
+    """
+    태그명 -> 회사 id 역색인 (인메모리)
+        - 같은 태그 관계(rel_id)로 묶인 태그명(ex: "태그_22", "tag_22", "タグ_22")은
+          하나의 대표 태그 id로 묶어서 색인 (union-find) -> 어떤 언어로 검색해도 같은 회사 목록
+        - 태그명은 정규화 후 색인
+        - 회사 id 목록은 정렬된 unsigned int 배열(array('I')) + 같은 위치의 태그 행 수 배열(array('H'))로 보관 -> 회사당 6 bytes
+        - 애플리케이션 시작 시(lifespan) 전체 태그로 구축
+        - CompanyRepository.add_new_tag / delete_tag_info 에서 commit 이후 갱신
+            - 태그 삭제로 같은 의미 묶음이 나뉘지는 않음 (재구축 시 반영)
+            - 변경분은 태그 행 id(tbl_tags.id)와 함께 받음 -> 재구축 시 조회 결과에 이미 반영된 변경분은 건너뜀
+        - 프로세스 단위 색인이므로 다른 프로세스의 쓰기는 재구축 시 반영됨
+    """
+
+    def __init__(self):
+        self._data: _TagIndexData = _TagIndexData()
+        self._is_loaded: bool = False
+
+        # 재구축 중에 들어온 변경분 (is_add, [(tag_row_id, tag_name), ...], company_id, 같은 관계의 기존 태그명)
+        self._pending: Optional[List[Tuple[bool, List[Tuple[int, str]], int, List[str]]]] = None
+
+    @property
+    def is_loaded(self):
+        return self._is_loaded
+
+    def begin_rebuild(self):
+        """
+        재구축 시작 표시
+            - DB 조회 ~ rebuild 사이의 추가/삭제를 잃지 않기 위함
+        """
+        self._pending = []
+
+    def rebuild(
+        self,
+        rows: Iterable[Tuple[int, str, int, int]],
+    ):
+        """
+        전체 색인 재구축
+            - 재구축 중에 들어온 변경분은 태그 행 id 기준으로 조회 결과에 없는 것만 다시 반영
+                - 추가: 조회 결과에 이미 있는 행은 건너뜀
+                - 삭제: 조회 결과(또는 앞서 다시 반영한 추가분)에 있는 행만 삭제
+
+        Args:
+            - rows: (tag_row_id, tag_name, company_id, rel_id) 목록
+        """
+        data = _TagIndexData()
+        pending = self._pending or []
+
+        # 변경분의 태그 행 중 조회 결과에 있는 행 (전체 행 id는 보관하지 않음)
+        pending_row_ids = {row_id for _, tags, _, _ in pending for row_id, _ in tags}
+        present_row_ids = set()
+
+        # 1. 같은 태그 관계의 태그명을 묶어서 대표 태그 id 결정
+        tags: List[Tuple[int, int]] = []
+        relation_tag_ids: Dict[int, int] = {}
+        for row_id, tag_name, company_id, rel_id in rows:
+            if row_id in pending_row_ids:
+                present_row_ids.add(row_id)
+            tag_id = data.tag_id(normalize_tag(tag_name))
+            tags.append((tag_id, company_id))
+            if rel_id in relation_tag_ids:
+                data.union(relation_tag_ids[rel_id], tag_id)
+            else:
+                relation_tag_ids[rel_id] = tag_id
+
+        # 2. 대표 태그 id별로 회사 id를 모아서 한 번에 정렬 (행마다 insort하지 않음)
+        grouped: Dict[int, List[int]] = {}
+        for tag_id, company_id in tags:
+            grouped.setdefault(data.find(tag_id), []).append(company_id)
+
+        for root, company_ids in grouped.items():
+            company_ids.sort()
+            unique_ids = array("I")
+            counts = array("H")
+            for company_id in company_ids:
+                if unique_ids and unique_ids[-1] == company_id:
+                    counts[-1] += 1
+                else:
+                    unique_ids.append(company_id)
+                    counts.append(1)
+            data.postings[root] = unique_ids
+            data.counts[root] = counts
+            data.rows += len(company_ids)
+
+        # 3. 조회 결과에 반영되지 않은 변경분만 다시 반영
+        for is_add, tags, company_id, related_tag_names in pending:
+            if is_add:
+                keys = [normalize_tag(tag_name) for _, tag_name in tags]
+                data.relate(keys + [normalize_tag(tag_name) for tag_name in related_tag_names])
+            for row_id, tag_name in tags:
+                if is_add and row_id not in present_row_ids:
+                    data.add(normalize_tag(tag_name), company_id)
+                    present_row_ids.add(row_id)
+                elif not is_add and row_id in present_row_ids:
+                    data.remove(normalize_tag(tag_name), company_id)
+                    present_row_ids.discard(row_id)
+
+        self._data = data
+        self._pending = None
+        self._is_loaded = True
+
+    def add(
+        self,
+        tags: List[Tuple[int, str]],
+        company_id: int,
+        related_tag_names: Iterable[str] = (),
+    ):
+        """
+        태그 관계 하나의 태그 행 추가 (같은 의미의 다른 언어 태그명 묶음)
+
+        Args:
+            - tags: (tag_row_id, tag_name) 목록
+            - company_id (int): 회사 id
+            - related_tag_names: 같은 태그 관계에 이미 있던 태그명 (기존 관계에 추가한 경우, 같은 의미로 묶음)
+        """
+        if not tags:
+            return
+        related_tag_names = list(related_tag_names)
+        if self._pending is not None:
+            self._pending.append((True, list(tags), company_id, related_tag_names))
+
+        keys = [normalize_tag(tag_name) for _, tag_name in tags]
+        self._data.relate(keys + [normalize_tag(tag_name) for tag_name in related_tag_names])
+        for key in keys:
+            self._data.add(key, company_id)
+
+    def remove(
+        self,
+        tag_row_id: int,
+        tag_name: str,
+        company_id: int,
+    ):
+        """
+        태그 행 삭제 (같은 회사에 같은 의미의 태그가 남아 있으면 회사 id 유지)
+        """
+        if self._pending is not None:
+            self._pending.append((False, [(tag_row_id, tag_name)], company_id, []))
+        self._data.remove(normalize_tag(tag_name), company_id)
+
+    def canonical_id(
+        self,
+        tag_name: str,
+    ):
+        """
+        태그명의 대표 태그 id (색인에 없으면 None)
+        """
+        return self._data.canonical_id(normalize_tag(tag_name))
+
+    def equivalent_tags(
+        self,
+        tag_name: str,
+    ):
+        """
+        같은 의미의 정규화된 태그명 목록 (색인에 없으면 정규화된 태그명만)
+        """
+        root = self.canonical_id(tag_name)
+        if root is None:
+            return [normalize_tag(tag_name)]
+        return list(self._data.members[root])
+
+    def posting(
+        self,
+        tag_name: str,
+    ):
+        """
+        태그(같은 의미의 다른 언어 태그 포함)의 회사 id 배열 (복사하지 않음, 수정 금지)
+
+        Returns:
+            - Sequence[int]: 회사 id 배열 (오름차순, 중복 없음)
+        """
+        root = self.canonical_id(tag_name)
+        posting = self._data.postings.get(root) if root is not None else None
+        return posting if posting is not None else array("I")
+
+    def company_ids(
+        self,
+        tag_name: str,
+    ):
+        """
+        태그(같은 의미의 다른 언어 태그 포함)가 등록된 회사 id 조회
+
+        Returns:
+            - List[int]: 회사 id 리스트 (오름차순, 중복 없음)
+        """
+        root = self.canonical_id(tag_name)
+        posting = self._data.postings.get(root) if root is not None else None
+        return posting.tolist() if posting is not None else []
+
+    def stats(self):
+        """
+        색인 통계
+            - memory_bytes: 태그명 dict / union-find 배열 / 회사 id 배열(4 bytes) / 태그 행 수 배열(2 bytes)의 sys.getsizeof 합
+              (태그 행 100만 개, 태그 5천 개 x ko / en / ja 3개 언어, 회사 20만 개인 경우 약 6.2 MB, 그중 회사 id / 행 수 배열 약 3 MB)
+
+        Returns:
+            - Dict[str, Any]: 태그 수, 대표 태그 수, 태그 행 수, 회사 id 수, 메모리 사용량, 태그 행 100만 개당 메모리 사용량
+        """
+        data = self._data
+        memory_bytes: int = (
+            sys.getsizeof(data.tag_ids)
+            + sys.getsizeof(data.parents)
+            + sys.getsizeof(data.members)
+            + sys.getsizeof(data.postings)
+            + sys.getsizeof(data.counts)
+        )
+        for key, tag_id in data.tag_ids.items():
+            memory_bytes += sys.getsizeof(key) + sys.getsizeof(tag_id)
+        for members in data.members.values():
+            memory_bytes += sys.getsizeof(members)
+        postings: int = 0
+        for posting in data.postings.values():
+            memory_bytes += sys.getsizeof(posting)
+            postings += len(posting)
+        for counts in data.counts.values():
+            memory_bytes += sys.getsizeof(counts)
+
+        return {
+            "is_loaded": self._is_loaded,
+            "tags": len(data.tag_ids),
+            "canonical_tags": len(data.members),
+            "rows": data.rows,
+            "postings": postings,
+            "memory_bytes": memory_bytes,
+            "bytes_per_million_rows": (memory_bytes * 1_000_000 // data.rows) if data.rows else 0,
+        }
+
+
+# 프로세스 공용 색인
+tag_index = TagIndex()
@@ -4,11 +4,14 @@ from fastapi.testclient import TestClient
 from fastapi.openapi.utils import get_openapi
 from contextlib import asynccontextmanager
 
-from app.utils import setup_logger
+from app.utils import setup_logger, settings
+from app.utils.schema_manager import SchemaManager
+from app.repositories import SearchRepository, TagRepository, CompanyRepository
 from app.routers import (
     search_router,
     company_router,
     tags_router,
+    stats_router,
 )
 
 # Set Logger
@@ -18,6 +21,39 @@ logger = setup_logger(__name__)
 async def lifespan(app: FastAPI):
     logger.info("[MAIN] Application startup")
 
+    # 검색용 DB 인덱스 확인 및 생성
+    if settings.DB_ENSURE_INDEXES:
+        try:
+            await SchemaManager().ensure_indexes()
+        except Exception as e:
+            logger.error(f"[MAIN] ensure indexes failed: {e}")
+
+    # 언어 레지스트리 구축 (실패 시 첫 언어 추가에서 다시 시도)
+    try:
+        await CompanyRepository().load_language_registry()
+    except Exception as e:
+        logger.error(f"[MAIN] language registry load failed: {e}")
+
+    # 회사명 자동완성 색인 구축 (실패 시 첫 검색에서 다시 시도)
+    if settings.COMPANY_SEARCH_MODE == "memory":
+        try:
+            await SearchRepository().load_company_name_index()
+        except Exception as e:
+            logger.error(f"[MAIN] company name index load failed: {e}")
+
+    # 태그 역색인 구축 (실패 시 첫 태그 검색에서 다시 시도)
+    if settings.TAG_SEARCH_MODE == "memory":
+        try:
+            await TagRepository().load_tag_index()
+        except Exception as e:
+            logger.error(f"[MAIN] tag index load failed: {e}")
+
+    # 태그별 회사 수 집계 구축 (실패 시 첫 조회에서 다시 시도)
+    try:
+        await TagRepository().load_tag_facets()
+    except Exception as e:
+        logger.error(f"[MAIN] tag facets load failed: {e}")
+
     yield
 
     logger.info("[MAIN] Application shutdown")
@@ -60,6 +96,7 @@ async def check_x_wanted_language_header(request: Request, call_next):
 app.include_router(search_router, prefix="/search", tags=["search"])
 app.include_router(company_router, prefix="/companies", tags=["companies"])
 app.include_router(tags_router, prefix="/tags", tags=["tags"])
+app.include_router(stats_router, prefix="/stats", tags=["stats"])
 
 # docs에서 x-wanted-language 추가
 def custom_openapi():
@@ -7,6 +7,7 @@ from sqlalchemy import (
     ARRAY,
     DateTime,
     UniqueConstraint,
+    Index,
     func,
 )
 
@@ -25,6 +26,9 @@ class CompanyID(Base):
 class Language(Base):
     """사용하는 언어 정보"""
     __tablename__ = "tbl_languages"
+    __table_args__ = (
+        Index('tbl_languages_language_type_key', 'language_type', unique=True),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     language_type = Column(Text, nullable=False)
@@ -1,9 +1,13 @@
 from app.repositories.search_repository import SearchRepository
 from app.repositories.company_repository import CompanyRepository
 from app.repositories.tag_repository import TagRepository
+from app.repositories.unit_of_work import UnitOfWork
+from app.repositories.import_repository import ImportRepository
 
 __all__ = [
     "SearchRepository",
     "CompanyRepository",
     "TagRepository",
+    "UnitOfWork",
+    "ImportRepository",
 ]
\ No newline at end of file
@@ -1,8 +1,13 @@
-from typing import List, Dict, Any
-from sqlalchemy import select, delete
-from sqlalchemy.exc import IntegrityError
-
-from app.utils import get_db, setup_logger
+from typing import List, Dict, Any, Tuple, Optional, Set
+from sqlalchemy import select, insert, update, delete, func, tuple_
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert as pg_insert
+from sqlalchemy.orm import aliased
+
+from app.utils import get_db, setup_logger, settings
+from app.utils.cache import VersionedCache
+from app.indexes import company_name_index, tag_index, tag_facets, language_registry
+from app.repositories.search_repository import SearchRepository
+from app.repositories.unit_of_work import UnitOfWork
 from app.models import (
     CompanyName,
     CompanyID,
@@ -15,6 +20,13 @@ from app.models import (
 # Logger
 logger = setup_logger("Company_Repository")
 
+# 회사 프로필 캐시 (company_id -> 국가별 회사명, 태그)
+#   - CompanyRepository의 쓰기 메소드가 commit 이후 버전을 올림
+company_profile_cache: VersionedCache = VersionedCache(
+    max_bytes=settings.PROFILE_CACHE_MAX_BYTES,
+    ttl_seconds=settings.PROFILE_CACHE_TTL,
+)
+
 class CompanyRepository:
     async def get_company_id_by_company_name(
         self,
@@ -22,6 +34,7 @@ class CompanyRepository:
     ):
         """
         회사 이름을 통해 회사 id 조회
+            - 같은 이름의 회사가 여러 개면 마지막에 등록된 회사
 
         Returns:
             - company_id (int): 회사 id
@@ -35,17 +48,182 @@ class CompanyRepository:
                     CompanyName.company_id,
                 ).where(
                     CompanyName.name == company_name,
-                )
+                ).order_by(
+                    CompanyName.id.desc(),
+                ).limit(1)
                 db_results = await session.execute(stmt)
-                rows = db_results.all()
-                for row in rows:
-                    company_id = row[0]
+                company_id = db_results.scalar() or 0
 
         except Exception as e:
             logger.error(f"[ERROR] get_company_id_by_company_name: {e}")
             raise e
 
         return company_id
+
+    async def get_company_ids_by_company_names(
+        self,
+        company_names: List[str],
+    ):
+        """
+        회사 이름 목록을 통해 회사 id 일괄 조회 (단일 쿼리)
+            - 같은 이름의 회사가 여러 개면 마지막에 등록된 회사
+            - 메모리 색인 사용 시 색인에 있는 이름은 DB 조회 없이 처리
+
+        Returns:
+            - Dict[str, int]: 회사 이름 -> 회사 id (없는 이름은 제외)
+        """
+        company_ids: Dict[str, int] = {}
+
+        # 메모리 색인 우선
+        missing_names: List[str] = []
+        for company_name in dict.fromkeys(company_names):
+            company_id: int = await self.get_company_id_by_indexed_name(
+                company_name=company_name,
+            )
+            if company_id:
+                company_ids[company_name] = company_id
+            else:
+                missing_names.append(company_name)
+
+        if not missing_names:
+            return company_ids
+
+        try:
+            async for session in get_db():
+                stmt = select(
+                    CompanyName.name,
+                    CompanyName.company_id,
+                ).distinct(
+                    CompanyName.name,
+                ).where(
+                    CompanyName.name.in_(missing_names),
+                ).order_by(
+                    CompanyName.name,
+                    CompanyName.id.desc(),
+                )
+                db_results = await session.execute(stmt)
+                for row in db_results.all():
+                    company_ids[row.name] = row.company_id
+
+        except Exception as e:
+            logger.error(f"[ERROR] get_company_ids_by_company_names: {e}")
+            raise e
+
+        return company_ids
+
+    async def get_company_id_by_indexed_name(
+        self,
+        company_name: str,
+    ):
+        """
+        메모리 색인으로 회사 id 조회 (DB 조회 없음, 메모리 색인 사용 시)
+            - 같은 이름의 회사가 여러 개면 마지막에 등록된 회사
+
+        Returns:
+            - company_id (int): 회사 id (없으면 0)
+        """
+        if settings.COMPANY_SEARCH_MODE != "memory":
+            return 0
+
+        if not company_name_index.is_loaded:
+            await SearchRepository().load_company_name_index()
+
+        return company_name_index.exact_company_id(company_name)
+
+    async def get_company_id_by_similar_name(
+        self,
+        company_name: str,
+    ):
+        """
+        오타 허용 회사 id 조회
+            - 편집 거리 2 이내에서 가장 가까운 회사명 (메모리 색인 사용 시, 여러 회사가 동률이면 없음)
+
+        Returns:
+            - company_id (int): 회사 id (없으면 0)
+        """
+        if settings.COMPANY_SEARCH_MODE != "memory":
+            return 0
+
+        if not company_name_index.is_loaded:
+            await SearchRepository().load_company_name_index()
+
+        return company_name_index.fuzzy_company_id(company_name)
+
+    async def get_company_detail(
+        self,
+        company_name: str,
+        language: str,
+    ):
+        """
+        회사 이름으로 출력 언어의 회사명, 태그 조회
+            - 이름 -> 회사 id -> 회사명 / 태그를 하나의 SQL로 조회
+            - 출력 언어의 컬럼만 조회
+        
+        Args:
+            - company_name (str): 회사 이름 (같은 이름이면 마지막에 등록된 회사)
+            - language (str): 출력 언어
+
+        Returns:
+            {
+                "id": company_id,
+                "company_name": string,
+                "tags": [tag_name, ...],
+            }
+            (회사가 없으면 None)
+        """
+        target = select(
+            CompanyName.company_id.label("company_id"),
+        ).where(
+            CompanyName.name == company_name,
+        ).order_by(
+            CompanyName.id.desc(),
+        ).limit(1).subquery("target")
+
+        company_name_stmt = select(
+            CompanyName.name,
+        ).join(
+            Language,
+            Language.id == CompanyName.language_id,
+        ).where(
+            CompanyName.company_id == target.c.company_id,
+            Language.language_type == language,
+        ).order_by(
+            CompanyName.id,
+        ).limit(1).scalar_subquery()
+
+        tags_stmt = select(
+            func.array_agg(aggregate_order_by(Tag.tag_name, Tag.id)),
+        ).join(
+            Language,
+            Language.id == Tag.language_id,
+        ).where(
+            Tag.company_id == target.c.company_id,
+            Language.language_type == language,
+        ).scalar_subquery()
+
+        company_info: Optional[Dict[str, Any]] = None
+        try:
+            async for session in get_db():
+                stmt = select(
+                    target.c.company_id,
+                    company_name_stmt.label("company_name"),
+                    tags_stmt.label("tags"),
+                )
+                db_results = await session.execute(stmt)
+                row = db_results.first()
+
+                if row is not None:
+                    company_info = {
+                        "id": row.company_id,
+                        "company_name": row.company_name or "",
+                        "tags": list(row.tags or []),
+                    }
+
+        except Exception as e:
+            logger.error(f"[ERROR] get_company_detail: {e}")
+            raise e
+
+        return company_info
     
     async def get_company_info(
         self,
@@ -118,131 +296,340 @@ class CompanyRepository:
             ]
         }
         """
-        company_infos: Dict[Dict[str, Any]] = {
+        company_infos: Dict[int, Dict[str, Any]] = await self.get_company_infos_by_company_ids(
+            company_ids=[company_id],
+        )
+
+        return company_infos.get(company_id, {
             "id": company_id,
             "company_name": {},
             "tags": [],
+        })
+
+    async def get_company_infos_by_company_ids(
+        self,
+        company_ids: List[int],
+    ):
+        """
+        회사 id 목록을 통해 국가별 회사명, 태그 조회
+            - 회사당 한 행: 회사명 / 태그를 언어와 함께 배열로 집계 (CompanyName x Tag 조인 없음)
+            - 태그 중복 제거는 set으로 처리
+            - company_profile_cache read-through: 캐시에 없는 회사만 DB 조회
+            - 반환값은 캐시와 공유되므로 수정하지 않음
+        
+        Returns:
+        {
+            company_id: {
+                "id": company_id,
+                "company_name": {"lang_type": compnayname, ...},
+                "tags": [{"lang_type": tag_name}, ...],
+            },
+            ...
         }
+        """
+        company_infos: Dict[int, Dict[str, Any]] = {}
+
+        # 캐시 조회 (조회 전 버전 기록)
+        versions: Dict[int, int] = {}
+        for company_id in company_ids:
+            company_info = company_profile_cache.get(company_id)
+            if company_info is not None:
+                company_infos[company_id] = company_info
+            else:
+                versions[company_id] = company_profile_cache.version(company_id)
+
+        if not versions:
+            return company_infos
+
+        # 회사별 회사명 (언어, 이름) 배열
+        name_language = aliased(Language)
+        name_languages_stmt = select(
+            func.array_agg(aggregate_order_by(name_language.language_type, CompanyName.id)),
+        ).join(
+            name_language,
+            name_language.id == CompanyName.language_id,
+        ).where(
+            CompanyName.company_id == CompanyID.id,
+        ).scalar_subquery()
+        names_stmt = select(
+            func.array_agg(aggregate_order_by(CompanyName.name, CompanyName.id)),
+        ).join(
+            name_language,
+            name_language.id == CompanyName.language_id,
+        ).where(
+            CompanyName.company_id == CompanyID.id,
+        ).scalar_subquery()
+
+        # 회사별 태그 (언어, 태그명) 배열
+        tag_language = aliased(Language)
+        tag_languages_stmt = select(
+            func.array_agg(aggregate_order_by(tag_language.language_type, Tag.id)),
+        ).join(
+            tag_language,
+            tag_language.id == Tag.language_id,
+        ).where(
+            Tag.company_id == CompanyID.id,
+        ).scalar_subquery()
+        tag_names_stmt = select(
+            func.array_agg(aggregate_order_by(Tag.tag_name, Tag.id)),
+        ).join(
+            tag_language,
+            tag_language.id == Tag.language_id,
+        ).where(
+            Tag.company_id == CompanyID.id,
+        ).scalar_subquery()
 
         try:
             async for session in get_db():
                 stmt = select(
-                    CompanyName,
-                    Tag,
-                    Language,
-                ).join(
-                    Tag,
-                    Tag.company_id == CompanyName.company_id,
-                ).join(
-                    Language,
-                    Language.id == CompanyName.language_id,
+                    CompanyID.id,
+                    name_languages_stmt.label("name_languages"),
+                    names_stmt.label("names"),
+                    tag_languages_stmt.label("tag_languages"),
+                    tag_names_stmt.label("tag_names"),
                 ).where(
-                    CompanyName.company_id == company_id,
-                    Language.id == Tag.language_id
+                    CompanyID.id.in_(list(versions.keys())),
                 )
                 db_results = await session.execute(stmt)
                 rows = db_results.all()
-                
+
                 for row in rows:
-                    company_name_obj: CompanyName = row[0]
-                    tag_obj: Tag = row[1]
-                    language_obj: Language = row[2]
-                    
-                    # company_name 추가
-                    if language_obj.language_type not in company_infos["company_name"].keys():
-                        company_infos["company_name"][language_obj.language_type] = company_name_obj.name
-
-                    # tag 추가
-                    tag_info = {
-                        language_obj.language_type: tag_obj.tag_name,
+                    company_info: Dict[str, Any] = {
+                        "id": row.id,
+                        "company_name": {},
+                        "tags": [],
                     }
-                    if tag_info not in company_infos["tags"]:
-                        company_infos["tags"].append(tag_info)
+
+                    # company_name 추가 (언어별 첫 번째 회사명)
+                    for lang_type, name in zip(row.name_languages or [], row.names or []):
+                        company_info["company_name"].setdefault(lang_type, name)
+
+                    # tag 추가 (중복 제거)
+                    seen_tags: Set[Tuple[str, str]] = set()
+                    for lang_type, tag_name in zip(row.tag_languages or [], row.tag_names or []):
+                        if (lang_type, tag_name) in seen_tags:
+                            continue
+                        seen_tags.add((lang_type, tag_name))
+                        company_info["tags"].append({lang_type: tag_name})
+
+                    company_infos[row.id] = company_info
+                    company_profile_cache.set(row.id, company_info, versions[row.id])
 
         except Exception as e:
-            logger.error(f"[ERROR] get_company_info_by_company_name: {e}")
+            logger.error(f"[ERROR] get_company_infos_by_company_ids: {e}")
+            raise e
 
         return company_infos
     
 
+    async def load_language_registry(self):
+        """
+        언어 레지스트리 구축
+            - 전체 언어를 (language_type, id) 컬럼만 조회
+        """
+        try:
+            async for session in get_db():
+                stmt = select(
+                    Language.language_type,
+                    Language.id,
+                )
+
+                db_results = await session.execute(stmt)
+                language_registry.rebuild(db_results.all())
+
+        except Exception as e:
+            logger.error(f"[ERROR] load_language_registry: {e}")
+            raise e
+
+        logger.info("[INDEX] language registry loaded")
+
     async def add_new_language(
         self,
         input_languages: List[str],
     ):
         """
         기존 언어 확인 후 새로운 언어 추가
+            - 기존 언어는 레지스트리에서 확인 (DB 조회 없음)
+            - 새로운 언어만 INSERT ... ON CONFLICT DO NOTHING 으로 추가 후 id 조회
+                -> 같은 언어를 동시에 추가해도 한 행만 남음 (tbl_languages_language_type_key)
+            - 언어는 여러 요청이 공유하는 기준 데이터이므로 호출한 쪽 트랜잭션과 별도로 먼저 commit
+                -> 레지스트리에는 commit된 id만 등록
+
+        Args:
+            - input_languages (List[str]): 언어 리스트
         """
+        if not language_registry.is_loaded:
+            await self.load_language_registry()
+
+        new_languages: List[str] = [
+            lang for lang in dict.fromkeys(input_languages)
+            if language_registry.get_id(lang) is None
+        ]
+        if not new_languages:
+            return
 
         try:
             async for session in get_db():
-                # 기존 언어 조회
-                result = await session.execute(select(Language))
-                enrolled_languages = result.all()
-                enrolled_languages = [x[0].language_type for x in enrolled_languages]
-                
-                # 새로운 언어 추가
-                new_languages: List[str] = list(set(input_languages) - set(enrolled_languages))
-                for lang in new_languages:
-                    new_language = Language(language_type=lang)
-                    session.add(new_language)
-                    await session.flush()
+                # 새로운 언어 추가 (이미 있으면 건너뛰기)
+                await session.execute(
+                    pg_insert(Language).values([
+                        {"language_type": lang} for lang in new_languages
+                    ]).on_conflict_do_nothing()
+                )
+
+                # 추가된 (또는 다른 요청이 먼저 추가한) 언어 id 조회
+                db_results = await session.execute(
+                    select(
+                        Language.language_type,
+                        Language.id,
+                    ).where(
+                        Language.language_type.in_(new_languages),
+                    )
+                )
+                rows = db_results.all()
 
                 await session.commit()
-            
+
+            # 언어 레지스트리 반영 (commit 이후)
+            for lang_type, lang_id in rows:
+                language_registry.register(lang_type, lang_id)
+
         except Exception as e:
             logger.error(f"[ERROR] add_new_language: {e}")
             raise e
 
+    async def _get_language_ids(
+        self,
+        session,
+        language_types: List[str],
+    ):
+        """
+        언어 id 조회
+            - 레지스트리에서 조회, 없는 언어만 DB 조회 (다른 프로세스가 추가한 언어) 후 등록
+
+        Returns:
+            - Dict[str, int]: language_type -> id
+
+        Raises:
+            - ValueError: 등록되지 않은 언어
+        """
+        language_ids: Dict[str, int] = language_registry.get_ids(language_types)
+        missing_languages: List[str] = [lang for lang in language_types if lang not in language_ids]
+        if not missing_languages:
+            return language_ids
+
+        db_results = await session.execute(
+            select(
+                Language.language_type,
+                Language.id,
+            ).where(
+                Language.language_type.in_(missing_languages),
+            )
+        )
+        for lang_type, lang_id in db_results.all():
+            language_registry.register(lang_type, lang_id)
+        language_ids.update(language_registry.get_ids(missing_languages))
+
+        unknown_languages = set(language_types) - set(language_ids.keys())
+        if unknown_languages:
+            raise ValueError(f"unknown languages: {sorted(unknown_languages)}")
+
+        return language_ids
+
     async def add_new_company(
         self,
         new_companies: Dict[str, str],
+        uow: Optional[UnitOfWork] = None,
     ):
         """
         새로운 회사 추가
+            - 언어 수와 관계없이 고정된 횟수의 SQL로 처리
+                1. tbl_company_ids INSERT ... RETURNING id
+                2. tbl_company_name_relations INSERT ... RETURNING id
+                3. tbl_company_names 다중 행 INSERT ... RETURNING id, language_id
+                4. tbl_company_name_relations.name_ids UPDATE
+            - 언어 id는 레지스트리에서 조회
+
+        Args:
+            - new_companies (Dict[str, str]): 언어별 회사명
+            - uow (UnitOfWork): 지정 시 해당 트랜잭션에서 실행 (commit은 호출한 쪽에서)
         
         Returns:
             - company_id (int): 새로운 회사 ID
+
+        Raises:
+            - ValueError: 등록되지 않은 언어
         """
+        if uow is None:
+            async with UnitOfWork() as uow:
+                company_id = await self.add_new_company(new_companies, uow=uow)
+                await uow.commit()
+            return company_id
 
         company_id: int = 0
+        new_names: List[Tuple[int, str, str]] = []
         try:
-            async for session in get_db():
-                # tbl_company_ids 테이블에 새로운 회사 ID 추가
-                company_id_obj = CompanyID()
-                session.add(company_id_obj)
-                await session.flush() # id 먼저 받기
-
-                # tbl_company_name_relations 테이블에 새로운 회사 이름 관계 추가
-                tbl_company_name_relations = CompanyNameRelation(
+            session = uow.session
+            # tbl_company_ids 테이블에 새로운 회사 ID 추가
+            db_results = await session.execute(
+                insert(CompanyID).returning(CompanyID.id)
+            )
+            company_id = db_results.scalar_one()
+
+            # tbl_company_name_relations 테이블에 새로운 회사 이름 관계 추가
+            db_results = await session.execute(
+                insert(CompanyNameRelation).values(
+                    company_id=company_id,
                     name_ids=[],
-                    company_id=company_id_obj.id,
+                ).returning(CompanyNameRelation.id)
+            )
+            rel_id: int = db_results.scalar_one()
+
+            if new_companies:
+                # Language ID 조회 (레지스트리)
+                language_ids: Dict[str, int] = await self._get_language_ids(
+                    session,
+                    list(new_companies.keys()),
                 )
-                session.add(tbl_company_name_relations)
-                await session.flush() # id 먼저 받기
 
-                # tbl_company_names 테이블에 새로운 회사 이름 추가
-                for lang_type, name in new_companies.items():
-                    # Language ID 조회
-                    lang_id = await session.execute(
-                        select(Language).where(Language.language_type == lang_type)
+                # tbl_company_names 테이블에 새로운 회사 이름 추가 (다중 행 INSERT)
+                db_results = await session.execute(
+                    insert(CompanyName).values([
+                        {
+                            "name": name,
+                            "company_id": company_id,
+                            "language_id": language_ids[lang_type],
+                            "rel_id": rel_id,
+                        }
+                        for lang_type, name in new_companies.items()
+                    ]).returning(
+                        CompanyName.id,
+                        CompanyName.language_id,
                     )
-                    lang_id = lang_id.scalar_one().id
-
-                    # 새롭게 추가
-                    new_company_name = CompanyName(
-                        name=name,
-                        company_id=company_id_obj.id,
-                        language_id=lang_id,
-                        rel_id=tbl_company_name_relations.id,
+                )
+                name_ids: Dict[int, int] = {
+                    lang_id: name_id for name_id, lang_id in db_results.all()
+                }
+
+                # 관계 추가 (입력 순서대로)
+                for lang_type, name in new_companies.items():
+                    new_names.append((name_ids[language_ids[lang_type]], name, lang_type))
+
+                await session.execute(
+                    update(CompanyNameRelation).where(
+                        CompanyNameRelation.id == rel_id,
+                    ).values(
+                        name_ids=[name_id for name_id, _, _ in new_names],
                     )
-                    session.add(new_company_name)
-                    await session.flush() # id 먼저 받기
+                )
 
-                    # 관계 추가
-                    tbl_company_name_relations.name_ids.append(new_company_name.id)
+            # 자동완성 색인, 프로필 캐시 반영 (commit 이후)
+            def apply_new_names():
+                for name_id, name, lang_type in new_names:
+                    company_name_index.add(name_id, company_id, name, lang_type)
+                company_profile_cache.bump(company_id)
 
-                company_id = company_id_obj.id
-                await session.commit()
+            uow.on_commit(apply_new_names)
 
         except Exception as e:
             logger.error(f"[ERROR] add_new_company: {e}")
@@ -255,85 +642,246 @@ class CompanyRepository:
         self,
         company_id: int,
         new_tag: Dict[str, str],
+        uow: Optional[UnitOfWork] = None,
     ):
         """
         새로운 태그 추가
+            - 언어 수와 관계없이 고정된 횟수의 SQL로 처리
+                1. 같은 회사에 이미 있는 묶음의 태그 조회 (tag_name, language_id) -> 기존 태그 관계 id
+                2. 기존 관계가 없으면 tbl_tag_relations INSERT ... RETURNING id
+                3. tbl_tags 다중 행 INSERT ... ON CONFLICT DO NOTHING RETURNING
+                4. tbl_tag_relations.tag_ids UPDATE (새 관계에 추가된 태그가 없으면 관계 삭제)
+            - 언어 id는 레지스트리에서 조회
+            - 이미 있는 태그(tag_name, company_id, language_id)는 건너뛰고 나머지는 추가
+                - 묶음의 일부 언어만 이미 있으면 나머지는 그 태그의 관계(rel_id)에 추가 -> 같은 의미로 묶임
+                  (여러 관계에 걸쳐 있으면 id가 가장 작은 관계)
+
+        Args:
+            - company_id (int): 회사 ID
+            - new_tag (Dict[str, str]): 언어별 태그명 (같은 의미의 태그 묶음 하나)
+            - uow (UnitOfWork): 지정 시 해당 트랜잭션에서 실행 (commit은 호출한 쪽에서)
+
+        Returns:
+            - List[str]: 추가된 태그명 리스트 (이미 있던 태그 제외)
+
+        Raises:
+            - ValueError: 등록되지 않은 언어
         """
+        if not new_tag:
+            return []
+
+        if uow is None:
+            async with UnitOfWork() as uow:
+                added_tag_names = await self.add_new_tag(company_id, new_tag, uow=uow)
+                await uow.commit()
+            return added_tag_names
+
+        added_tags: List[Tuple[int, str, str]] = []
+        related_tag_names: List[str] = []
         try:
-            async for session in get_db():
-                # tbl_tab_realtions 정보 추가
-                tag_relations = TagRelation(
-                    tag_ids=[],
-                    company_id=company_id,
+            session = uow.session
+            # Language ID 조회 (레지스트리)
+            language_ids: Dict[str, int] = await self._get_language_ids(
+                session,
+                list(new_tag.keys()),
+            )
+
+            # 같은 회사에 이미 있는 태그의 관계 조회
+            db_results = await session.execute(
+                select(
+                    Tag.rel_id,
+                    Tag.tag_name,
+                ).where(
+                    Tag.company_id == company_id,
+                    tuple_(Tag.tag_name, Tag.language_id).in_([
+                        (tag_name, language_ids[lang_type])
+                        for lang_type, tag_name in new_tag.items()
+                    ]),
+                ).order_by(
+                    Tag.rel_id,
+                )
+            )
+            existing_tags: List[Tuple[int, str]] = [(tag_rel_id, tag_name) for tag_rel_id, tag_name in db_results.all()]
+
+            if existing_tags:
+                # 기존 관계에 추가
+                rel_id: int = existing_tags[0][0]
+                related_tag_names = [tag_name for tag_rel_id, tag_name in existing_tags if tag_rel_id == rel_id]
+            else:
+                # tbl_tag_relations 정보 추가
+                db_results = await session.execute(
+                    insert(TagRelation).values(
+                        company_id=company_id,
+                        tag_ids=[],
+                    ).returning(TagRelation.id)
+                )
+                rel_id = db_results.scalar_one()
+
+            # 새롭게 추가 (중복 태그는 건너뛰기)
+            db_results = await session.execute(
+                pg_insert(Tag).values([
+                    {
+                        "tag_name": tag_name,
+                        "company_id": company_id,
+                        "rel_id": rel_id,
+                        "language_id": language_ids[lang_type],
+                    }
+                    for lang_type, tag_name in new_tag.items()
+                ]).on_conflict_do_nothing(
+                    index_elements=[Tag.tag_name, Tag.company_id, Tag.language_id],
+                ).returning(
+                    Tag.id,
+                    Tag.language_id,
+                )
+            )
+            inserted: Dict[int, int] = {lang_id: tag_id for tag_id, lang_id in db_results.all()}
+
+            # 관계 추가 (입력 순서대로), 새 관계에 추가된 태그가 없으면 관계 삭제
+            tag_ids: List[int] = []
+            for lang_type, tag_name in new_tag.items():
+                tag_id = inserted.get(language_ids[lang_type])
+                if tag_id is None:
+                    logger.info(f"Tag already exists: {tag_name} for company {company_id} in language {lang_type}")
+                    continue
+                tag_ids.append(tag_id)
+                added_tags.append((tag_id, lang_type, tag_name))
+
+            stmt = None
+            if tag_ids:
+                stmt = update(
+                    TagRelation,
+                ).where(
+                    TagRelation.id == rel_id,
+                ).values(
+                    tag_ids=(TagRelation.tag_ids + tag_ids) if existing_tags else tag_ids,
+                )
+            elif not existing_tags:
+                stmt = delete(
+                    TagRelation,
+                ).where(
+                    TagRelation.id == rel_id,
+                )
+            if stmt is not None:
+                await session.execute(stmt)
+
+            # 태그 역색인, 태그 집계, 프로필 캐시 반영 (commit 이후)
+            def apply_added_tags():
+                tag_index.add(
+                    [(tag_id, tag_name) for tag_id, _, tag_name in added_tags],
+                    company_id,
+                    related_tag_names=related_tag_names,
                 )
-                session.add(tag_relations)
-                await session.flush() # id 먼저 받기
-
-                # 새롭게 추가
-                for lang_type, tag_name in new_tag.items():
-                    try:
-                        lang_id = await session.execute(
-                            select(Language).where(Language.language_type == lang_type)
-                        )
-                        lang_id = lang_id.scalar_one().id
-
-                        new_tag_obj = Tag(
-                            tag_name=tag_name,
-                            company_id=company_id,
-                            rel_id=tag_relations.id,
-                            language_id=lang_id,
-                        )
-                        session.add(new_tag_obj)
-                        await session.flush() # id 먼저 받기
-
-                        # 관계 추가
-                        tag_relations.tag_ids.append(new_tag_obj.id)
-
-                    except IntegrityError as e:
-                        # 중복 태그인 경우 건너뛰기
-                        logger.info(f"Tag already exists: {tag_name} for company {company_id} in language {lang_type}")
-                        await session.rollback()
-                        continue
+                for tag_id, lang_type, tag_name in added_tags:
+                    tag_facets.add(tag_id, lang_type, tag_name)
+                company_profile_cache.bump(company_id)
 
-                await session.commit()
+            if added_tags:
+                uow.on_commit(apply_added_tags)
             
         except Exception as e:
             logger.error(f"[ERROR] add_new_tag: {e}")
             raise e
+
+        return [tag_name for _, _, tag_name in added_tags]
     
     
     async def delete_tag_info(
         self,
         tag_rel_id: int,
+        uow: Optional[UnitOfWork] = None,
     ):
         """
         태그 정보 삭제
             - tag_id, tag_rel_id를 기반으로 삭제
             - tbl_tags, tbl_tag_relations 에서 삭제
+            - 삭제된 태그의 언어는 레지스트리에서 조회 (레지스트리에 없는 언어만 DB 조회)
+
+        Args:
+            - tag_rel_id (int): 태그 관계 ID
+            - uow (UnitOfWork): 지정 시 해당 트랜잭션에서 실행 (commit은 호출한 쪽에서)
+
+        Returns:
+            - List[str]: 삭제된 태그명 리스트 (모든 언어)
         """
+        # 태그 집계 반영에 language_type 필요 (시작 시 레지스트리 구축에 실패한 경우 여기서 구축)
+        if not language_registry.is_loaded:
+            await self.load_language_registry()
+
+        if uow is None:
+            async with UnitOfWork() as uow:
+                deleted_tag_names = await self.delete_tag_info(tag_rel_id, uow=uow)
+                await uow.commit()
+            return deleted_tag_names
+
+        deleted_tag_names: List[str] = []
+        deleted_tags: List[Tuple[int, str, int, Optional[str]]] = []
+        company_id: Optional[int] = None
         try:
-            async for session in get_db():
-                # tbl_tags
-                stmt = delete(
-                    Tag,
-                ).where(
-                    Tag.rel_id == tag_rel_id,
-                )
-                await session.execute(stmt)
-
-                # tbl_tag_relations -> tag_ids에서 삭제
-                stmt = delete(
-                    TagRelation,
-                ).where(
-                    TagRelation.id == tag_rel_id,
+            session = uow.session
+            # tbl_tags
+            stmt = delete(
+                Tag,
+            ).where(
+                Tag.rel_id == tag_rel_id,
+            ).returning(
+                Tag.id,
+                Tag.tag_name,
+                Tag.company_id,
+                Tag.language_id,
+            )
+            db_results = await session.execute(stmt)
+            rows = db_results.all()
+
+            # 레지스트리에 없는 언어 (다른 프로세스가 추가한 언어)는 DB 조회 후 등록
+            missing_language_ids = {
+                lang_id for _, _, _, lang_id in rows
+                if language_registry.get_type(lang_id) is None
+            }
+            if missing_language_ids:
+                db_results = await session.execute(
+                    select(
+                        Language.language_type,
+                        Language.id,
+                    ).where(
+                        Language.id.in_(missing_language_ids),
+                    )
                 )
-                await session.execute(stmt)
+                for lang_type, lang_id in db_results.all():
+                    language_registry.register(lang_type, lang_id)
 
-                await session.commit()
+            deleted_tags = [
+                (tag_id, tag_name, tag_company_id, language_registry.get_type(lang_id))
+                for tag_id, tag_name, tag_company_id, lang_id in rows
+            ]
+            deleted_tag_names = [tag_name for _, tag_name, _, _ in deleted_tags]
+
+            # tbl_tag_relations -> tag_ids에서 삭제
+            stmt = delete(
+                TagRelation,
+            ).where(
+                TagRelation.id == tag_rel_id,
+            ).returning(
+                TagRelation.company_id,
+            )
+            db_results = await session.execute(stmt)
+            company_id = db_results.scalar()
+
+            # 태그 역색인, 태그 집계, 프로필 캐시 반영 (commit 이후)
+            def apply_deleted_tags():
+                for tag_id, tag_name, tag_company_id, lang_type in deleted_tags:
+                    tag_index.remove(tag_id, tag_name, tag_company_id)
+                    if lang_type is not None:
+                        tag_facets.remove(tag_id, lang_type, tag_name)
+                if company_id is not None:
+                    company_profile_cache.bump(company_id)
+
+            uow.on_commit(apply_deleted_tags)
             
         except Exception as e:
             logger.error(f"[ERROR] delete_tag_info: {e}")
             raise e
+
+        return deleted_tag_names
         
     async def get_tag_relation_id(
         self,
@@ -0,0 +1,172 @@
+from typing import List, Dict, Any, Tuple
+
+from app.utils import setup_logger
+from app.utils.database import db_engine
+from app.models import (
+    CompanyID,
+    CompanyName,
+    CompanyNameRelation,
+    Tag,
+    TagRelation,
+)
+
+# Logger
+logger = setup_logger("Import_Repository")
+
+
+class ImportRepository:
+    """
+    대량 회사 / 태그 추가 (CSV 가져오기용)
+        - asyncpg COPY(copy_records_to_table)로 테이블별 한 번에 적재
+        - id는 시퀀스에서 미리 받아서(nextval) 관계 배열(name_ids, tag_ids)까지 메모리에서 완성
+            -> 스테이징 테이블, INSERT ... SELECT 없이 대상 테이블로 바로 COPY
+        - 모두 새 회사이므로 기존 행과 충돌 없음, 같은 회사 안의 중복 태그는 메모리에서 제거
+        - 인메모리 색인/캐시는 갱신하지 않음 (가져오기 후 재구축)
+    """
+
+    def __init__(self):
+        # 테이블 -> 시퀀스 이름
+        self._sequences: Dict[str, str] = {}
+
+    async def _allocate_ids(
+        self,
+        connection,
+        table_name: str,
+        count: int,
+    ):
+        """
+        시퀀스에서 id count개 미리 받기 (다른 세션과 겹치지 않음)
+        """
+        if count == 0:
+            return []
+
+        sequence = self._sequences.get(table_name)
+        if sequence is None:
+            sequence = await connection.fetchval(
+                "SELECT pg_get_serial_sequence($1, 'id')",
+                f"public.{table_name}",
+            )
+            self._sequences[table_name] = sequence
+
+        rows = await connection.fetch(
+            "SELECT nextval($1::regclass) FROM generate_series(1, $2)",
+            sequence,
+            count,
+        )
+        return [row[0] for row in rows]
+
+    async def bulk_add_companies(
+        self,
+        new_companies: List[Dict[str, Any]],
+        language_ids: Dict[str, int],
+    ):
+        """
+        새로운 회사 대량 추가 (하나의 트랜잭션)
+            1. 테이블별 id 미리 받기 (nextval 5번)
+            2. tbl_company_ids, tbl_company_name_relations, tbl_company_names,
+               tbl_tag_relations, tbl_tags 순서로 COPY (5번)
+
+        Args:
+            - new_companies (List[Dict[str, Any]]): CompanyService.add_new_company 와 같은 형식
+                {
+                    "company_name": {"lang_type": company_name, ...},
+                    "tags": [{"tag_name": {"lang_type": tag_name, ...}}, ...],
+                }
+            - language_ids (Dict[str, int]): language_type -> id (모든 언어 등록 필요)
+
+        Returns:
+            - Dict[str, int]: 테이블별 추가된 행 수
+        """
+        # 회사별 회사명 / 태그 묶음 정리 (빈 이름, 같은 회사의 중복 태그 제거)
+        companies: List[Tuple[List[Tuple[int, str]], List[List[Tuple[int, str]]]]] = []
+        name_count: int = 0
+        tag_group_count: int = 0
+        tag_count: int = 0
+        for new_company in new_companies:
+            names: List[Tuple[int, str]] = [
+                (language_ids[lang_type], name)
+                for lang_type, name in new_company["company_name"].items()
+                if name
+            ]
+
+            seen_tags = set()
+            tag_groups: List[List[Tuple[int, str]]] = []
+            for tag_item in new_company["tags"]:
+                tag_group: List[Tuple[int, str]] = []
+                for lang_type, tag_name in tag_item["tag_name"].items():
+                    key = (language_ids[lang_type], tag_name)
+                    if not tag_name or key in seen_tags:
+                        continue
+                    seen_tags.add(key)
+                    tag_group.append(key)
+                if tag_group:
+                    tag_groups.append(tag_group)
+                    tag_count += len(tag_group)
+
+            companies.append((names, tag_groups))
+            name_count += len(names)
+            tag_group_count += len(tag_groups)
+
+        results: Dict[str, int] = {}
+        try:
+            async with db_engine.connect() as conn:
+                raw_connection = await conn.get_raw_connection()
+                connection = raw_connection.driver_connection
+
+                async with connection.transaction():
+                    # 1. id 미리 받기
+                    company_ids = await self._allocate_ids(connection, CompanyID.__tablename__, len(companies))
+                    name_rel_ids = await self._allocate_ids(connection, CompanyNameRelation.__tablename__, len(companies))
+                    name_ids = await self._allocate_ids(connection, CompanyName.__tablename__, name_count)
+                    tag_rel_ids = await self._allocate_ids(connection, TagRelation.__tablename__, tag_group_count)
+                    tag_ids = await self._allocate_ids(connection, Tag.__tablename__, tag_count)
+
+                    # 2. 행 구성 (관계 배열은 입력 순서대로)
+                    company_rows: List[Tuple] = []
+                    name_rel_rows: List[Tuple] = []
+                    name_rows: List[Tuple] = []
+                    tag_rel_rows: List[Tuple] = []
+                    tag_rows: List[Tuple] = []
+                    name_ids_iter, tag_rel_ids_iter, tag_ids_iter = iter(name_ids), iter(tag_rel_ids), iter(tag_ids)
+                    for (names, tag_groups), company_id, name_rel_id in zip(companies, company_ids, name_rel_ids):
+                        company_rows.append((company_id,))
+
+                        company_name_ids: List[int] = []
+                        for lang_id, name in names:
+                            name_id = next(name_ids_iter)
+                            company_name_ids.append(name_id)
+                            name_rows.append((name_id, name, company_id, name_rel_id, lang_id))
+                        name_rel_rows.append((name_rel_id, company_id, company_name_ids))
+
+                        for tag_group in tag_groups:
+                            tag_rel_id = next(tag_rel_ids_iter)
+                            group_tag_ids: List[int] = []
+                            for lang_id, tag_name in tag_group:
+                                tag_id = next(tag_ids_iter)
+                                group_tag_ids.append(tag_id)
+                                tag_rows.append((tag_id, tag_name, tag_rel_id, company_id, lang_id))
+                            tag_rel_rows.append((tag_rel_id, company_id, group_tag_ids))
+
+                    # 3. COPY (FK 순서대로, add_date는 DEFAULT now())
+                    copies: List[Tuple[str, List[str], List[Tuple]]] = [
+                        (CompanyID.__tablename__, ["id"], company_rows),
+                        (CompanyNameRelation.__tablename__, ["id", "company_id", "name_ids"], name_rel_rows),
+                        (CompanyName.__tablename__, ["id", "name", "company_id", "rel_id", "language_id"], name_rows),
+                        (TagRelation.__tablename__, ["id", "company_id", "tag_ids"], tag_rel_rows),
+                        (Tag.__tablename__, ["id", "tag_name", "rel_id", "company_id", "language_id"], tag_rows),
+                    ]
+                    for table_name, columns, records in copies:
+                        if records:
+                            await connection.copy_records_to_table(
+                                table_name,
+                                records=records,
+                                columns=columns,
+                                schema_name="public",
+                            )
+                        results[table_name] = len(records)
+
+        except Exception as e:
+            logger.error(f"[ERROR] bulk_add_companies: {e}")
+            raise e
+
+        return results
@@ -1,8 +1,12 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple, Optional
 
-from sqlalchemy import select
+from sqlalchemy import select, func, or_, case, cast, tuple_, Integer
+from sqlalchemy.orm import aliased
 
-from app.utils import get_db, setup_logger
+from app.utils import get_db, setup_logger, settings
+from app.utils.cursor import encode_cursor
+from app.indexes import company_name_index
+from app.indexes.company_name_index import MATCH_FUZZY
 from app.models import (
     CompanyName,
     Language,
@@ -13,45 +17,236 @@ logger = setup_logger("Search_Repository")
 
 
 class SearchRepository:
+    async def load_company_name_index(self):
+        """
+        회사명 자동완성 색인 구축
+            - 전체 회사명을 (name_id, company_id, name, language_type) 컬럼만 조회해서 색인
+        """
+        try:
+            company_name_index.begin_rebuild()
+            async for session in get_db():
+                stmt = select(
+                    CompanyName.id,
+                    CompanyName.company_id,
+                    CompanyName.name,
+                    Language.language_type,
+                ).join(
+                    Language,
+                    Language.id == CompanyName.language_id,
+                )
+
+                db_results = await session.execute(stmt)
+                company_name_index.rebuild(db_results.all())
+
+        except Exception as e:
+            logger.error(f"[ERROR] load_company_name_index: {e}")
+            raise e
+
+        logger.info("[INDEX] company name index loaded")
+
     async def search_company_name(
         self,
         company_name: str,
         language: str,
+        limit: int,
+        after: Optional[Tuple[int, int, int]] = None,
     ):
         """
         회사명 자동완성
             - 회사명의 일부만 들어가도 검색이 되어야 한다.
+            - 모든 언어의 회사명에서 검색하고, 회사별로 출력 언어의 회사명을 반환
+              (출력 언어 회사명이 없으면 노출 가능한 다른 언어 회사명)
+            - 관련도 순 정렬: 완전 일치 > 접두 일치 > 부분 일치 > 짧은 회사명
+            - COMPANY_SEARCH_MODE에 따라 검색 방식 선택
+                - memory: 인메모리 색인 (색인으로 처리할 수 없는 질의는 DB LIKE 검색)
+                          초성("ㅇㅌㄷ") / 입력 중인 음절("원티ㄷ") 질의도 처리
+                          일치 결과가 없으면 오타 허용 검색 (편집 거리 2 이내)
+                - like: DB LIKE 검색
+                - trgm: pg_trgm 인덱스 기반 LIKE + 유사 문자열(%) 검색
         
         Args:
             - query (str): 검색할 회사명
             - language (str): 출력 언어
+            - limit (int): 최대 결과 수
+            - after (Tuple[int, int, int]): 이전 페이지 마지막 정렬 키 (cursor)
         
         Returns:
-            - List[str]: 검색된 회사명 리스트
+            - Dict[str, Any]: 검색 결과
+            {
+                "company_names": List[str],
+                "next_cursor": str | None,
+            }
+        """
+        if (
+            settings.COMPANY_SEARCH_MODE == "memory"
+            and company_name_index.can_serve(company_name)
+        ):
+            if not company_name_index.is_loaded:
+                await self.load_company_name_index()
+
+            rows = []
+            if after is None or after[0] < MATCH_FUZZY:
+                rows = company_name_index.search(
+                    query=company_name,
+                    language=language,
+                    limit=limit + 1,
+                    after=after,
+                )
+
+            # 일치 결과가 없는 경우에만 오타 허용 검색
+            if not rows and (after is None or after[0] >= MATCH_FUZZY):
+                rows = company_name_index.fuzzy_search(
+                    query=company_name,
+                    language=language,
+                    limit=limit + 1,
+                    after=after,
+                )
+        else:
+            rows = await self.search_company_name_by_db(
+                company_name=company_name,
+                language=language,
+                limit=limit + 1,
+                after=after,
+                use_trgm=(settings.COMPANY_SEARCH_MODE == "trgm"),
+            )
+
+        return self._to_page(rows, limit)
+
+    def _to_page(
+        self,
+        rows: List[Tuple[Tuple[int, ...], str]],
+        limit: int,
+    ):
+        """
+        limit + 1개 조회 결과를 페이지로 변환
         """
-        results: List[str] = []
+        next_cursor: Optional[str] = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1][0])
+
+        return {
+            "company_names": [name for _, name in rows],
+            "next_cursor": next_cursor,
+        }
+
+    async def search_company_name_by_db(
+        self,
+        company_name: str,
+        language: str,
+        limit: int,
+        after: Optional[Tuple[int, int, int]] = None,
+        use_trgm: bool = False,
+    ):
+        """
+        회사명 자동완성 (DB 검색)
+            - 매칭, 정렬 키 계산, keyset(after), LIMIT, 회사별 출력 회사명 선택 모두 하나의 SQL로 처리
+            - use_trgm: tbl_company_names_name_trgm_idx(GIN) 기반 유사 문자열(%) 매칭 추가
+                        (LIKE에 매칭되지 않는 결과는 부분 일치 다음 등급, 등급 안에서는 similarity() 높은 순)
+            - 회사별로 가장 잘 맞는 회사명(DISTINCT ON)으로 페이지(keyset + LIMIT)를 먼저 자른 뒤,
+              페이지의 회사만 출력 회사명을 조회 (상관 서브쿼리, 회사당 1행)
+                -> 회사별 중복 제거는 매칭된 모든 회사명을 대상으로 하므로 비용은 매칭 행 수에 비례 (짧은 질의일수록 큼)
+                -> 짧은 질의가 많으면 COMPANY_SEARCH_MODE=memory 사용
+        
+        Args:
+            - query (str): 검색할 회사명
+            - language (str): 출력 언어
+            - limit (int): 최대 결과 수
+            - after (Tuple[int, int, int]): 이전 페이지 마지막 정렬 키
+            - use_trgm (bool): pg_trgm 유사 문자열 매칭 사용 여부
+        
+        Returns:
+            - List[Tuple[Tuple[int, int, int], str]]: (정렬 키, 출력 회사명) 리스트
+        """
+        results: List[Tuple[Tuple[int, int, int], str]] = []
+
+        like_condition = CompanyName.name.like(f"%{company_name}%")
+        match_condition = like_condition
+        if use_trgm:
+            match_condition = or_(
+                like_condition,
+                CompanyName.name.op("%")(company_name),
+            )
+
+        rank = case(
+            (CompanyName.name == company_name, 0),
+            (CompanyName.name.like(f"{company_name}%"), 1),
+            (like_condition, 2),
+            else_=3,
+        )
+        name_length = func.length(CompanyName.name)
+        if use_trgm:
+            # 유사 문자열 등급(3)은 회사명 길이 대신 similarity() 높은 순 (정수 cursor 유지를 위해 1/1000 단위)
+            name_length = case(
+                (like_condition, name_length),
+                else_=cast(func.round((1 - func.similarity(CompanyName.name, company_name)) * 1000), Integer),
+            )
+
+        # 회사별 가장 잘 맞는 회사명 (모든 언어 대상)
+        matched = select(
+            CompanyName.company_id.label("company_id"),
+            rank.label("rank"),
+            name_length.label("name_length"),
+            CompanyName.id.label("name_id"),
+        ).where(
+            match_condition,
+            CompanyName.name != "",
+        ).distinct(
+            CompanyName.company_id,
+        ).order_by(
+            CompanyName.company_id,
+            rank,
+            name_length,
+            CompanyName.id,
+        ).subquery("matched")
+
+        # 정렬 키 순 페이지 (keyset + LIMIT)
+        page = select(matched).order_by(
+            matched.c.rank,
+            matched.c.name_length,
+            matched.c.name_id,
+        ).limit(limit)
+        if after is not None:
+            page = page.where(
+                tuple_(matched.c.rank, matched.c.name_length, matched.c.name_id) > tuple_(*after)
+            )
+        page = page.subquery("page")
+
+        # 페이지의 회사별 출력 회사명 (출력 언어 우선, 없으면 먼저 등록된 다른 언어)
+        display_name = aliased(CompanyName, name="display_name")
+        display_language = aliased(Language, name="display_language")
+        displayed = select(
+            display_name.name,
+        ).join(
+            display_language,
+            display_language.id == display_name.language_id,
+        ).where(
+            display_name.company_id == page.c.company_id,
+            display_name.name != "",
+        ).order_by(
+            (display_language.language_type == language).desc(),
+            display_name.id,
+        ).limit(1).scalar_subquery()
+
         try:
             async for session in get_db():
                 stmt = select(
-                    CompanyName,
-                    Language,
-                ).join(
-                    Language,
-                    Language.id == CompanyName.language_id,
-                ).where(
-                    Language.language_type == language,
-                    CompanyName.name.like(f"%{company_name}%"),
+                    page.c.rank,
+                    page.c.name_length,
+                    page.c.name_id,
+                    displayed.label("name"),
+                ).order_by(
+                    page.c.rank,
+                    page.c.name_length,
+                    page.c.name_id,
                 )
 
                 db_results = await session.execute(stmt)
-                rows = db_results.all()
-
-                for row in rows:
-                    company_name_obj = row[0] # CompanyName 객체
-                    results.append(company_name_obj.name)
+                for row_rank, row_length, name_id, name in db_results.all():
+                    results.append(((row_rank, row_length, name_id), name))
 
         except Exception as e:
-            logger.error(f"[ERROR] search_company_name: {e}")
+            logger.error(f"[ERROR] search_company_name_by_db: {e}")
             raise e
         
-        return results
\ No newline at end of file
+        return results
@@ -1,9 +1,15 @@
-from typing import List, Dict, Any
+from itertools import islice
+from typing import List, Optional, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import select, func, intersect, union, except_
+from sqlalchemy.orm import aliased
 
-from app.utils import get_db, setup_logger
+from app.utils import get_db, setup_logger, settings
+from app.utils.cursor import encode_cursor
+from app.indexes import tag_index, tag_facets
+from app.utils.tag_query import TagQuery, iterate_tag_query
 from app.models import (
+    CompanyID,
     CompanyName,
     Language,
     Tag,
@@ -13,92 +19,268 @@ from app.models import (
 logger = setup_logger("Tag_Repository")
 
 class TagRepository:
+    async def load_tag_index(self):
+        """
+        태그 역색인 구축
+            - 전체 태그를 (id, tag_name, company_id, rel_id) 컬럼만 조회해서 색인
+        """
+        try:
+            tag_index.begin_rebuild()
+            async for session in get_db():
+                stmt = select(
+                    Tag.id,
+                    Tag.tag_name,
+                    Tag.company_id,
+                    Tag.rel_id,
+                )
+
+                db_results = await session.execute(stmt)
+                tag_index.rebuild(db_results.all())
+
+        except Exception as e:
+            logger.error(f"[ERROR] load_tag_index: {e}")
+            raise e
+
+        logger.info("[INDEX] tag index loaded")
+
+    async def load_tag_facets(self):
+        """
+        언어별 태그 회사 수 집계 구축
+            - (language_type, tag_name)별 태그 행 수를 GROUP BY 한 번으로 조회
+            - 재구축 중에 들어온 증감분이 집계에 이미 반영되었는지 같은 스냅샷(REPEATABLE READ)에서 태그 행 id로 확인
+        """
+        try:
+            tag_facets.begin_rebuild()
+            async for session in get_db():
+                await session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+                stmt = select(
+                    Language.language_type,
+                    Tag.tag_name,
+                    func.count(),
+                ).join(
+                    Language,
+                    Language.id == Tag.language_id,
+                ).group_by(
+                    Language.language_type,
+                    Tag.tag_name,
+                )
+
+                db_results = await session.execute(stmt)
+                rows = db_results.all()
+
+                # 증감분의 태그 행 중 집계 시점에 있던 행 (확인 중에 들어온 증감분까지 반복)
+                checked_row_ids = set()
+                present_row_ids: List[int] = []
+                while True:
+                    row_ids = [x for x in tag_facets.pending_row_ids() if x not in checked_row_ids]
+                    if not row_ids:
+                        break
+                    checked_row_ids.update(row_ids)
+                    db_results = await session.execute(select(Tag.id).where(Tag.id.in_(row_ids)))
+                    present_row_ids.extend(db_results.scalars().all())
+
+                tag_facets.rebuild(rows, present_row_ids)
+
+        except Exception as e:
+            logger.error(f"[ERROR] load_tag_facets: {e}")
+            raise e
+
+        logger.info("[INDEX] tag facets loaded")
+
     async def get_company_id_by_tag_name(
         self,
         tag_name: str,
     ):
         """
         태그 이름을 통해 회사 id 조회
+            - TAG_SEARCH_MODE에 따라 조회 방식 선택
+                - memory: 태그 역색인 (정규화된 태그명 기준, 없으면 먼저 구축)
+                - db: company_id 컬럼만 조회 (태그명 그대로 일치)
 
         Returns:
-            - List[int]: 회사 id 리스트
+            - List[int]: 회사 id 리스트 (오름차순, 중복 없음)
         """
+        if settings.TAG_SEARCH_MODE == "memory":
+            if not tag_index.is_loaded:
+                await self.load_tag_index()
+            return tag_index.company_ids(tag_name)
+
         results: List[int] = []
 
         try:
             async for session in get_db():
                 stmt = select(
-                    Tag,
+                    Tag.company_id,
                 ).where(
                     Tag.tag_name == tag_name
-                ).order_by(
+                ).distinct().order_by(
                     Tag.company_id.asc(),
                 )
 
                 db_results = await session.execute(stmt)
-                rows = db_results.all()
-
-                for row in rows:
-                    tag_obj: Tag = row[0]
-                    results.append(tag_obj.company_id)
+                results = list(db_results.scalars().all())
             
         except Exception as e:
             logger.error(f"[ERROR] get_company_id_by_tag_name: {e}")
             raise e
 
-        results = list(set(results))
         return results
 
-    async def get_company_name_by_company_id(
+    async def search_company_name_by_tag_query(
         self,
-        company_ids: List[int],
+        tag_query: TagQuery,
+        language: str,
+        limit: int,
+        after: Optional[int] = None,
     ):
         """
-        회사 id를 통해 회사 이름 조회
+        태그 검색식(AND / OR / NOT)으로 회사명 검색 (단일 SQL)
+            - 회사 id 조회 방식은 TAG_SEARCH_MODE에 따라 선택
+                - memory: 태그 역색인의 회사 id 목록을 작은 것부터 교집합 / 합집합 / 차집합
+                - db: 태그별 company_id 조회를 INTERSECT / UNION / EXCEPT로 묶어 서브쿼리로 사용
+            - 태그명은 같은 태그 관계의 다른 언어 태그명까지 포함해서 검색 ("タグ_22" -> "태그_22", "tag_22")
+                - memory / db 모드의 일치 기준 차이는 settings.TAG_SEARCH_MODE 참고
+            - 검색식에 맞는 회사 id를 회사 id 순으로 limit + 1개까지 자른 뒤, 그 회사만 출력 회사명 조회
+                - 회사별 출력 언어 회사명 우선, 없으면 노출 가능한 다른 언어 (상관 서브쿼리, 회사당 1행)
+                - 빈 회사명만 있는 회사는 결과에서 제외
+            - 다음 페이지 여부 / 커서는 회사명이 아닌 회사 id 기준 (회사명이 없는 회사가 있어도 페이지가 끊기지 않음)
+
+        Args:
+            - tag_query (TagQuery): parse_tag_query 결과
+            - language (str): 출력 언어
+            - limit (int): 최대 결과 수
+            - after (int): 이전 페이지 마지막 회사 id
 
         Returns:
-            - Dict[str, Any]: 회사 정보
-            {
-                "회사 id": {
-                    "ko": "",
-                    "en": "",
-                    "ja": "",
-                    ...
-                }
-            }
+            - Dict[str, Any]: 검색된 회사명 리스트와 다음 페이지 커서
         """
-        results: Dict[int, Any] = {}
+        if settings.TAG_SEARCH_MODE == "memory":
+            if not tag_index.is_loaded:
+                await self.load_tag_index()
+
+            # 커서 이후 limit + 1개만 읽음 (전체 결과를 만들지 않음)
+            page_ids: List[int] = list(islice(
+                iterate_tag_query(tag_query, tag_index.posting, after=after),
+                limit + 1,
+            ))
+            if not page_ids:
+                return self._to_page([], limit)
+
+            page = select(
+                CompanyID.id.label("company_id"),
+            ).where(
+                CompanyID.id.in_(page_ids),
+            ).subquery("page")
+        else:
+            matched = self._tag_query_to_select(tag_query, after=after, limit=limit + 1).subquery("matched")
+            page = select(
+                matched.c.company_id,
+            ).order_by(
+                matched.c.company_id,
+            ).limit(limit + 1).subquery("page")
 
+        # 페이지의 회사별 출력 회사명 (출력 언어 우선, 없으면 먼저 등록된 다른 언어)
+        displayed = select(
+            CompanyName.name,
+        ).join(
+            Language,
+            Language.id == CompanyName.language_id,
+        ).where(
+            CompanyName.company_id == page.c.company_id,
+            CompanyName.name != '',
+        ).order_by(
+            (Language.language_type == language).desc(),
+            CompanyName.id.asc(),
+        ).limit(1).scalar_subquery()
+
+        rows: List[Tuple[int, Optional[str]]] = []
         try:
             async for session in get_db():
                 stmt = select(
-                    CompanyName,
-                    Language,
-                ).join(
-                    Language,
-                    Language.id == CompanyName.language_id,
-                ).where(
-                    CompanyName.company_id.in_(company_ids),
-                    CompanyName.name != '',
+                    page.c.company_id,
+                    displayed.label("name"),
                 ).order_by(
-                    CompanyName.company_id.asc(),
+                    page.c.company_id.asc(),
                 )
 
                 db_results = await session.execute(stmt)
-                rows = db_results.all()
+                rows = [(row.company_id, row.name) for row in db_results.all()]
 
-                for row in rows:
-                    company_name_obj: CompanyName = row[0]
-                    language_obj: Language = row[1]
-
-                    if company_name_obj.company_id not in results.keys():
-                        results[company_name_obj.company_id] = {
-                            language_obj.language_type: company_name_obj.name
-                        }
-                    else:
-                        results[company_name_obj.company_id][language_obj.language_type] = company_name_obj.name
-                
         except Exception as e:
-            logger.error(f"[ERROR] get_company_info_by_company_id: {e}")
+            logger.error(f"[ERROR] search_company_name_by_tag_query: {e}")
+            raise e
+
+        return self._to_page(rows, limit)
+
+    def _to_page(
+        self,
+        rows: List[Tuple[int, Optional[str]]],
+        limit: int,
+    ):
+        """
+        limit + 1개 조회 결과((회사 id, 회사명))를 페이지로 변환
+            - 커서는 회사 id 기준, 회사명이 없는 회사(None)는 결과에서만 제외
+        """
+        next_cursor: Optional[str] = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor((rows[-1][0],))
+
+        return {
+            "company_names": [name for _, name in rows if name is not None],
+            "next_cursor": next_cursor,
+        }
+
+    def _tag_query_to_select(
+        self,
+        tag_query: TagQuery,
+        after: Optional[int] = None,
+        limit: Optional[int] = None,
+    ):
+        """
+        태그 검색식 -> company_id 한 컬럼 SELECT
+            - 태그명은 정규화하지 않고 그대로 일치, 같은 태그 관계(rel_id)의 다른 언어 태그명으로 한 단계만 확장
+              (태그 역색인은 정규화 + 전이적 확장 -> settings.TAG_SEARCH_MODE 참고)
+            - 커서 조건(company_id > after)은 태그별 조회에 적용
+              -> (tag_name, company_id, language_id) 유니크 인덱스 범위 조회, 앞 페이지는 읽지 않음
+            - limit: 단일 태그 / OR 조회는 company_id 순 limit개까지만 (ORDER BY company_id LIMIT)
+                - OR 결과의 앞 limit개는 각 하위 조회의 앞 limit개 안에 있음
+                - AND / NOT의 하위 조회는 교집합 / 차집합 결과가 어디서 나올지 모르므로 제한하지 않음
+        """
+        kind = tag_query[0]
+        if kind == "tag":
+            source = aliased(Tag)
+            equivalent = aliased(Tag)
+            equivalent_names = select(
+                equivalent.tag_name,
+            ).join(
+                source,
+                source.rel_id == equivalent.rel_id,
+            ).where(
+                source.tag_name == tag_query[1],
+            )
+
+            stmt = select(
+                Tag.company_id,
+            ).where(
+                Tag.tag_name.in_(equivalent_names),
+            )
+            if after is not None:
+                stmt = stmt.where(Tag.company_id > after)
+            if limit is not None:
+                stmt = stmt.distinct().order_by(Tag.company_id).limit(limit)
+            return stmt
+
+        if kind == "or":
+            compound = union(*[self._tag_query_to_select(child, after, limit) for child in tag_query[1]])
+            if limit is not None:
+                compound = compound.order_by("company_id").limit(limit)
+        else:
+            positives = [self._tag_query_to_select(child, after) for child in tag_query[1] if child[0] != "not"]
+            negatives = [self._tag_query_to_select(child[1], after) for child in tag_query[1] if child[0] == "not"]
+            compound = intersect(*positives) if len(positives) > 1 else positives[0]
+            for negative in negatives:
+                compound = except_(compound, negative)
 
-        return results
\ No newline at end of file
+        subquery = compound.subquery()
+        return select(subquery.c.company_id)
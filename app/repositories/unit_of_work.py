@@ -0,0 +1,66 @@
+from typing import Callable, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.utils import get_db, setup_logger
+
+# Logger
+logger = setup_logger("Unit_Of_Work")
+
+
+class UnitOfWork:
+    """
+    여러 저장소 쓰기를 하나의 세션, 하나의 트랜잭션으로 묶음
+        - 저장소 쓰기 메소드에 uow를 넘기면 commit 하지 않고 uow의 세션만 사용
+        - 색인/캐시 반영은 on_commit으로 등록 -> commit 성공 후에만 실행
+        - commit 없이 블록을 벗어나면 (예외 포함) rollback, 등록된 반영도 버림
+
+    Example:
+        async with UnitOfWork() as uow:
+            company_id = await company_repository.add_new_company(new_companies, uow=uow)
+            await company_repository.add_new_tag(company_id, new_tag, uow=uow)
+            await uow.commit()
+    """
+
+    def __init__(self):
+        self.session: Optional[AsyncSession] = None
+        self._sessions = None
+        self._on_commit: List[Callable[[], None]] = []
+
+    async def __aenter__(self):
+        self._sessions = get_db()
+        self.session = await self._sessions.__anext__()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            if self.session.in_transaction():
+                await self.session.rollback()
+        finally:
+            self._on_commit.clear()
+            await self._sessions.aclose()
+            self.session = None
+            self._sessions = None
+
+    def on_commit(
+        self,
+        callback: Callable[[], None],
+    ):
+        """
+        commit 성공 후 실행할 작업 등록 (색인, 캐시 반영)
+        """
+        self._on_commit.append(callback)
+
+    async def commit(self):
+        """
+        트랜잭션 commit 후 등록된 작업을 순서대로 실행
+        """
+        await self.session.commit()
+
+        callbacks, self._on_commit = self._on_commit, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                # DB에는 이미 반영됨 -> 색인/캐시는 재구축 또는 TTL로 맞춰짐
+                logger.error(f"[ERROR] on_commit: {e}")
@@ -1,5 +1,6 @@
 from app.routers.company_router import router as company_router
 from app.routers.search_router import router as  search_router
 from app.routers.tag_router import router as tags_router
+from app.routers.stats_router import router as stats_router
 
-__all__ = ["company_router", "search_router", "tags_router"]
\ No newline at end of file
+__all__ = ["company_router", "search_router", "tags_router", "stats_router"]
\ No newline at end of file
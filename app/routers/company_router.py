@@ -3,6 +3,8 @@ from typing import Dict, List, Any
 
 from app.services import CompanyService
 from app.schemas import (
+    CompanyBatchItem,
+    CompanyBatchRequest,
     CompanyInfoResponse,
     CompanyRequest,
     CompanyResponse,
@@ -30,6 +32,7 @@ async def get_company_info(
     - **회사 이름**을 기준으로 상세 정보를 조회합니다.
     - 헤더의 **x-wanted-language** 값에 따라 **다국어**로 정보를 출력합니다.
       (입력한 회사명과 출력 언어는 다를 수 있습니다)
+    - 일치하는 회사명이 없으면 **오타를 허용**해 가장 가까운 회사명(편집 거리 2 이내)으로 조회합니다.
 
     ---
     **Parameters**
@@ -42,7 +45,7 @@ async def get_company_info(
 
     **Error**
       - **404 Not Found**:  
-        입력한 이름에 해당하는 회사가 존재하지 않을 경우
+        입력한 이름(오타 허용 포함)에 해당하는 회사가 존재하지 않을 경우
 
     ---
     **Example Request**
@@ -148,6 +151,68 @@ async def add_new_company(
 
 
 
+@router.post("/batch")
+async def get_company_infos(
+    batch_request: CompanyBatchRequest,
+    request: Request,
+):
+    """
+    🏢 회사 상세 정보 일괄 조회 API
+
+    - 여러 **회사 이름**(최대 500개)의 상세 정보를 한 번에 조회합니다.
+    - 회사 수와 관계없이 **고정된 횟수의 쿼리**로 조회합니다.
+    - 결과는 **요청 순서대로** 반환하며, 없는 회사는 **found: false**로 표시합니다.
+      (오타 허용 검색은 하지 않습니다)
+    - 헤더의 **x-wanted-language** 값에 따라 **다국어**로 정보를 출력합니다.
+
+    ---
+    **Parameters**
+      - **batch_request** (**CompanyBatchRequest**): 조회할 회사 이름 목록
+      - **request** (**Request**): FastAPI 요청 객체 (헤더 정보 활용)
+
+    **Returns**
+      - **List[CompanyBatchItem]**:  
+        요청 순서대로 회사 정보 (지정한 언어로 반환)
+
+    ---
+    **Example Request**
+    ```http
+    POST /companies/batch
+    x-wanted-language: ko
+    Content-Type: application/json
+
+    {
+      "company_names": ["Wantedlab", "없는회사"]
+    }
+    ```
+
+    **Example Response**
+    ```json
+    [
+      {
+        "query": "Wantedlab",
+        "found": true,
+        "company_name": "원티드랩",
+        "tags": ["태그_4", "태그_20", "태그_16"]
+      },
+      {
+        "query": "없는회사",
+        "found": false,
+        "company_name": "",
+        "tags": []
+      }
+    ]
+    ```
+    """
+    company_service: CompanyService = CompanyService()
+    results: List[Dict[str, Any]] = await company_service.get_company_infos(
+        company_names=batch_request.company_names,
+        language=request.headers.get("x-wanted-language"),
+    )
+
+    return [CompanyBatchItem(**result) for result in results]
+
+
 ### PUT
 @router.put("/{company_name}/tags")
 async def add_new_tag(
@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Request, status
+from fastapi import APIRouter, Request, Response, Query, HTTPException, status
 from fastapi.responses import JSONResponse
-from typing import List, Dict
+from typing import Dict, Any, Optional
 
 from app.services import SearchService
 from app.schemas import SearchResponse
+from app.utils.cursor import decode_cursor
 
 # Router
 router = APIRouter()
@@ -11,7 +12,13 @@ router = APIRouter()
 
 ### GET
 @router.get("/")
-async def search_company_name(query: str, request: Request):
+async def search_company_name(
+    query: str,
+    request: Request,
+    response: Response,
+    limit: int = Query(default=10, ge=1, le=100),
+    cursor: Optional[str] = None,
+):
     """
     🔍 회사명 자동완성 API
 
@@ -19,16 +26,25 @@ async def search_company_name(query: str, request: Request):
     - 헤더의 **x-wanted-language** 값에 따라 **결과 언어**를 다르게 출력합니다.
       (예: 입력은 한글, 출력은 영어 등)
     - 입력 쿼리와 출력 언어는 서로 다를 수 있습니다.
+      (모든 언어의 회사명에서 검색, 해당 언어 회사명이 없으면 노출 가능한 다른 언어로 출력)
+    - **관련도 순**(완전 일치 > 접두 일치 > 부분 일치 > 짧은 회사명)으로 **limit**개씩 반환합니다.
+    - 다음 페이지가 있으면 응답 헤더 **x-next-cursor** 값을 **cursor**로 전달합니다.
 
     ---
     **Parameters**
       - **query** (**str**): 검색할 회사명 일부 또는 전체 문자열  
       - **request** (**Request**): FastAPI 요청 객체 (헤더 정보 활용)
+      - **limit** (**int**): 최대 결과 수 (기본 10, 최대 100)
+      - **cursor** (**str**): 이전 응답의 x-next-cursor 값
 
     **Returns**
       - **results** (**List[SearchResponse]**):  
         자동완성된 회사명 리스트 (지정한 언어로)
 
+    **Error**
+      - **400 Bad Request**:  
+        잘못된 cursor 값
+
     ---
     **Example Request**
     ```http
@@ -44,12 +60,23 @@ async def search_company_name(query: str, request: Request):
     ]
     ```
     """
-    
+    try:
+        after = decode_cursor(cursor, size=3)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
     search_service: SearchService = SearchService()
-    search_results: List[Dict[str, str]] = await search_service.search_company_name(
+    search_results: Dict[str, Any] = await search_service.search_company_name(
         query,
         request.headers.get("x-wanted-language"),
+        limit=limit,
+        after=after,
     )
+
+    if search_results["next_cursor"]:
+        response.headers["x-next-cursor"] = search_results["next_cursor"]
     
-    return [SearchResponse(company_name=item) for item in search_results]
-  
\ No newline at end of file
+    return [SearchResponse(company_name=item) for item in search_results["company_names"]]
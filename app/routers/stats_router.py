@@ -0,0 +1,115 @@
+from fastapi import APIRouter
+from typing import Dict, Any
+
+from app.indexes import tag_index, tag_facets, language_registry
+from app.repositories.company_repository import company_profile_cache
+from app.services.search_service import search_cache
+from app.services.tag_service import tag_search_cache
+
+# Router
+router = APIRouter()
+
+
+### GET
+@router.get("/caches")
+async def get_cache_stats():
+    """
+    📊 캐시 통계 API
+
+    - 프로세스 단위 캐시의 크기와 적중/실패/제거/만료/무효화 횟수를 반환합니다.
+    - 캐시 크기(SEARCH_CACHE_SIZE, TAG_SEARCH_CACHE_SIZE, PROFILE_CACHE_MAX_BYTES) 조정에 사용합니다.
+
+    ---
+    **Example Request**
+    ```http
+    GET /stats/caches
+    ```
+
+    **Example Response**
+    ```json
+    {
+      "search": {
+        "size": 120,
+        "max_size": 10000,
+        "ttl_seconds": 60.0,
+        "hits": 830,
+        "misses": 170,
+        "hit_ratio": 0.83,
+        "evictions": 0,
+        "expirations": 50,
+        "invalidations": 0
+      },
+      "tag_search": {...},
+      "company_profile": {
+        "size": 800,
+        "versions": 900,
+        "memory_bytes": 1048576,
+        "max_bytes": 67108864,
+        "ttl_seconds": 300.0,
+        "hits": 950,
+        "misses": 50,
+        "hit_ratio": 0.95,
+        "evictions": 0,
+        "stale": 3
+      }
+    }
+    ```
+    """
+    results: Dict[str, Any] = {
+        "search": search_cache.stats(),
+        "tag_search": tag_search_cache.stats(),
+        "company_profile": company_profile_cache.stats(),
+    }
+
+    return results
+
+
+
+@router.get("/indexes")
+async def get_index_stats():
+    """
+    📊 인메모리 색인 통계 API
+
+    - 태그 역색인의 태그 수, 태그 행 수, 메모리 사용량을 반환합니다.
+    - 태그별 회사 수 집계의 언어 수, 카운터 수를 반환합니다.
+    - 언어 레지스트리의 언어 수를 반환합니다.
+    - **bytes_per_million_rows**: 태그 행 100만 개당 메모리 사용량 (bytes)
+
+    ---
+    **Example Request**
+    ```http
+    GET /stats/indexes
+    ```
+
+    **Example Response**
+    ```json
+    {
+      "tag": {
+        "is_loaded": true,
+        "tags": 120,
+        "canonical_tags": 40,
+        "rows": 3000,
+        "postings": 1000,
+        "memory_bytes": 26000,
+        "bytes_per_million_rows": 8666666
+      },
+      "tag_facets": {
+        "is_loaded": true,
+        "languages": 3,
+        "counters": 300
+      },
+      "language": {
+        "is_loaded": true,
+        "languages": 3,
+        "rows": 3
+      }
+    }
+    ```
+    """
+    results: Dict[str, Any] = {
+        "tag": tag_index.stats(),
+        "tag_facets": tag_facets.stats(),
+        "language": language_registry.stats(),
+    }
+
+    return results
@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Request
-from typing import List
+from fastapi import APIRouter, Depends, Request, Response, Query, HTTPException, status
+from typing import List, Dict, Any, Optional
 
 from app.services import TagService
-from app.schemas import TagSearchResponse
+from app.schemas import TagFacetResponse, TagSearchResponse
+from app.utils.admin import require_admin_token
+from app.utils.cursor import decode_cursor
 
 # Router
 router = APIRouter()
@@ -13,6 +15,9 @@ router = APIRouter()
 async def search_by_tag_name(
     query: str,
     request: Request,
+    response: Response,
+    limit: int = Query(default=10, ge=1, le=100),
+    cursor: Optional[str] = None,
 ):
     """
     🔎 태그명 기반 회사 검색 API
@@ -22,18 +27,28 @@ async def search_by_tag_name(
       응답은 헤더의 **x-wanted-language** 값에 따라 **지정한 언어**로 회사명을 출력합니다.
     - 회사명 한글(ko) 정보가 없으면 **노출 가능한 다른 언어**로 자동 대체됩니다.
     - **동일 회사는 한 번만** 결과에 노출됩니다.
+    - **AND / OR / NOT**과 괄호로 여러 태그를 조합할 수 있습니다.
+      (우선순위: NOT > AND > OR, 공백이 있는 태그는 큰따옴표로 감쌉니다)
+    - AND / OR / NOT이 없으면 입력 전체를 태그명 하나로 검색합니다. (ex: "C++ (언어)")
+    - 회사 id 순으로 **limit**개씩 반환하며, 다음 페이지가 있으면 응답 헤더 **x-next-cursor** 값을 **cursor**로 전달합니다.
 
     ---
     **Parameters**
       - **query** (**str**):  
-        검색할 태그명 (예: "タグ_22")
+        검색할 태그명 또는 태그 검색식 (예: "タグ_22", "tag_4 AND tag_16 AND NOT tag_20")
       - **request** (**Request**):
         FastAPI 요청 객체 (헤더에서 언어 정보 추출)
+      - **limit** (**int**): 최대 결과 수 (기본 10, 최대 100)
+      - **cursor** (**str**): 이전 응답의 x-next-cursor 값
 
     **Returns**
       - **List[TagSearchResponse]**:
         검색된 회사명 목록 (중복 없이, 지정 언어로)
 
+    **Error**
+      - **400 Bad Request**:  
+        잘못된 태그 검색식 또는 cursor 값
+
     ---
     **Example Request**
     ```http
@@ -52,11 +67,155 @@ async def search_by_tag_name(
     **Notes**
       - 일본어 태그로 검색해도, 응답은 영어(혹은 원하는 언어)로 반환
       - 지정한 언어가 없는 경우, 노출 가능한 다른 언어명으로 응답
+      - NOT은 긍정 조건과 AND로 묶어서만 사용할 수 있습니다 (예: "tag_4 AND NOT tag_20")
+    """
+    try:
+        after = decode_cursor(cursor, size=1)
+
+        tag_service: TagService = TagService()
+        search_results: Dict[str, Any] = await tag_service.search_by_tag_name(
+            tag_name=query,
+            language=request.headers.get("x-wanted-language"),
+            limit=limit,
+            after=after,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    if search_results["next_cursor"]:
+        response.headers["x-next-cursor"] = search_results["next_cursor"]
+
+    return [TagSearchResponse(company_name=x) for x in search_results["company_names"]]
+
+
+@router.get("/facets")
+async def get_tag_facets(
+    request: Request,
+    limit: int = Query(default=20, ge=1, le=100),
+    tag: Optional[List[str]] = Query(default=None),
+):
+    """
+    📊 태그별 회사 수 조회 API
+
+    - 헤더의 **x-wanted-language** 언어의 태그별 **회사 수**를 반환합니다.
+    - **tag**가 없으면 회사 수가 많은 **상위 태그** limit개를 반환합니다.
+    - **tag**를 여러 번 전달하면 해당 태그들의 회사 수를 요청 순서대로 반환합니다.
+    - 미리 집계한 카운터에서 조회하므로 응답 시간은 태그 수와 무관합니다.
+
+    ---
+    **Parameters**
+      - **request** (**Request**): FastAPI 요청 객체 (헤더에서 언어 정보 추출)
+      - **limit** (**int**): 상위 태그 수 (기본 20, 최대 100)
+      - **tag** (**List[str]**): 회사 수를 조회할 태그명 (예: tag=태그_4&tag=태그_16)
+
+    **Returns**
+      - **List[TagFacetResponse]**: 태그명과 회사 수 목록
+
+    ---
+    **Example Request**
+    ```http
+    GET /tags/facets?limit=2
+    x-wanted-language: ko
+    ```
+
+    **Example Response**
+    ```json
+    [
+      {"tag_name": "태그_4", "company_count": 12},
+      {"tag_name": "태그_16", "company_count": 9}
+    ]
+    ```
+    """
+    tag_service: TagService = TagService()
+    results: List[Dict[str, Any]] = await tag_service.get_tag_facets(
+        language=request.headers.get("x-wanted-language"),
+        limit=limit,
+        tag_names=tag,
+    )
+
+    return [TagFacetResponse(**x) for x in results]
+
+
+@router.get("/autocomplete")
+async def autocomplete_tag_name(
+    request: Request,
+    query: str = Query(min_length=1),
+    limit: int = Query(default=10, ge=1, le=100),
+):
+    """
+    🔎 태그명 자동완성 API
+
+    - 헤더의 **x-wanted-language** 언어의 태그 중 **query로 시작하는** 태그를 검색합니다. (대소문자 무시)
+    - 태그가 등록된 **회사 수가 많은 순**으로 limit개를 반환합니다.
+    - 미리 정렬해 둔 태그명 색인에서 조회하므로 DB를 조회하지 않습니다.
+
+    ---
+    **Parameters**
+      - **request** (**Request**): FastAPI 요청 객체 (헤더에서 언어 정보 추출)
+      - **query** (**str**): 입력 중인 태그명 (예: "태그_1")
+      - **limit** (**int**): 최대 결과 수 (기본 10, 최대 100)
+
+    **Returns**
+      - **List[TagFacetResponse]**: 태그명과 회사 수 목록
+
+    ---
+    **Example Request**
+    ```http
+    GET /tags/autocomplete?query=태그_1
+    x-wanted-language: ko
+    ```
+
+    **Example Response**
+    ```json
+    [
+      {"tag_name": "태그_16", "company_count": 9},
+      {"tag_name": "태그_1", "company_count": 7}
+    ]
+    ```
     """
     tag_service: TagService = TagService()
-    results: List[str] = await tag_service.search_by_tag_name(
-        tag_name=query,
+    results: List[Dict[str, Any]] = await tag_service.autocomplete_tag_name(
+        query=query,
         language=request.headers.get("x-wanted-language"),
+        limit=limit,
     )
 
-    return [TagSearchResponse(company_name=x) for x in results]
\ No newline at end of file
+    return [TagFacetResponse(**x) for x in results]
+
+
+### POST
+@router.post("/facets/rebuild", dependencies=[Depends(require_admin_token)])
+async def rebuild_tag_facets():
+    """
+    📊 태그별 회사 수 재구축 API (관리자)
+
+    - 태그별 회사 수 집계를 **DB 기준으로 다시 계산**합니다.
+    - 다른 프로세스에서 태그를 추가 / 삭제했거나 집계가 어긋난 경우 사용합니다.
+    - 헤더 **x-admin-token**이 설정의 **ADMIN_TOKEN**과 같아야 하며, 아니면 **403**을 반환합니다.
+      (ADMIN_TOKEN이 비어 있으면 항상 403)
+
+    ---
+    **Example Request**
+    ```http
+    POST /tags/facets/rebuild
+    x-wanted-language: ko
+    x-admin-token: <ADMIN_TOKEN>
+    ```
+
+    **Example Response**
+    ```json
+    {
+      "is_loaded": true,
+      "languages": 3,
+      "counters": 300
+    }
+    ```
+    """
+    tag_service: TagService = TagService()
+    results: Dict[str, Any] = await tag_service.rebuild_tag_facets()
+
+    return results
+
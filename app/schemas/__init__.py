@@ -1,19 +1,25 @@
 from app.schemas.search_schema import SearchResponse
 from app.schemas.company_schema import (
+    CompanyBatchItem,
+    CompanyBatchRequest,
     CompanyInfoResponse,
     CompanyRequest,
     CompanyResponse,
 )
 from app.schemas.tag_schema import (
+    TagFacetResponse,
     TagInfo,
     TagSearchResponse,
 )
 
 __all__ = [
     "SearchResponse",
+    "CompanyBatchItem",
+    "CompanyBatchRequest",
     "CompanyInfoResponse",
     "CompanyRequest",
     "CompanyResponse",
+    "TagFacetResponse",
     "TagSearchResponse",
     "TagInfo",
 ]
\ No newline at end of file
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Dict
 
 class TagName(BaseModel):
@@ -14,4 +14,13 @@ class CompanyRequest(BaseModel):
 
 class CompanyResponse(BaseModel):
     company_name: str
-    tags: List[str]
\ No newline at end of file
+    tags: List[str]
+
+class CompanyBatchRequest(BaseModel):
+    company_names: List[str] = Field(..., min_length=1, max_length=500)
+
+class CompanyBatchItem(BaseModel):
+    query: str
+    found: bool
+    company_name: str
+    tags: List[str]
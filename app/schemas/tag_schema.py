@@ -6,4 +6,9 @@ class TagInfo(BaseModel):
 
 
 class TagSearchResponse(BaseModel):
-    company_name: str
\ No newline at end of file
+    company_name: str
+
+
+class TagFacetResponse(BaseModel):
+    tag_name: str
+    company_count: int
@@ -1,5 +1,6 @@
 from app.services.search_service import SearchService
 from app.services.company_service import CompanyService
 from app.services.tag_service import TagService
+from app.services.import_service import ImportService
 
-__all__ = ["SearchService", "CompanyService", "TagService"]
\ No newline at end of file
+__all__ = ["SearchService", "CompanyService", "TagService", "ImportService"]
\ No newline at end of file
@@ -1,7 +1,9 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
-from app.repositories import CompanyRepository
+from app.repositories import CompanyRepository, UnitOfWork
 from app.utils import setup_logger
+from app.services.search_service import search_cache
+from app.services.tag_service import invalidate_tag_search_cache
 
 # Logger
 logger = setup_logger("Company_Service")
@@ -22,34 +24,121 @@ class CompanyService:
         Returns:
             - results (Dict[str, str]): 회사명과 태그 정보
         """
-        results = {
-            "company_name": "",
-            "tags": [],
-        }
-        
         company_repository: CompanyRepository = CompanyRepository()
 
-        # 회사아이디 조회
-        company_id: int = await company_repository.get_company_id_by_company_name(
+        # 색인으로 회사 id를 찾으면 프로필 캐시에서 조회
+        company_id: int = await company_repository.get_company_id_by_indexed_name(
             company_name=company_name,
         )
+        if company_id:
+            return await self._get_company_profile(
+                company_id=company_id,
+                language=language,
+            )
 
+        # 회사명 -> 출력 언어의 회사명, 태그 조회 (단일 쿼리)
+        company_info: Optional[Dict[str, Any]] = await company_repository.get_company_detail(
+            company_name=company_name,
+            language=language,
+        )
+        if company_info is not None:
+            return {
+                "company_name": company_info["company_name"],
+                "tags": company_info["tags"],
+            }
+
+        # 일치하는 회사명이 없으면 오타 허용 검색
+        company_id = await company_repository.get_company_id_by_similar_name(
+            company_name=company_name,
+        )
         if not company_id:
             return None
 
-        # 회사 아이디를 통해 태그 조회
-        company_info = await company_repository.get_company_info_by_company_id(
+        return await self._get_company_profile(
             company_id=company_id,
+            language=language,
         )
 
-        # 결과 반환
-        if language in company_info["company_name"].keys():
-            results["company_name"] = company_info["company_name"][language]
+    async def get_company_infos(
+        self,
+        company_names: List[str],
+        language: str,
+    ):
+        """
+        여러 회사명을 한 번에 조회 (회사명 -> id 1회, id -> 회사 정보 1회)
+            - 요청 순서대로 반환, 없는 회사는 found=False
+            - 오타 허용 검색은 하지 않음
+
+        Args:
+            - company_names (List[str]): 검색할 회사명 목록
+            - language (str): 출력 언어
+
+        Returns:
+            - results (List[Dict[str, Any]]): [{"query", "found", "company_name", "tags"}, ...]
+        """
+        company_repository: CompanyRepository = CompanyRepository()
+
+        company_ids: Dict[str, int] = await company_repository.get_company_ids_by_company_names(
+            company_names=company_names,
+        )
+        company_infos: Dict[int, Dict[str, Any]] = await company_repository.get_company_infos_by_company_ids(
+            company_ids=list(set(company_ids.values())),
+        )
+
+        results: List[Dict[str, Any]] = []
+        for company_name in company_names:
+            company_info = company_infos.get(company_ids.get(company_name))
+            profile = self._localize_company_info(company_info, language) if company_info else None
+            results.append({
+                "query": company_name,
+                "found": profile is not None,
+                "company_name": profile["company_name"] if profile else "",
+                "tags": profile["tags"] if profile else [],
+            })
+
+        return results
+
+    async def _get_company_profile(
+        self,
+        company_id: int,
+        language: str,
+    ):
+        """
+        회사 id로 프로필 캐시를 거쳐 출력 언어의 회사명, 태그 조회
+
+        Returns:
+            - results (Dict[str, str]): 회사명과 태그 정보 (회사가 없으면 None)
+        """
+        company_repository: CompanyRepository = CompanyRepository()
+
+        company_infos: Dict[str, Any] = await company_repository.get_company_info_by_company_id(
+            company_id=company_id,
+        )
+
+        return self._localize_company_info(company_infos, language)
+
+    def _localize_company_info(
+        self,
+        company_infos: Dict[str, Any],
+        language: str,
+    ):
+        """
+        국가별 회사 정보에서 출력 언어의 회사명, 태그만 추출
+
+        Returns:
+            - results (Dict[str, str]): 회사명과 태그 정보 (회사명이 없으면 None)
+        """
+        if not company_infos["company_name"]:
+            return None
+
+        results: Dict[str, Any] = {
+            "company_name": company_infos["company_name"].get(language, ""),
+            "tags": [],
+        }
+        for tag_item in company_infos["tags"]:
+            if language in tag_item.keys() and tag_item.get(language) not in results["tags"]:
+                results["tags"].append(tag_item.get(language))
 
-        for tag_info in company_info["tags"]:
-            if language in tag_info.keys():
-                results["tags"].append(tag_info[language])
-        
         return results
 
     async def add_new_company(
@@ -60,6 +149,8 @@ class CompanyService:
         """
         - 새로운 회사 추가
             - 회사 정보에 새로운 언어가 있다면 추가
+            - 회사, 태그 추가를 하나의 트랜잭션으로 처리 (commit 1번)
+            - 새로운 언어는 그 전에 별도로 추가 (기존 언어만 있으면 DB 조회 없음)
         
         Args:
             - new_company (Dict[str, Any]): 새로운 회사 정보
@@ -77,35 +168,47 @@ class CompanyService:
         company_names: Dict[str, str] = new_company_info["company_name"]
         results["company_name"] = company_names[language]
 
-        # 새로운 언어가 있는지 확인 후 추가
-        await company_repository.add_new_language(
-            input_languages=list(company_names.keys()), 
-        )
-
-        # 새로운 회사 추가
-        new_company_id: int = await company_repository.add_new_company(
-            new_companies=company_names,
-        )
-
-        # Tags
         tags: List[Dict[str, Dict]] = new_company_info["tags"]
+
+        # 새로운 언어가 있는지 확인 후 추가 (회사명, 태그 언어 한 번에)
+        input_languages: List[str] = list(company_names.keys())
         for tag_item in tags:
-            tag_name_obj: Dict[str, str] = tag_item["tag_name"]
-            
-            # 새로운 언어가 있는지 확인 후 추가
-            await company_repository.add_new_language(
-                input_languages=list(tag_name_obj.keys()),
-            )
+            input_languages.extend(tag_item["tag_name"].keys())
+        await company_repository.add_new_language(
+            input_languages=input_languages,
+        )
 
-            # 새로운 태그 추가
-            await company_repository.add_new_tag(
-                company_id=new_company_id,
-                new_tag=tag_name_obj,
+        async with UnitOfWork() as uow:
+            # 새로운 회사 추가
+            new_company_id: int = await company_repository.add_new_company(
+                new_companies=company_names,
+                uow=uow,
             )
 
-            for lang, tag_name in tag_name_obj.items():
-                if lang == language:
-                    results["tags"].append(tag_name)
+            # Tags
+            for tag_item in tags:
+                tag_name_obj: Dict[str, str] = tag_item["tag_name"]
+
+                # 새로운 태그 추가
+                await company_repository.add_new_tag(
+                    company_id=new_company_id,
+                    new_tag=tag_name_obj,
+                    uow=uow,
+                )
+
+                for lang, tag_name in tag_name_obj.items():
+                    if lang == language:
+                        results["tags"].append(tag_name)
+
+            await uow.commit()
+
+        # 캐시 무효화: 새 회사명은 어떤 자동완성 질의에도 걸릴 수 있음
+        search_cache.clear()
+        invalidate_tag_search_cache(
+            tag_name
+            for tag_item in tags
+            for tag_name in tag_item["tag_name"].values()
+        )
         
         return results
     
@@ -118,6 +221,8 @@ class CompanyService:
         """
         5. 회사 태그 정보 추가
             - 저장 완료 후 header의 x-wanted-language 언어값에 따라 해당 언어로 출력
+            - 태그 추가를 하나의 트랜잭션으로 처리 (commit 1번)
+            - 새로운 언어는 그 전에 별도로 추가 (기존 언어만 있으면 DB 조회 없음)
         """
         results: Dict[str, Any] = {
             "company_name": "",
@@ -136,19 +241,31 @@ class CompanyService:
 
         # 해당 회사의 company_id에 태그 추가
         target_compnay_id: int = company_infos[0]["company_id"]
+        # 새로운 언어가 있는지 확인 후 추가 (태그 언어 한 번에)
+        input_languages: List[str] = []
         for tag_item in tags:
-            tag_name_obj: Dict[str, str] = tag_item.tag_name
-            
-            # 새로운 언어가 있는지 확인 후 추가
-            await company_repository.add_new_language(
-                input_languages=list(tag_name_obj.keys()),
-            )
+            input_languages.extend(tag_item.tag_name.keys())
+        await company_repository.add_new_language(
+            input_languages=input_languages,
+        )
 
+        async with UnitOfWork() as uow:
             # 새로운 태그 추가
-            await company_repository.add_new_tag(
-                company_id=target_compnay_id,
-                new_tag=tag_name_obj,
-            )
+            for tag_item in tags:
+                await company_repository.add_new_tag(
+                    company_id=target_compnay_id,
+                    new_tag=tag_item.tag_name,
+                    uow=uow,
+                )
+
+            await uow.commit()
+
+        # 캐시 무효화
+        invalidate_tag_search_cache(
+            tag_name
+            for tag_item in tags
+            for tag_name in tag_item.tag_name.values()
+        )
 
         # 최종 결과
         company_infos: Dict[Dict[str, Any]] = await company_repository.get_company_info_by_company_id(
@@ -199,10 +316,13 @@ class CompanyService:
 
         # 태그 관계 id 사용해 삭제
         if tag_relation_id:
-            await company_repository.delete_tag_info(
+            deleted_tag_names: List[str] = await company_repository.delete_tag_info(
                 tag_rel_id=tag_relation_id,
             )
 
+            # 캐시 무효화
+            invalidate_tag_search_cache(deleted_tag_names)
+
         # 최종 결과 반환
         company_infos = await company_repository.get_company_info_by_company_id(
             company_id=compnay_id,
@@ -0,0 +1,193 @@
+import sys
+import time
+import asyncio
+from typing import List, Dict, Union
+
+from app.repositories import CompanyRepository, ImportRepository
+from app.indexes import language_registry
+from app.utils import setup_logger, settings
+from app.utils.database import db_engine
+from app.utils.parser import Parser, CsvCompnay, CsvCompanyRecord
+
+# Logger
+logger = setup_logger("Import_Service")
+
+# CSV 컬럼 언어
+CSV_LANGUAGES: List[str] = ["ko", "en", "ja"]
+
+
+class ImportService:
+    def _to_new_company(
+        self,
+        item: Union[CsvCompnay, CsvCompanyRecord],
+    ):
+        """
+        CSV 행 -> CompanyService.add_new_company 입력 형식
+            - 빈 회사명은 제외
+            - 태그는 언어별 목록의 같은 위치끼리 묶음
+        """
+        company_names: Dict[str, str] = {
+            "ko": item.company_ko,
+            "en": item.company_en,
+            "ja": item.company_ja,
+        }
+        tag_lists: Dict[str, List[str]] = {
+            "ko": item.tag_ko,
+            "en": item.tag_en,
+            "ja": item.tag_ja,
+        }
+
+        tags: List[Dict[str, Dict[str, str]]] = []
+        for idx in range(max(len(x) for x in tag_lists.values())):
+            tags.append({
+                "tag_name": {
+                    lang: tag_list[idx]
+                    for lang, tag_list in tag_lists.items()
+                    if idx < len(tag_list) and tag_list[idx]
+                },
+            })
+
+        return {
+            "company_name": {lang: name for lang, name in company_names.items() if name},
+            "tags": tags,
+        }
+
+    async def _import_records(
+        self,
+        records: List[Union[CsvCompnay, CsvCompanyRecord]],
+        batch_size: int,
+        language_ids: Dict[str, int],
+    ):
+        """
+        행을 batch_size 회사씩 하나의 트랜잭션으로 COPY
+
+        Returns:
+            - Dict[str, int]: 테이블별 추가된 행 수
+        """
+        import_repository = ImportRepository()
+        table_rows: Dict[str, int] = {}
+        for start in range(0, len(records), batch_size):
+            batch_rows: Dict[str, int] = await import_repository.bulk_add_companies(
+                new_companies=[self._to_new_company(item) for item in records[start:start + batch_size]],
+                language_ids=language_ids,
+            )
+            for table_name, count in batch_rows.items():
+                table_rows[table_name] = table_rows.get(table_name, 0) + count
+
+        return table_rows
+
+    async def import_csv(
+        self,
+        file_path: str,
+        batch_size: int = settings.IMPORT_BATCH_SIZE,
+        workers: int = settings.IMPORT_PARSE_WORKERS,
+    ):
+        """
+        CSV 파일의 회사 / 태그 대량 추가
+            - batch_size 회사씩 파싱하면서 배치마다 하나의 트랜잭션으로 COPY
+                -> 파일 전체를 메모리에 올리지 않음
+            - workers > 1 이면 파일을 바이트 범위로 나눠 프로세스마다 파싱 + COPY (Parser.map_csv_ranges)
+                - 범위끼리 동시에 적재되므로 회사 id 순서는 범위 안에서만 파일 순서와 같음
+            - 실행 중인 애플리케이션의 인메모리 색인은 재시작 또는 재구축 시 반영
+
+        Args:
+            - file_path (str): CSV 파일 경로 (company_tag_sample.csv 형식)
+            - batch_size (int): 트랜잭션당 회사 수
+            - workers (int): CSV 파싱 / 적재 프로세스 수
+
+        Returns:
+            - Dict[str, Any]: 추가된 회사 / 행 수, 소요 시간, 초당 처리량
+        """
+        started_at: float = time.perf_counter()
+
+        # 언어 등록 (한 번)
+        await CompanyRepository().add_new_language(input_languages=CSV_LANGUAGES)
+        language_ids: Dict[str, int] = language_registry.get_ids(CSV_LANGUAGES)
+
+        # 배치별 파싱 + COPY
+        parser = Parser()
+        if workers > 1:
+            results = parser.map_csv_ranges(
+                file_path,
+                _import_range,
+                batch_size,
+                language_ids,
+                workers=workers,
+            )
+        else:
+            results = (
+                (len(records), await self._import_records(records, batch_size, language_ids))
+                async for records in parser.iter_csv_batches(file_path, batch_size=batch_size)
+            )
+
+        companies: int = 0
+        table_rows: Dict[str, int] = {}
+        async for record_count, batch_rows in results:
+            for table_name, count in batch_rows.items():
+                table_rows[table_name] = table_rows.get(table_name, 0) + count
+
+            companies += record_count
+            logger.info(f"[IMPORT] {companies} companies")
+
+        elapsed: float = time.perf_counter() - started_at
+        rows: int = sum(table_rows.values())
+
+        return {
+            "companies": companies,
+            "rows": rows,
+            "table_rows": table_rows,
+            "seconds": elapsed,
+            "companies_per_second": (companies / elapsed) if elapsed else 0.0,
+            "rows_per_second": (rows / elapsed) if elapsed else 0.0,
+        }
+
+
+def _import_range(
+    records: List[CsvCompanyRecord],
+    batch_size: int,
+    language_ids: Dict[str, int],
+):
+    """
+    프로세스 풀 작업: 파싱한 범위의 행 COPY (작업마다 새 이벤트 루프, 끝나면 DB 연결 정리)
+
+    Returns:
+        - Tuple[int, Dict[str, int]]: (행 수, 테이블별 추가된 행 수)
+    """
+    async def run():
+        try:
+            return await ImportService()._import_records(records, batch_size, language_ids)
+        finally:
+            await db_engine.dispose()
+
+    return len(records), asyncio.run(run())
+
+
+async def main(argv: List[str]):
+    options: Dict[str, int] = {
+        "--batch-size": settings.IMPORT_BATCH_SIZE,
+        "--workers": settings.IMPORT_PARSE_WORKERS,
+    }
+    for option in options:
+        if option in argv:
+            idx = argv.index(option)
+            options[option] = int(argv[idx + 1])
+            argv = argv[:idx] + argv[idx + 2:]
+    file_path: str = argv[0] if argv else "./company_tag_sample.csv"
+
+    results = await ImportService().import_csv(
+        file_path,
+        batch_size=options["--batch-size"],
+        workers=options["--workers"],
+    )
+    print(f"companies: {results['companies']}, rows: {results['rows']} {results['table_rows']}")
+    print(
+        f"{results['seconds']:.2f}s, "
+        f"{results['companies_per_second']:,.0f} companies/s ({results['companies_per_second'] * 60:,.0f}/min), "
+        f"{results['rows_per_second']:,.0f} rows/s"
+    )
+    return 0
+
+### MAIN
+# python -m app.services.import_service ./company_tag_sample.csv [--batch-size 10000] [--workers 4]
+if "__main__" == __name__:
+    sys.exit(asyncio.run(main(sys.argv[1:])))
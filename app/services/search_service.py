@@ -1,8 +1,9 @@
 from sqlalchemy import select
-from typing import List
+from typing import List, Dict, Any, Tuple, Optional
 
 from app.repositories import SearchRepository
-from app.utils import get_db, setup_logger
+from app.utils import get_db, setup_logger, settings
+from app.utils.cache import LRUCache
 from app.models import (
     CompanyName,
     Language,
@@ -11,27 +12,50 @@ from app.models import (
 # Logger 
 logger = setup_logger("Search_Service")
 
+# 자동완성 결과 캐시 (회사 추가 시 전체 무효화)
+search_cache: LRUCache = LRUCache(
+    max_size=settings.SEARCH_CACHE_SIZE,
+    ttl_seconds=settings.SEARCH_CACHE_TTL,
+)
+
 
 class SearchService:
     async def search_company_name(
         self,
         company_name: str,
         language: str,
+        limit: int = 10,
+        after: Optional[Tuple[int, int, int]] = None,
     ):
         """
         회사명 자동완성
             - 회사명의 일부만 들어가도 검색이 되어야 한다.
+            - 관련도 순으로 limit개씩 반환
+            - (query, language, limit, cursor) 단위로 캐시
         
         Args:
             - query (str): 검색할 회사명
             - language (str): 출력 언어
+            - limit (int): 최대 결과 수
+            - after (Tuple[int, int, int]): 이전 페이지 마지막 정렬 키 (cursor)
         
         Returns:
-            - List[str]: 검색된 회사명 리스트
+            - Dict[str, Any]: 검색된 회사명 리스트와 다음 페이지 커서
         """
+        cache_key = (company_name, language, limit, after)
+        results: Optional[Dict[str, Any]] = search_cache.get(cache_key)
+        if results is not None:
+            return results
+
+        # 조회 중에 회사가 추가되면 저장하지 않음
+        generation: int = search_cache.generation()
         search_repository = SearchRepository()
         results = await search_repository.search_company_name(
             company_name=company_name,
             language=language,
+            limit=limit,
+            after=after,
         )
-        return results
\ No newline at end of file
+
+        search_cache.set(cache_key, results, generation=generation)
+        return results
@@ -1,8 +1,11 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 from sqlalchemy import select
 
 from app.repositories import TagRepository
-from app.utils import get_db, setup_logger
+from app.utils import get_db, setup_logger, settings
+from app.utils.cache import LRUCache
+from app.utils.tag_query import TagQuery, parse_tag_query, tag_names
+from app.indexes import normalize_tag, tag_index, tag_facets
 from app.models import (
     CompanyName,
     Language,
@@ -12,11 +15,36 @@ from app.models import (
 # Logger
 logger = setup_logger("Tag_Service")
 
+# 태그 검색 결과 캐시 (검색한 태그명이 추가/삭제될 때 무효화, 정규화된 태그명 기준)
+tag_search_cache: LRUCache = LRUCache(
+    max_size=settings.TAG_SEARCH_CACHE_SIZE,
+    ttl_seconds=settings.TAG_SEARCH_CACHE_TTL,
+)
+
+
+def invalidate_tag_search_cache(tag_names: Iterable[str]):
+    """
+    태그 추가 / 삭제 후 태그 검색 캐시 무효화
+        - 태그 역색인이 있으면 같은 의미의 다른 언어 태그명 검색 결과까지 무효화
+        - 없으면(TAG_SEARCH_MODE=db) 같은 의미의 태그명을 알 수 없으므로 전체 무효화
+    """
+    if not tag_index.is_loaded:
+        tag_search_cache.clear()
+        return
+
+    tag_search_cache.invalidate({
+        equivalent_name
+        for tag_name in tag_names
+        for equivalent_name in tag_index.equivalent_tags(tag_name)
+    })
+
 class TagService:
     async def search_by_tag_name(
         self,
         tag_name: str,
         language: str,
+        limit: int = 10,
+        after: Optional[Tuple[int]] = None,
     ):
         """
         4. 태그명으로 회사이름 검색
@@ -25,36 +53,117 @@ class TagService:
             - 일본어 태그 검색 해도 x-wanted-language 언어값에 따라 해당 언어로 출력
             - ko가 없는 경우 노출가능한 언어로 출력
             - 동일한 회사는 한 번만 노출
+            - 태그 검색식(AND / OR / NOT, 괄호) 지원 (ex: "tag_4 AND tag_16 AND NOT tag_20")
+            - 회사 id 순으로 limit개씩 반환
+            - (tag_name, language, limit, cursor) 단위로 캐시
 
         Args:
-            - tag_name (str): 검색할 태그명
+            - tag_name (str): 검색할 태그명 또는 태그 검색식
             - language (str): 출력 언어
+            - limit (int): 최대 결과 수
+            - after (Tuple[int]): 이전 페이지 마지막 회사 id (cursor)
 
         Returns:
-            - List[str]: 검색된 회사이름 리스트
+            - Dict[str, Any]: 검색된 회사이름 리스트와 다음 페이지 커서
+
+        Raises:
+            - ValueError: 잘못된 태그 검색식
         """
+        cache_key = (tag_name, language, limit, after)
+        results: Optional[Dict[str, Any]] = tag_search_cache.get(cache_key)
+        if results is not None:
+            return results
 
-        tag_repository = TagRepository()
+        # 조회 중에 태그가 추가/삭제되면 저장하지 않음
+        generation: int = tag_search_cache.generation()
+        tag_query: TagQuery = parse_tag_query(tag_name)
 
-        # Tag명에 연관된 회사 id 조회
-        company_ids: List[int] = await tag_repository.get_company_id_by_tag_name(
-            tag_name=tag_name,
+        # 태그 검색식 -> 회사명 (단일 쿼리)
+        tag_repository = TagRepository()
+        results = await tag_repository.search_company_name_by_tag_query(
+            tag_query=tag_query,
+            language=language,
+            limit=limit,
+            after=after[0] if after else None,
         )
 
-        # 회사 id를 통해 회사 정보 조회
-        company_names: Dict[int, Any] = await tag_repository.get_company_name_by_company_id(
-            company_ids=company_ids,
+        tag_search_cache.set(
+            cache_key,
+            results,
+            dependencies=[normalize_tag(x) for x in tag_names(tag_query)],
+            generation=generation,
         )
-        
-        # 결과 반환
-        results: List[str] = []
-        for cmpany_id, company_names in company_names.items():
-            if language in company_names.keys():
-                results.append(company_names[language])
-            else:
-                for key, val in company_names.items():
-                    if val:
-                        results.append(val)
-                        break
-
-        return results
\ No newline at end of file
+        return results
+
+    async def get_tag_facets(
+        self,
+        language: str,
+        limit: int = 20,
+        tag_names: Optional[List[str]] = None,
+    ):
+        """
+        언어별 태그 회사 수 조회 (인메모리 집계, DB 조회 없음)
+            - tag_names가 없으면 회사 수가 많은 태그 limit개
+            - tag_names가 있으면 해당 태그들의 회사 수 (요청 순서대로)
+
+        Args:
+            - language (str): 태그 언어
+            - limit (int): 최대 결과 수
+            - tag_names (List[str]): 회사 수를 조회할 태그명 목록
+
+        Returns:
+            - List[Dict[str, Any]]: [{"tag_name", "company_count"}, ...]
+        """
+        if not tag_facets.is_loaded:
+            await TagRepository().load_tag_facets()
+
+        if tag_names:
+            facets: List[Tuple[str, int]] = [
+                (tag_name, tag_facets.count(language, tag_name))
+                for tag_name in dict.fromkeys(tag_names)
+            ]
+        else:
+            facets = tag_facets.top(language, limit)
+
+        return [
+            {"tag_name": tag_name, "company_count": company_count}
+            for tag_name, company_count in facets
+        ]
+
+    async def autocomplete_tag_name(
+        self,
+        query: str,
+        language: str,
+        limit: int = 10,
+    ):
+        """
+        태그명 자동완성 (인메모리 접두 색인, DB 조회 없음)
+            - 출력 언어의 태그 중 query로 시작하는 태그 (대소문자 무시)
+            - 회사 수가 많은 순으로 limit개
+
+        Args:
+            - query (str): 입력 중인 태그명
+            - language (str): 태그 언어
+            - limit (int): 최대 결과 수
+
+        Returns:
+            - List[Dict[str, Any]]: [{"tag_name", "company_count"}, ...]
+        """
+        if not tag_facets.is_loaded:
+            await TagRepository().load_tag_facets()
+
+        return [
+            {"tag_name": tag_name, "company_count": company_count}
+            for tag_name, company_count in tag_facets.autocomplete(language, query, limit)
+        ]
+
+    async def rebuild_tag_facets(self):
+        """
+        언어별 태그 회사 수 집계를 DB 기준으로 재구축
+
+        Returns:
+            - Dict[str, Any]: 재구축 후 집계 통계
+        """
+        await TagRepository().load_tag_facets()
+        return tag_facets.stats()
+
@@ -0,0 +1,27 @@
+import secrets
+from typing import Optional
+
+from fastapi import Header, HTTPException, status
+
+from app.utils.settings import settings
+
+
+async def require_admin_token(
+    x_admin_token: Optional[str] = Header(None),
+):
+    """
+    관리 API 인증 (FastAPI 의존성)
+        - 헤더 x-admin-token이 settings.ADMIN_TOKEN과 같아야 함
+        - ADMIN_TOKEN이 비어 있으면 관리 API 비활성화
+
+    Raises:
+        - HTTPException(403): 토큰이 없거나 다름, 또는 관리 API 비활성화
+    """
+    if not settings.ADMIN_TOKEN or not x_admin_token or not secrets.compare_digest(
+        x_admin_token.encode("utf-8"),
+        settings.ADMIN_TOKEN.encode("utf-8"),
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="admin token is required",
+        )
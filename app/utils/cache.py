@@ -0,0 +1,335 @@
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+
+class LRUCache:
+    """
+    LRU + TTL 캐시
+        - max_size 초과 시 가장 오래 사용하지 않은 항목부터 제거
+        - ttl_seconds가 지난 항목은 조회 시 만료 처리
+        - 항목별 의존 키(dependencies)를 받아 해당 키가 바뀔 때만 무효화
+        - 조회 전에 받은 세대(generation)로 저장 -> 조회 중에 무효화가 끼어들면 오래된 값은 저장되지 않음
+        - 프로세스 단위 캐시
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+    ):
+        self.max_size: int = max_size
+        self.ttl_seconds: float = ttl_seconds
+
+        # key -> (만료 시각, 값, 의존 키)
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any, Tuple[Hashable, ...]]]" = OrderedDict()
+
+        # 의존 키 -> 캐시 key 집합
+        self._dependents: Dict[Hashable, Set[Hashable]] = {}
+
+        # invalidate / clear 마다 증가
+        self._generation: int = 0
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+        self.invalidations: int = 0
+        self.stale: int = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(
+        self,
+        key: Hashable,
+        default: Any = None,
+    ):
+        """
+        캐시 조회 (없거나 만료되면 default)
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        expires_at, value, _ = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return default
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def generation(self):
+        """
+        현재 세대 (조회 전에 받아서 set에 전달)
+        """
+        return self._generation
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        dependencies: Iterable[Hashable] = (),
+        generation: Optional[int] = None,
+    ):
+        """
+        캐시 저장
+
+        Args:
+            - key: 캐시 key
+            - value: 저장할 값
+            - dependencies: 값이 의존하는 키 (invalidate 대상)
+            - generation: 조회 전에 받은 세대 (그 사이 invalidate / clear 가 있었으면 저장하지 않음)
+        """
+        if self.max_size <= 0:
+            return
+
+        if generation is not None and generation != self._generation:
+            self.stale += 1
+            return
+
+        if key in self._entries:
+            self._remove(key)
+
+        dependencies = tuple(dependencies)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value, dependencies)
+        for dependency in dependencies:
+            self._dependents.setdefault(dependency, set()).add(key)
+
+        while len(self._entries) > self.max_size:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+    def invalidate(
+        self,
+        dependencies: Iterable[Hashable],
+    ):
+        """
+        의존 키가 바뀐 항목만 무효화
+        """
+        self._generation += 1
+        for dependency in dependencies:
+            for key in list(self._dependents.get(dependency, ())):
+                self._remove(key)
+                self.invalidations += 1
+
+    def clear(self):
+        """
+        전체 무효화
+        """
+        self._generation += 1
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+        self._dependents.clear()
+
+    def _remove(
+        self,
+        key: Hashable,
+    ):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        for dependency in entry[2]:
+            keys = self._dependents.get(dependency)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self._dependents[dependency]
+
+    def stats(self):
+        """
+        캐시 통계
+
+        Returns:
+            - Dict[str, Any]: 크기, 적중/실패/제거/만료/무효화/세대 불일치 횟수, 적중률
+        """
+        requests: int = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": (self.hits / requests) if requests else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "stale": self.stale,
+        }
+
+
+def estimate_size(obj: Any):
+    """
+    객체의 대략적인 메모리 사용량 (bytes)
+        - dict / list / tuple / set 내부까지 합산
+    """
+    size: int = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(estimate_size(k) + estimate_size(v) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(x) for x in obj)
+
+    return size
+
+
+class VersionedCache:
+    """
+    버전 기반 read-through 캐시
+        - key별 버전을 두고, 쓰기 시 bump로 버전을 올려 기존 항목을 무효화
+        - 읽기 전에 받은 버전으로만 저장 -> 조회 중에 쓰기가 끼어들면 오래된 값은 저장되지 않음
+        - 전체 메모리 사용량이 max_bytes를 넘으면 LRU 순으로 제거
+        - 버전은 한 번만 쓰이는 증가 값 -> 항목이 없는 key의 버전은 주기적으로 정리
+            - 정리된 key는 기본 버전(정리 시점의 새 값)을 받으므로 정리 이전에 받은 버전으로는 저장되지 않음
+        - 프로세스 단위 캐시 (다른 프로세스의 쓰기는 ttl_seconds 후 반영)
+    """
+
+    # 버전 정리 기준 (항목 수의 2배 또는 이 값 중 큰 쪽을 넘으면 정리)
+    MIN_VERSIONS: int = 1024
+
+    def __init__(
+        self,
+        max_bytes: int,
+        ttl_seconds: float,
+    ):
+        self.max_bytes: int = max_bytes
+        self.ttl_seconds: float = ttl_seconds
+
+        # key -> (버전, 만료 시각, 값, 크기)
+        self._entries: "OrderedDict[Hashable, Tuple[int, float, Any, int]]" = OrderedDict()
+        self._versions: Dict[Hashable, int] = {}
+        self._clock: int = 0
+        self._default_version: int = 0
+        self._memory_bytes: int = 0
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.stale: int = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def version(
+        self,
+        key: Hashable,
+    ):
+        """
+        현재 버전 (조회 전에 받아서 set에 전달)
+        """
+        return self._versions.get(key, self._default_version)
+
+    def bump(
+        self,
+        key: Hashable,
+    ):
+        """
+        버전 증가 (commit 이후 호출)
+        """
+        self._clock += 1
+        self._versions[key] = self._clock
+        self._remove(key)
+        self._prune_versions()
+
+    def get(
+        self,
+        key: Hashable,
+        default: Any = None,
+    ):
+        """
+        캐시 조회 (없거나 버전이 다르거나 만료되면 default)
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        version, expires_at, value, _ = entry
+        if version != self.version(key) or expires_at <= time.monotonic():
+            self._remove(key)
+            self.stale += 1
+            self.misses += 1
+            return default
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        version: int,
+    ):
+        """
+        캐시 저장 (조회 전에 받은 버전이 현재 버전과 같을 때만)
+        """
+        if version != self.version(key):
+            self.stale += 1
+            return
+
+        size: int = estimate_size(value)
+        if size > self.max_bytes:
+            return
+
+        self._remove(key)
+        self._entries[key] = (version, time.monotonic() + self.ttl_seconds, value, size)
+        self._versions[key] = version
+        self._memory_bytes += size
+
+        while self._memory_bytes > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+        self._prune_versions()
+
+    def _remove(
+        self,
+        key: Hashable,
+    ):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._memory_bytes -= entry[3]
+
+    def _prune_versions(self):
+        """
+        항목이 없는 key의 버전 정리 (제거 / 만료 / bump 된 key)
+            - 기본 버전을 지금까지 쓰인 적 없는 값으로 올림
+                -> 정리 이전에 받은 버전으로 조회 중인 요청은 저장되지 않음 (버전 불일치)
+            - 남은 항목은 저장 시 버전이 기록되어 있으므로 영향 없음
+        """
+        if len(self._versions) <= max(2 * len(self._entries), self.MIN_VERSIONS):
+            return
+
+        self._clock += 1
+        self._default_version = self._clock
+        self._versions = {key: self._versions[key] for key in self._entries}
+
+    def stats(self):
+        """
+        캐시 통계
+
+        Returns:
+            - Dict[str, Any]: 항목 수, 버전 수, 메모리 사용량, 적중/실패/제거/버전 불일치 횟수, 적중률
+        """
+        requests: int = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "versions": len(self._versions),
+            "memory_bytes": self._memory_bytes,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": (self.hits / requests) if requests else 0.0,
+            "evictions": self.evictions,
+            "stale": self.stale,
+        }
@@ -0,0 +1,50 @@
+import base64
+from typing import Tuple, Optional
+
+
+def encode_cursor(key: Tuple[int, ...]):
+    """
+    페이지네이션 커서 생성
+        - 마지막 결과의 정렬 키(정수 튜플)를 URL-safe 문자열로 변환
+
+    Args:
+        - key (Tuple[int, ...]): 정렬 키
+
+    Returns:
+        - str: 커서 문자열
+    """
+    raw: str = ":".join(str(x) for x in key)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(
+    cursor: Optional[str],
+    size: int,
+):
+    """
+    페이지네이션 커서 해석
+
+    Args:
+        - cursor (str): encode_cursor로 만든 커서 문자열
+        - size (int): 정렬 키 길이
+
+    Returns:
+        - Tuple[int, ...]: 정렬 키 (cursor가 없으면 None)
+
+    Raises:
+        - ValueError: 잘못된 커서
+    """
+    if not cursor:
+        return None
+
+    try:
+        padded: str = cursor + "=" * (-len(cursor) % 4)
+        raw: str = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        key: Tuple[int, ...] = tuple(int(x) for x in raw.split(":"))
+    except Exception as e:
+        raise ValueError(f"invalid cursor: {cursor}") from e
+
+    if len(key) != size:
+        raise ValueError(f"invalid cursor: {cursor}")
+
+    return key
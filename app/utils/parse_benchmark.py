@@ -0,0 +1,111 @@
+import os
+import sys
+import time
+import random
+import asyncio
+import tempfile
+from typing import List, Dict, Any
+
+from app.utils.parser import Parser, CSV_COLUMNS
+
+
+def generate_csv(
+    file_path: str,
+    size_bytes: int,
+    seed: int = 0,
+):
+    """
+    company_tag_sample.csv 형식의 벤치마크용 CSV 생성 (size_bytes 이상이 될 때까지)
+    """
+    rng = random.Random(seed)
+    with open(file_path, "w", encoding="utf-8", newline="") as fp:
+        fp.write(",".join(CSV_COLUMNS) + "\n")
+
+        company_no: int = 0
+        while fp.tell() < size_bytes:
+            lines: List[str] = []
+            for _ in range(10000):
+                company_no += 1
+                tag_nos = rng.sample(range(1, 1000), rng.randint(1, 6))
+                lines.append(",".join([
+                    f"회사_{company_no}",
+                    f"company_{company_no}",
+                    f"会社_{company_no}" if company_no % 3 else "",
+                    "|".join(f"태그_{x}" for x in tag_nos),
+                    "|".join(f"tag_{x}" for x in tag_nos),
+                    "|".join(f"タグ_{x}" for x in tag_nos),
+                ]))
+            fp.write("\n".join(lines) + "\n")
+
+
+async def measure(
+    file_path: str,
+    workers: int,
+    batch_size: int,
+):
+    """
+    파싱 처리량 측정
+        - workers가 0이면 단일 프로세스 스트리밍 파서 (iter_csv_batches)
+        - 그 외에는 프로세스 풀 (map_csv_ranges, 범위별 행 수만 돌려받음)
+
+    Returns:
+        - Dict[str, Any]: 행 수, 소요 시간, 초당 행 수, 초당 MB
+    """
+    parser = Parser()
+    rows: int = 0
+    started_at: float = time.perf_counter()
+    if workers == 0:
+        async for batch in parser.iter_csv_batches(file_path, batch_size=batch_size):
+            rows += len(batch)
+    else:
+        async for record_count in parser.map_csv_ranges(file_path, len, workers=workers):
+            rows += record_count
+    elapsed: float = time.perf_counter() - started_at
+
+    size_mb: float = os.path.getsize(file_path) / 1024 / 1024
+    return {
+        "rows": rows,
+        "seconds": elapsed,
+        "rows_per_second": rows / elapsed,
+        "mb_per_second": size_mb / elapsed,
+    }
+
+
+async def main(argv: List[str]):
+    options: Dict[str, str] = {
+        "--size-mb": "2048",
+        "--workers": "1,2,4,8",
+        "--batch-size": "10000",
+        "--file": "",
+    }
+    for option in options:
+        if option in argv:
+            options[option] = argv[argv.index(option) + 1]
+
+    file_path: str = options["--file"] or os.path.join(tempfile.gettempdir(), f"parse_benchmark_{options['--size-mb']}mb.csv")
+    size_bytes: int = int(options["--size-mb"]) * 1024 * 1024
+    if not os.path.exists(file_path) or os.path.getsize(file_path) < size_bytes:
+        print(f"generate {file_path} ({options['--size-mb']} MB)")
+        generate_csv(file_path, size_bytes)
+
+    print(f"cpu: {os.cpu_count()}, file: {file_path} ({os.path.getsize(file_path) / 1024 / 1024:,.0f} MB)")
+
+    # 기준: 단일 프로세스 스트리밍 파서
+    results: Dict[int, Dict[str, Any]] = {0: await measure(file_path, 0, int(options["--batch-size"]))}
+    for workers in [int(x) for x in options["--workers"].split(",")]:
+        results[workers] = await measure(file_path, workers, int(options["--batch-size"]))
+
+    base: Dict[str, Any] = results[min(x for x in results if x > 0)] if len(results) > 1 else results[0]
+    for workers, result in results.items():
+        label: str = "streaming" if workers == 0 else f"{workers} workers"
+        print(
+            f"{label:>12}: {result['rows']:,} rows, {result['seconds']:.2f}s, "
+            f"{result['rows_per_second']:,.0f} rows/s, {result['mb_per_second']:,.1f} MB/s, "
+            f"speedup x{base['seconds'] / result['seconds']:.2f}"
+        )
+    return 0
+
+### MAIN
+# python -m app.utils.parse_benchmark [--size-mb 2048] [--workers 1,2,4,8] [--batch-size 10000] [--file path]
+if "__main__" == __name__:
+    sys.exit(asyncio.run(main(sys.argv[1:])))
@@ -1,27 +1,138 @@
+import io
 import os
 import csv
-from typing import List
+import asyncio
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Deque, List, Optional, TextIO, Tuple
 from pydantic import BaseModel
 
+# CSV 필수 컬럼
+CSV_COLUMNS: List[str] = ["company_ko", "company_en", "company_ja", "tag_ko", "tag_en", "tag_ja"]
+
 
 class CsvCompnay(BaseModel):
     company_ko: str
     company_en: str
     company_ja: str
-    
+
+    tag_ko: List[str]
+    tag_en: List[str]
+    tag_ja: List[str]
+
+
+@dataclass(slots=True)
+class CsvCompanyRecord:
+    """
+    CSV 한 행 (대량 파싱용, 검증은 헤더 확인으로 대신)
+        - CsvCompnay와 같은 필드, 행마다 BaseModel을 만들지 않음
+    """
+    company_ko: str
+    company_en: str
+    company_ja: str
+
     tag_ko: List[str]
     tag_en: List[str]
     tag_ja: List[str]
 
 
+def _read_records(
+    reader,
+    columns: List[int],
+    limit: Optional[int] = None,
+):
+    """
+    csv.reader 행 -> CsvCompanyRecord (limit개까지, 빈 줄 건너뛰기)
+
+    Raises:
+        - ValueError: 컬럼 수가 모자란 행
+    """
+    company_ko, company_en, company_ja, tag_ko, tag_en, tag_ja = columns
+    width: int = max(columns) + 1
+
+    records: List[CsvCompanyRecord] = []
+    for row in reader:
+        if len(row) < width:
+            if not any(row):
+                continue
+            raise ValueError(f"invalid csv row (line {reader.line_num}): expected {width} columns")
+
+        records.append(CsvCompanyRecord(
+            row[company_ko],
+            row[company_en],
+            row[company_ja],
+            row[tag_ko].split("|"),
+            row[tag_en].split("|"),
+            row[tag_ja].split("|"),
+        ))
+        if limit is not None and len(records) >= limit:
+            break
+
+    return records
+
+
+def _map_range(
+    func: Callable,
+    file_path: str,
+    start: int,
+    end: int,
+    columns: List[int],
+    args: Tuple,
+):
+    """
+    파일의 [start, end) 바이트 범위를 파싱해서 func(records, *args) 실행 (프로세스 풀 작업)
+        - 범위는 줄바꿈 기준으로 나뉘어 있어야 함
+    """
+    with open(file_path, "rb") as fp:
+        fp.seek(start)
+        text: str = fp.read(end - start).decode("utf-8")
+
+    try:
+        records: List[CsvCompanyRecord] = _read_records(csv.reader(io.StringIO(text, newline="")), columns)
+    except ValueError as e:
+        raise ValueError(f"{e} in bytes {start}-{end}") from None
+
+    return func(records, *args)
+
+
+def _split_ranges(
+    file_path: str,
+    chunk_bytes: int,
+):
+    """
+    헤더 이후를 약 chunk_bytes 크기의 줄바꿈 기준 바이트 범위로 나눔
+
+    Returns:
+        - List[Tuple[int, int]]: (start, end) 리스트 (파일 순서)
+    """
+    ranges: List[Tuple[int, int]] = []
+    with open(file_path, "rb") as fp:
+        fp.readline() # header
+        start: int = fp.tell()
+        file_size: int = os.fstat(fp.fileno()).st_size
+
+        while start < file_size:
+            fp.seek(min(start + chunk_bytes, file_size))
+            fp.readline() # 다음 줄바꿈까지
+            end: int = min(fp.tell(), file_size)
+            ranges.append((start, end))
+            start = end
+
+    return ranges
+
+
 class Parser:
-    async def parse_csv_by_file_path(self, file_path: str):
-        company_lists: List[CsvCompnay] = []
-       
+    def _get_abs_path(self, file_path: str):
         # 파일 경로가 상대 경로인 경우 현재 작업 디렉토리 기준으로 절대 경로로 변환
         if not os.path.isabs(file_path):
             file_path = os.path.join(os.getcwd(), file_path)
-        
+        return file_path
+
+    def _parse_all(self, file_path: str):
+        company_lists: List[CsvCompnay] = []
+
         with open(file_path, "r", encoding="utf-8") as fp:
             reader = csv.DictReader(fp)
             for row in reader:
@@ -39,14 +150,121 @@ class Parser:
 
         return company_lists
 
+    async def parse_csv_by_file_path(self, file_path: str):
+        """
+        CSV 파일 전체 파싱 (파일 I/O는 스레드에서 실행)
+
+        Returns:
+            - List[CsvCompnay]: 전체 행
+        """
+        return await asyncio.to_thread(self._parse_all, self._get_abs_path(file_path))
+
+    def _open_csv(self, file_path: str):
+        fp: TextIO = open(file_path, "r", encoding="utf-8", newline="")
+        try:
+            reader = csv.reader(fp)
+            header: Optional[List[str]] = next(reader, None)
+            missing_columns: List[str] = [x for x in CSV_COLUMNS if x not in (header or [])]
+            if missing_columns:
+                raise ValueError(f"invalid csv header: missing {missing_columns}")
+        except Exception:
+            fp.close()
+            raise
+
+        return fp, reader, [header.index(x) for x in CSV_COLUMNS]
+
+    async def iter_csv_batches(
+        self,
+        file_path: str,
+        batch_size: int = 1000,
+    ):
+        """
+        CSV 파일을 batch_size 행씩 나눠서 파싱 (async iterator)
+            - 파일 열기 / 읽기는 스레드에서 실행 -> 이벤트 루프를 막지 않음
+            - 한 번에 한 배치만 메모리에 유지 -> 메모리 사용량은 파일 크기가 아닌 배치 크기에 비례
+            - 행마다 BaseModel 대신 slots dataclass(CsvCompanyRecord) 생성, 헤더는 한 번만 확인
+
+        Args:
+            - file_path (str): CSV 파일 경로
+            - batch_size (int): 배치당 행 수
+
+        Returns:
+            - AsyncIterator[List[CsvCompanyRecord]]: 행 배치
+
+        Raises:
+            - ValueError: 필수 컬럼이 없는 헤더, 컬럼 수가 모자란 행
+        """
+        fp, reader, columns = await asyncio.to_thread(self._open_csv, self._get_abs_path(file_path))
+        try:
+            while True:
+                batch: List[CsvCompanyRecord] = await asyncio.to_thread(_read_records, reader, columns, batch_size)
+                if not batch:
+                    break
+                yield batch
+        finally:
+            fp.close()
+
+    async def map_csv_ranges(
+        self,
+        file_path: str,
+        func: Callable,
+        *args,
+        workers: Optional[int] = None,
+        chunk_bytes: int = 8 * 1024 * 1024,
+    ):
+        """
+        CSV 파일을 프로세스 풀에서 나눠 파싱하고, 범위마다 같은 프로세스에서 func(records, *args) 실행
+            - 헤더 이후를 약 chunk_bytes 크기의 줄바꿈 기준 바이트 범위로 나눔
+            - 파싱한 행(Python 객체)은 프로세스 밖으로 보내지 않고 func의 결과만 돌려받음
+                -> 행을 부모 프로세스로 보내면 pickle 복원 비용이 파싱 비용보다 커서 코어 수만큼 빨라지지 않음
+            - func 결과는 파일 순서대로 생성 (실행 순서는 범위끼리 겹칠 수 있음)
+            - 동시에 처리 중인 범위는 workers * 2개까지 -> 메모리 사용량은 chunk_bytes * workers에 비례
+            - 프로세스는 spawn으로 시작 (부모의 DB 연결, 이벤트 루프를 물려받지 않음)
+            - 따옴표 안에 줄바꿈이 있는 CSV는 범위 경계가 어긋날 수 있으므로 iter_csv_batches 사용
+
+        Args:
+            - file_path (str): CSV 파일 경로
+            - func: 모듈 최상위 함수 (pickle 가능), func(List[CsvCompanyRecord], *args)
+            - workers (int): 프로세스 수 (None이면 CPU 수)
+            - chunk_bytes (int): 범위당 바이트 수
+
+        Returns:
+            - AsyncIterator[Any]: 범위별 func 결과 (파일 순서)
+
+        Raises:
+            - ValueError: 필수 컬럼이 없는 헤더, 컬럼 수가 모자란 행
+        """
+        file_path = self._get_abs_path(file_path)
+        fp, _, columns = await asyncio.to_thread(self._open_csv, file_path)
+        fp.close()
+        ranges: List[Tuple[int, int]] = await asyncio.to_thread(_split_ranges, file_path, chunk_bytes)
+
+        loop = asyncio.get_running_loop()
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        max_pending: int = (workers or os.cpu_count() or 1) * 2
+        pending: Deque[asyncio.Future] = deque()
+        next_range: int = 0
+        try:
+            while next_range < len(ranges) or pending:
+                while next_range < len(ranges) and len(pending) < max_pending:
+                    start, end = ranges[next_range]
+                    pending.append(loop.run_in_executor(pool, _map_range, func, file_path, start, end, columns, args))
+                    next_range += 1
+
+                # 파일 순서대로 소비
+                yield await pending.popleft()
+        finally:
+            for future in pending:
+                future.cancel()
+            await asyncio.to_thread(pool.shutdown, True, cancel_futures=True)
+
 async def main():
     parser = Parser()
     results = await parser.parse_csv_by_file_path("./company_tag_sample.csv")
-    
+
     print(len(results))
     print(results[:5])
 
 ### MAIN
 if "__main__" == __name__:
-    import asyncio
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
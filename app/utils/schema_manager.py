@@ -0,0 +1,151 @@
+import sys
+from typing import List, Dict
+
+from sqlalchemy import text
+
+from app.utils.database import db_engine
+from app.utils.logger import setup_logger
+
+# Logger
+logger = setup_logger("Schema_Manager")
+
+
+# 필요한 확장
+REQUIRED_EXTENSIONS: List[str] = [
+    "pg_trgm",
+]
+
+# 필요한 인덱스
+REQUIRED_INDEXES: List[Dict[str, str]] = [
+    {
+        # 회사명 LIKE / similarity() / % 검색
+        "name": "tbl_company_names_name_trgm_idx",
+        "ddl": "CREATE INDEX CONCURRENTLY IF NOT EXISTS tbl_company_names_name_trgm_idx "
+               "ON public.tbl_company_names USING gin (name public.gin_trgm_ops)",
+    },
+    {
+        # 회사 id + 언어별 회사명 조회
+        "name": "tbl_company_names_company_id_language_id_idx",
+        "ddl": "CREATE INDEX CONCURRENTLY IF NOT EXISTS tbl_company_names_company_id_language_id_idx "
+               "ON public.tbl_company_names USING btree (company_id, language_id)",
+    },
+    {
+        # 같은 태그 관계(rel_id)의 다른 언어 태그명 조회
+        "name": "tbl_tags_rel_id_idx",
+        "ddl": "CREATE INDEX CONCURRENTLY IF NOT EXISTS tbl_tags_rel_id_idx "
+               "ON public.tbl_tags USING btree (rel_id)",
+    },
+    {
+        # 언어 추가 INSERT ... ON CONFLICT
+        #   - 중복 language_type 행이 있으면 만들지 않고 실패 (회사명 / 태그가 참조하므로 자동으로 정리하지 않음)
+        "name": "tbl_languages_language_type_key",
+        "ddl": "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS tbl_languages_language_type_key "
+               "ON public.tbl_languages USING btree (language_type)",
+        "duplicates": "SELECT language_type FROM public.tbl_languages "
+                      "GROUP BY language_type HAVING count(*) > 1 ORDER BY language_type",
+    },
+]
+
+
+class SchemaManager:
+    """
+    검색에 필요한 DB 확장 / 인덱스 관리
+        - 애플리케이션 시작 시(DB_ENSURE_INDEXES) 또는 CLI로 실행
+        - CREATE INDEX CONCURRENTLY 사용 -> 트랜잭션 밖(AUTOCOMMIT)에서 실행
+    """
+
+    async def verify_indexes(self):
+        """
+        필요한 인덱스 확인
+
+        Returns:
+            - List[str]: 없거나 INVALID 상태인 인덱스 이름 리스트
+        """
+        index_names: List[str] = [x["name"] for x in REQUIRED_INDEXES]
+        valid_indexes: List[str] = []
+
+        try:
+            async with db_engine.connect() as conn:
+                stmt = text(
+                    "SELECT c.relname FROM pg_catalog.pg_class c "
+                    "JOIN pg_catalog.pg_index i ON i.indexrelid = c.oid "
+                    "WHERE c.relname = ANY(:names) AND i.indisvalid"
+                )
+                db_results = await conn.execute(stmt, {"names": index_names})
+                valid_indexes = [row[0] for row in db_results.all()]
+
+        except Exception as e:
+            logger.error(f"[ERROR] verify_indexes: {e}")
+            raise e
+
+        return [x for x in index_names if x not in valid_indexes]
+
+    async def ensure_indexes(self):
+        """
+        필요한 확장 / 인덱스 생성
+            - INVALID 인덱스(CONCURRENTLY 실패 잔여물)는 삭제 후 다시 생성
+            - UNIQUE 인덱스는 먼저 중복 행을 확인 (duplicates)
+                -> 중복이 있으면 그 인덱스는 만들지 않고 (INVALID 잔여물 없음) 나머지를 만든 뒤 실패
+
+        Returns:
+            - List[str]: 새로 생성한 인덱스 이름 리스트
+
+        Raises:
+            - ValueError: UNIQUE 인덱스 대상 컬럼에 중복 행이 있음 (정리 후 다시 실행)
+        """
+        missing_indexes: List[str] = await self.verify_indexes()
+        if not missing_indexes:
+            return []
+
+        created_indexes: List[str] = []
+        duplicate_errors: List[str] = []
+        try:
+            async with db_engine.connect() as conn:
+                conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+
+                for extension in REQUIRED_EXTENSIONS:
+                    await conn.execute(text(f"CREATE EXTENSION IF NOT EXISTS {extension}"))
+
+                for index_info in REQUIRED_INDEXES:
+                    if index_info["name"] not in missing_indexes:
+                        continue
+
+                    if "duplicates" in index_info:
+                        db_results = await conn.execute(text(index_info["duplicates"]))
+                        duplicates: List[str] = [str(row[0]) for row in db_results.all()]
+                        if duplicates:
+                            duplicate_errors.append(f"{index_info['name']}: duplicate rows {duplicates}")
+                            continue
+
+                    logger.info(f"[SCHEMA] create index: {index_info['name']}")
+                    await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS public.{index_info['name']}"))
+                    await conn.execute(text(index_info["ddl"]))
+                    created_indexes.append(index_info["name"])
+
+            if duplicate_errors:
+                raise ValueError(f"cannot create unique indexes, remove duplicates first: {duplicate_errors}")
+
+        except Exception as e:
+            logger.error(f"[ERROR] ensure_indexes: {e}")
+            raise e
+
+        return created_indexes
+
+
+async def main(check_only: bool = False):
+    schema_manager = SchemaManager()
+
+    if check_only:
+        missing_indexes = await schema_manager.verify_indexes()
+        print(f"missing indexes: {missing_indexes}")
+        return len(missing_indexes)
+
+    created_indexes = await schema_manager.ensure_indexes()
+    print(f"created indexes: {created_indexes}")
+    return 0
+
+### MAIN
+# python -m app.utils.schema_manager [--check]
+if "__main__" == __name__:
+    import asyncio
+    sys.exit(asyncio.run(main(check_only="--check" in sys.argv[1:])))
@@ -9,6 +9,32 @@ class Settings(BaseSettings):
     DB_PASSWORD: str = "postgres"
     DB_NAME: str = "wantedlab"
     DB_ECHO: bool = True
+    DB_ENSURE_INDEXES: bool = True # 시작 시 검색용 인덱스 생성
+
+    # Search
+    COMPANY_SEARCH_MODE: str = "memory" # memory | like | trgm
+    # TAG_SEARCH_MODE: 두 방식의 태그 일치 기준이 달라 결과가 다를 수 있음
+    #   - memory: 정규화된 태그명(NFKC, 앞뒤 공백 제거, 대소문자 무시) 일치
+    #             같은 태그 관계(rel_id)로 이어진 태그명 전체 포함 (전이적)
+    #             태그 삭제로 같은 의미 묶음이 나뉘지 않음 (재구축 시 반영)
+    #   - db: 입력한 태그명 그대로 일치
+    #         같은 태그 관계의 다른 언어 태그명은 한 단계만 확장
+    TAG_SEARCH_MODE: str = "memory" # memory | db
+
+    # Cache
+    SEARCH_CACHE_SIZE: int = 10000
+    SEARCH_CACHE_TTL: float = 60.0 # seconds
+    TAG_SEARCH_CACHE_SIZE: int = 10000
+    TAG_SEARCH_CACHE_TTL: float = 60.0 # seconds
+    PROFILE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    PROFILE_CACHE_TTL: float = 300.0 # seconds
+
+    # Admin
+    ADMIN_TOKEN: str = "" # 관리 API(x-admin-token 헤더) 토큰, 비어 있으면 관리 API 비활성화
+
+    # Import
+    IMPORT_BATCH_SIZE: int = 10000 # CSV 가져오기 트랜잭션당 회사 수
+    IMPORT_PARSE_WORKERS: int = 1 # CSV 파싱 / 적재 프로세스 수 (1이면 단일 프로세스 스트리밍)
 
     model_config = {
         "case_sensitive": True,
@@ -0,0 +1,266 @@
+import heapq
+import re
+from bisect import bisect_left, bisect_right
+from typing import Callable, List, Optional, Sequence, Tuple
+
+# 태그 검색식
+#   - 연산자: AND, OR, NOT (대문자), 괄호, 큰따옴표("태그 이름")
+#   - 우선순위: NOT > AND > OR
+#   - 연산자 없이 이어진 단어는 공백 포함 태그명 하나로 취급 ("tag 4" -> 태그 "tag 4")
+#   - NOT은 AND 안에서 긍정 조건과 함께만 사용 ("tag_4 AND NOT tag_20")
+#   - 연산자(AND / OR / NOT)가 없거나 연산자 단어뿐이면 검색어 전체를 태그명 하나로 취급 (앞뒤 공백만 제거)
+#       -> 괄호 / 따옴표 / 연산자 단어가 들어간 태그명도 그대로 검색 ("C++ (언어)", "OR", "tag  4")
+#
+# 파싱 결과 (tuple)
+#   - ("tag", tag_name)
+#   - ("and", [node, ...]), ("or", [node, ...])
+#   - ("not", node)
+
+TagQuery = Tuple
+
+OPERATORS = ("AND", "OR", "NOT")
+
+_TOKEN_PATTERN = re.compile(r'\s*(?:(\()|(\))|"((?:[^"\\]|\\.)*)"|([^\s()"]+))')
+
+
+def _tokenize(query: str):
+    tokens: List[Tuple[str, str]] = []
+    position: int = 0
+    query = query.rstrip()
+    while position < len(query):
+        match = _TOKEN_PATTERN.match(query, position)
+        if match is None:
+            raise ValueError(f"invalid tag query: {query}")
+
+        open_paren, close_paren, quoted, word = match.groups()
+        if open_paren:
+            tokens.append(("(", open_paren))
+        elif close_paren:
+            tokens.append((")", close_paren))
+        elif quoted is not None:
+            tokens.append(("word", re.sub(r"\\(.)", r"\1", quoted)))
+        elif word in OPERATORS:
+            tokens.append((word, word))
+        else:
+            tokens.append(("word", word))
+        position = match.end()
+
+    return tokens
+
+
+class _Parser:
+    def __init__(self, tokens: List[Tuple[str, str]]):
+        self.tokens = tokens
+        self.position = 0
+
+    def peek(self):
+        if self.position < len(self.tokens):
+            return self.tokens[self.position][0]
+        return None
+
+    def take(self, kind: str):
+        if self.peek() != kind:
+            raise ValueError(f"invalid tag query: expected {kind}")
+        token = self.tokens[self.position]
+        self.position += 1
+        return token[1]
+
+    def parse_or(self):
+        nodes = [self.parse_and()]
+        while self.peek() == "OR":
+            self.take("OR")
+            nodes.append(self.parse_and())
+        return nodes[0] if len(nodes) == 1 else ("or", nodes)
+
+    def parse_and(self):
+        nodes = [self.parse_not()]
+        while self.peek() == "AND":
+            self.take("AND")
+            nodes.append(self.parse_not())
+        return nodes[0] if len(nodes) == 1 else ("and", nodes)
+
+    def parse_not(self):
+        if self.peek() == "NOT":
+            self.take("NOT")
+            return ("not", self.parse_not())
+        return self.parse_term()
+
+    def parse_term(self):
+        if self.peek() == "(":
+            self.take("(")
+            node = self.parse_or()
+            self.take(")")
+            return node
+
+        words = [self.take("word")]
+        while self.peek() == "word":
+            words.append(self.take("word"))
+        return ("tag", " ".join(words))
+
+
+def _validate(
+    node: TagQuery,
+    negation_allowed: bool = False,
+):
+    kind = node[0]
+    if kind == "tag":
+        if not node[1]:
+            raise ValueError("invalid tag query: empty tag")
+    elif kind == "not":
+        if not negation_allowed:
+            raise ValueError("invalid tag query: NOT must be combined with AND and a positive tag")
+        _validate(node[1])
+    elif kind == "and":
+        if all(child[0] == "not" for child in node[1]):
+            raise ValueError("invalid tag query: NOT must be combined with AND and a positive tag")
+        for child in node[1]:
+            _validate(child, negation_allowed=True)
+    else:
+        for child in node[1]:
+            _validate(child)
+
+
+def parse_tag_query(query: str):
+    """
+    태그 검색식 파싱
+
+    Args:
+        - query (str): 태그 검색식 (ex: 'tag_4 AND (tag_16 OR "tag 20") AND NOT tag_30') 또는 태그명
+
+    Returns:
+        - TagQuery: 파싱 결과
+
+    Raises:
+        - ValueError: 잘못된 검색식
+    """
+    if not query.strip():
+        raise ValueError("invalid tag query: empty query")
+
+    # 연산자가 없거나 연산자 단어뿐이면 태그명 하나
+    try:
+        tokens = _tokenize(query)
+    except ValueError:
+        if any(word in OPERATORS for word in query.split()):
+            raise
+        return ("tag", query.strip())
+    kinds = {kind for kind, _ in tokens}
+    if kinds.isdisjoint(OPERATORS) or "word" not in kinds:
+        return ("tag", query.strip())
+
+    parser = _Parser(tokens)
+    node = parser.parse_or()
+    if parser.peek() is not None:
+        raise ValueError(f"invalid tag query: unexpected {parser.tokens[parser.position][1]}")
+
+    _validate(node)
+    return node
+
+
+def tag_names(node: TagQuery):
+    """
+    검색식에 포함된 태그명 목록 (캐시 무효화용)
+    """
+    if node[0] == "tag":
+        return [node[1]]
+    if node[0] == "not":
+        return tag_names(node[1])
+    return [name for child in node[1] for name in tag_names(child)]
+
+
+class _Matcher:
+    """
+    검색식 노드별 회사 id 조회기
+        - iterate(after): after보다 큰 회사 id를 오름차순으로 하나씩 생성
+        - contains(company_id): 회사 id 포함 여부 (bisect)
+        - size: 결과 수 상한 (AND에서 가장 작은 조건부터 순회하기 위함)
+    """
+
+    def __init__(
+        self,
+        node: TagQuery,
+        lookup: Callable[[str], Sequence[int]],
+    ):
+        self.kind: str = node[0]
+        if self.kind == "tag":
+            self.posting: Sequence[int] = lookup(node[1])
+            self.size: int = len(self.posting)
+            return
+
+        if self.kind == "or":
+            self.children: List[_Matcher] = [_Matcher(child, lookup) for child in node[1]]
+            self.size = sum(child.size for child in self.children)
+            return
+
+        # and: 작은 조건부터 정렬, NOT은 따로 보관
+        self.children = sorted(
+            (_Matcher(child, lookup) for child in node[1] if child[0] != "not"),
+            key=lambda child: child.size,
+        )
+        self.negatives: List[_Matcher] = [_Matcher(child[1], lookup) for child in node[1] if child[0] == "not"]
+        self.size = self.children[0].size
+
+    def contains(
+        self,
+        company_id: int,
+    ):
+        if self.kind == "tag":
+            i = bisect_left(self.posting, company_id)
+            return i < len(self.posting) and self.posting[i] == company_id
+        if self.kind == "or":
+            return any(child.contains(company_id) for child in self.children)
+        return (
+            all(child.contains(company_id) for child in self.children)
+            and not any(negative.contains(company_id) for negative in self.negatives)
+        )
+
+    def iterate(
+        self,
+        after: Optional[int],
+    ):
+        if self.kind == "tag":
+            start = bisect_right(self.posting, after) if after is not None else 0
+            for i in range(start, len(self.posting)):
+                yield self.posting[i]
+            return
+
+        if self.kind == "or":
+            previous: Optional[int] = None
+            for company_id in heapq.merge(*[child.iterate(after) for child in self.children]):
+                if company_id != previous:
+                    previous = company_id
+                    yield company_id
+            return
+
+        # and: 가장 작은 조건을 순회하며 나머지 조건은 포함 여부만 확인
+        driver, others = self.children[0], self.children[1:]
+        if driver.size == 0:
+            return
+        for company_id in driver.iterate(after):
+            if (
+                all(other.contains(company_id) for other in others)
+                and not any(negative.contains(company_id) for negative in self.negatives)
+            ):
+                yield company_id
+
+
+def iterate_tag_query(
+    node: TagQuery,
+    lookup: Callable[[str], Sequence[int]],
+    after: Optional[int] = None,
+):
+    """
+    검색식에 해당하는 회사 id를 after 이후부터 오름차순으로 하나씩 생성
+        - 태그별 회사 id 목록(정렬됨)을 복사하지 않고 bisect로 시작 위치를 찾음
+            -> 필요한 만큼만 읽으므로 깊은 페이지도 첫 페이지와 비용이 같고, 태그 인기도와 무관
+        - AND: 가장 작은 조건을 순회하며 나머지 조건은 bisect로 포함 여부 확인, NOT은 제외
+        - OR: 정렬된 목록 병합 (중복 제거)
+
+    Args:
+        - node (TagQuery): parse_tag_query 결과
+        - lookup: 태그명 -> 정렬된 회사 id 목록
+        - after (int): 이전 페이지 마지막 회사 id
+
+    Returns:
+        - Iterator[int]: 회사 id (오름차순, 중복 없음)
+    """
+    return _Matcher(node, lookup).iterate(after)
@@ -17,6 +17,13 @@ SET xmloption = content;
 SET client_min_messages = warning;
 SET row_security = off;
 
+--
+-- Name: pg_trgm; Type: EXTENSION; Schema: -; Owner: -
+--
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA public;
+
+
 SET default_tablespace = '';
 
 SET default_table_access_method = heap;
@@ -1787,6 +1794,13 @@ CREATE INDEX tbl_company_ids_add_date_idx ON public.tbl_company_ids USING btree
 CREATE INDEX tbl_company_names_company_id_idx ON public.tbl_company_names USING btree (company_id);
 
 
+--
+-- Name: tbl_company_names_company_id_language_id_idx; Type: INDEX; Schema: public; Owner: postgres
+--
+
+CREATE INDEX tbl_company_names_company_id_language_id_idx ON public.tbl_company_names USING btree (company_id, language_id);
+
+
 --
 -- Name: tbl_company_names_language_id_idx; Type: INDEX; Schema: public; Owner: postgres
 --
@@ -1794,6 +1808,13 @@ CREATE INDEX tbl_company_names_company_id_idx ON public.tbl_company_names USING
 CREATE INDEX tbl_company_names_language_id_idx ON public.tbl_company_names USING btree (language_id);
 
 
+--
+-- Name: tbl_company_names_name_trgm_idx; Type: INDEX; Schema: public; Owner: postgres
+--
+
+CREATE INDEX tbl_company_names_name_trgm_idx ON public.tbl_company_names USING gin (name public.gin_trgm_ops);
+
+
 --
 -- Name: tbl_company_names_rel_id_idx; Type: INDEX; Schema: public; Owner: postgres
 --
@@ -1801,6 +1822,13 @@ CREATE INDEX tbl_company_names_language_id_idx ON public.tbl_company_names USING
 CREATE INDEX tbl_company_names_rel_id_idx ON public.tbl_company_names USING btree (rel_id);
 
 
+--
+-- Name: tbl_languages_language_type_key; Type: INDEX; Schema: public; Owner: postgres
+--
+
+CREATE UNIQUE INDEX tbl_languages_language_type_key ON public.tbl_languages USING btree (language_type);
+
+
 --
 -- Name: tbl_tag_relations_company_id_idx; Type: INDEX; Schema: public; Owner: postgres
 --
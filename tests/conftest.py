@@ -0,0 +1,80 @@
+import pytest
+
+import app.repositories.unit_of_work as unit_of_work
+
+
+class FakeResult:
+    """
+    session.execute 결과 대역 (미리 정한 행 목록 반환)
+    """
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+    def scalar_one(self):
+        return self.rows[0][0]
+
+    def scalar(self):
+        return self.rows[0][0] if self.rows else None
+
+
+class FakeSession:
+    """
+    AsyncSession 대역
+        - commit / rollback 횟수 기록
+        - execute는 실행한 문장을 기록하고 script로 정한 결과를 순서대로 반환
+    """
+
+    def __init__(self):
+        self.commits = 0
+        self.rollbacks = 0
+        self.pending = False
+        self.statements = []
+        self.results = []
+
+    def script(self, *results):
+        self.results = [FakeResult(rows) for rows in results]
+
+    def in_transaction(self):
+        return self.pending
+
+    async def execute(self, stmt, params=None):
+        self.pending = True
+        self.statements.append(stmt)
+        return self.results[len(self.statements) - 1]
+
+    async def commit(self):
+        self.commits += 1
+        self.pending = False
+
+    async def rollback(self):
+        self.rollbacks += 1
+        self.pending = False
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_session(monkeypatch):
+    """
+    UnitOfWork가 쓰는 get_db를 FakeSession 하나를 내주도록 교체
+    """
+    session = FakeSession()
+
+    async def get_db():
+        yield session
+
+    monkeypatch.setattr(unit_of_work, "get_db", get_db)
+    return session
+
+
+@pytest.fixture
+def fake_result():
+    """
+    FakeResult 클래스 (결과를 직접 만드는 대역용)
+    """
+    return FakeResult
@@ -0,0 +1,138 @@
+import time
+
+from app.utils.cache import LRUCache, VersionedCache
+
+
+def test_lru_cache_eviction():
+    """
+    LRU 제거 및 통계
+    pytest tests/test_cache.py::test_lru_cache_eviction
+    """
+    cache = LRUCache(max_size=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    # 가장 오래 사용하지 않은 b 제거
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert stats["hits"] == 3
+    assert stats["misses"] == 1
+    assert stats["evictions"] == 1
+
+
+def test_lru_cache_ttl():
+    """
+    TTL 만료
+    pytest tests/test_cache.py::test_lru_cache_ttl
+    """
+    cache = LRUCache(max_size=10, ttl_seconds=0.01)
+    cache.set("a", [])
+    assert cache.get("a") == []
+
+    time.sleep(0.02)
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_lru_cache_invalidate_dependencies():
+    """
+    의존 키 기반 무효화
+    pytest tests/test_cache.py::test_lru_cache_invalidate_dependencies
+    """
+    cache = LRUCache(max_size=10, ttl_seconds=60)
+    cache.set(("タグ_22", "ko"), ["딤딤섬 대구점"], dependencies=["タグ_22"])
+    cache.set(("タグ_22", "en"), ["Dimdimsum"], dependencies=["タグ_22"])
+    cache.set(("태그_4", "ko"), ["원티드랩"], dependencies=["태그_4"])
+
+    cache.invalidate(["タグ_22"])
+    assert cache.get(("タグ_22", "ko")) is None
+    assert cache.get(("タグ_22", "en")) is None
+    assert cache.get(("태그_4", "ko")) == ["원티드랩"]
+    assert cache.stats()["invalidations"] == 2
+
+
+def test_lru_cache_drops_value_read_before_invalidation():
+    """
+    조회 중에 무효화되면 조회 전 세대로는 저장되지 않음
+    pytest tests/test_cache.py::test_lru_cache_drops_value_read_before_invalidation
+    """
+    cache = LRUCache(max_size=10, ttl_seconds=60)
+
+    generation = cache.generation()
+    cache.invalidate(["tag_4"])
+    cache.set(("tag_4", "ko"), ["원티드랩"], dependencies=["tag_4"], generation=generation)
+    assert cache.get(("tag_4", "ko")) is None
+
+    generation = cache.generation()
+    cache.clear()
+    cache.set("a", 1, generation=generation)
+    assert cache.get("a") is None
+    assert cache.stats()["stale"] == 2
+
+    # 무효화가 없었으면 저장
+    cache.set("a", 1, generation=cache.generation())
+    assert cache.get("a") == 1
+
+
+def test_versioned_cache():
+    """
+    버전 기반 무효화 및 메모리 한도
+    pytest tests/test_cache.py::test_versioned_cache
+    """
+    cache = VersionedCache(max_bytes=1024 * 1024, ttl_seconds=60)
+
+    # 조회 전 버전으로 저장
+    version = cache.version(1)
+    cache.set(1, {"id": 1, "tags": ["a"]}, version)
+    assert cache.get(1) == {"id": 1, "tags": ["a"]}
+
+    # 쓰기 후 기존 항목 무효화
+    cache.bump(1)
+    assert cache.get(1) is None
+
+    # 조회 중 쓰기가 끼어들면 오래된 값은 저장하지 않음
+    version = cache.version(1)
+    cache.bump(1)
+    cache.set(1, {"id": 1, "tags": []}, version)
+    assert cache.get(1) is None
+    assert cache.stats()["stale"] == 1
+
+    # 메모리 한도 초과 시 오래된 항목부터 제거
+    small = VersionedCache(max_bytes=600, ttl_seconds=60)
+    for key in range(10):
+        small.set(key, "x" * 100, small.version(key))
+    stats = small.stats()
+    assert stats["memory_bytes"] <= 600
+    assert stats["evictions"] > 0
+    assert small.get(9) == "x" * 100
+
+
+def test_versioned_cache_prunes_versions():
+    """
+    항목이 없는 key의 버전은 정리되고, 정리 이전에 받은 버전으로는 저장되지 않음
+    pytest tests/test_cache.py::test_versioned_cache_prunes_versions
+    """
+    cache = VersionedCache(max_bytes=1024 * 1024, ttl_seconds=60)
+    cache.set("kept", "value", cache.version("kept"))
+
+    # 조회 중에 쓰기가 끼어든 key
+    version = cache.version("written")
+    cache.bump("written")
+
+    # 저장 없이 쓰기만 반복 -> 버전 수는 한도 안에서 유지
+    for key in range(10 * VersionedCache.MIN_VERSIONS):
+        cache.bump(key)
+    assert cache.stats()["versions"] <= VersionedCache.MIN_VERSIONS + 1
+
+    # 정리된 key도 정리 이전에 받은 버전으로는 저장되지 않음
+    cache.set("written", "old value", version)
+    assert cache.get("written") is None
+
+    # 남은 항목은 정리 후에도 유효
+    assert cache.get("kept") == "value"
@@ -0,0 +1,165 @@
+from app.indexes import CompanyNameIndex, NgramIndex, DeletionIndex
+
+
+def test_ngram_index_like_semantics():
+    """
+    n-gram 색인 부분 일치 검색 (LIKE '%query%'와 동일한 결과)
+    pytest tests/test_company_name_index.py::test_ngram_index_like_semantics
+    """
+    index = NgramIndex(n=2)
+    index.add(1, "주식회사 링크드코리아")
+    index.add(2, "스피링크")
+    index.add(3, "링")
+    index.add(4, "크링")
+
+    assert index.search("링크") == [1, 2]
+    assert index.search("링") == [1, 2, 3, 4]
+    assert index.search("크링") == [4]
+    assert index.search("없는회사") == []
+    assert index.search("") == [1, 2, 3, 4]
+
+    index.remove(2)
+    assert index.search("링크") == [1]
+
+
+def test_company_name_index_partition():
+    """
+    언어별 파티션 검색 및 추가 반영
+    pytest tests/test_company_name_index.py::test_company_name_index_partition
+    """
+    index = CompanyNameIndex()
+    index.begin_rebuild()
+
+    # DB 조회 ~ 재구축 사이에 추가된 회사명
+    index.add(3, 1, "Wantedlab", "en")
+
+    index.rebuild([
+        (1, 1, "원티드랩", "ko"),
+        (2, 2, None, "ko"),
+    ])
+    index.add(4, 3, "원티드코리아", "ko")
+
+    assert index.is_loaded
+    assert [name for _, name in index.search("원티드", "ko", limit=10)] == ["원티드랩", "원티드코리아"]
+    assert [name for _, name in index.search("Wanted", "ko", limit=10)] == ["원티드랩"]
+
+    # 와일드카드가 포함된 질의는 DB로 처리
+    assert not index.can_serve("원티%")
+
+
+def test_company_name_index_ranking():
+    """
+    관련도 순 정렬 및 keyset 페이지네이션
+        - 완전 일치 > 접두 일치 > 부분 일치 > 짧은 회사명
+    pytest tests/test_company_name_index.py::test_company_name_index_ranking
+    """
+    index = CompanyNameIndex()
+    index.rebuild([
+        (1, 1, "주식회사 링크드코리아", "ko"),
+        (2, 2, "스피링크", "ko"),
+        (3, 3, "링크드인", "ko"),
+        (4, 4, "링크", "ko"),
+        (5, 5, "링크앤", "ko"),
+    ])
+
+    first_page = index.search("링크", "ko", limit=2)
+    assert [name for _, name in first_page] == ["링크", "링크앤"]
+
+    second_page = index.search("링크", "ko", limit=2, after=first_page[-1][0])
+    assert [name for _, name in second_page] == ["링크드인", "스피링크"]
+
+    last_page = index.search("링크", "ko", limit=2, after=second_page[-1][0])
+    assert [name for _, name in last_page] == ["주식회사 링크드코리아"]
+
+
+def test_company_name_index_cross_language():
+    """
+    다국어 자동완성
+        - 모든 언어 회사명에서 검색, 출력 언어 회사명 반환 (없으면 다른 언어)
+        - 동일 회사는 한 번만 노출
+    pytest tests/test_company_name_index.py::test_company_name_index_cross_language
+    """
+    index = CompanyNameIndex()
+    index.rebuild([
+        (1, 1, "원티드랩", "ko"),
+        (2, 1, "Wantedlab", "en"),
+        (3, 2, "원티드코리아", "ko"),
+        (4, 3, "", "en"),
+        (5, 3, "원티드재팬", "ja"),
+    ])
+
+    results = index.search("원티드", "en", limit=10)
+    assert [name for _, name in results] == ["Wantedlab", "원티드재팬", "원티드코리아"]
+
+    results = index.search("Wanted", "ko", limit=10)
+    assert [name for _, name in results] == ["원티드랩"]
+
+
+def test_company_name_index_hangul():
+    """
+    초성 / 입력 중인 음절 자동완성
+    pytest tests/test_company_name_index.py::test_company_name_index_hangul
+    """
+    index = CompanyNameIndex()
+    index.rebuild([
+        (1, 1, "원티드랩", "ko"),
+        (2, 1, "Wantedlab", "en"),
+        (3, 2, "딤딤섬 대구점", "ko"),
+        (4, 3, "와이즈키즈(wisekids)", "ko"),
+    ])
+
+    # 초성
+    assert [name for _, name in index.search("ㅇㅌㄷ", "ko", limit=10)] == ["원티드랩"]
+    assert [name for _, name in index.search("ㄷㄱㅈ", "en", limit=10)] == ["딤딤섬 대구점"]
+
+    # 입력 중인 음절 (다음 음절 초성이 받침으로 붙은 경우 포함)
+    assert [name for _, name in index.search("원티ㄷ", "en", limit=10)] == ["Wantedlab"]
+    assert [name for _, name in index.search("원틷", "ko", limit=10)] == ["원티드랩"]
+    assert [name for _, name in index.search("ㅇㅗ", "ko", limit=10)] == ["와이즈키즈(wisekids)"]
+    assert [name for _, name in index.search("오", "ko", limit=10)] == ["와이즈키즈(wisekids)"]
+    assert [name for _, name in index.search("와ㅇ", "ko", limit=10)] == ["와이즈키즈(wisekids)"]
+    assert [name for _, name in index.search("원티드랩", "ko", limit=10)] == ["원티드랩"]
+
+
+def test_company_name_index_fuzzy():
+    """
+    오타 허용 검색 (편집 거리 2 이내)
+    pytest tests/test_company_name_index.py::test_company_name_index_fuzzy
+    """
+    index = CompanyNameIndex()
+    index.rebuild([
+        (1, 1, "원티드랩", "ko"),
+        (2, 1, "Wantedlab", "en"),
+        (3, 2, "Wanted Korea", "en"),
+        (4, 3, "Springk", "en"),
+    ])
+
+    assert index.search("Wantdlab", "ko", limit=10) == []
+    assert [name for _, name in index.fuzzy_search("Wantdlab", "ko", limit=10)] == ["원티드랩"]
+    assert [name for _, name in index.fuzzy_search("wnatedlab", "en", limit=10)] == ["Wantedlab"]
+    assert index.fuzzy_search("Wtdlb", "en", limit=10) == []
+
+    assert index.fuzzy_company_id("Wantdlab") == 1
+    assert index.fuzzy_company_id("Sprinkg") == 3
+    assert index.fuzzy_company_id("없는회사") == 0
+
+    # 가장 가까운 거리에 여러 회사 -> 모호하므로 0
+    index.add(5, 4, "Springs", "en")
+    assert index.fuzzy_company_id("Springz") == 0
+
+
+def test_deletion_index_bounded_distance():
+    """
+    삭제 색인 조회 결과는 편집 거리 max_distance 이내
+    pytest tests/test_company_name_index.py::test_deletion_index_bounded_distance
+    """
+    index = DeletionIndex(max_distance=2)
+    index.add(1, "wantedlab")
+    index.add(2, "wanted")
+    index.add(3, "infobank")
+
+    assert index.search("wantedlab") == [(0, 1)]
+    assert index.search("wantdelab") == [(1, 1)]
+    assert index.search("wanted") == [(0, 2)]
+    assert index.search("wantedl") == [(1, 2), (2, 1)]
+    assert index.search("wantedlab", max_distance=0) == [(0, 1)]
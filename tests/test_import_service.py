@@ -0,0 +1,24 @@
+from app.services import ImportService
+from app.utils.parser import CsvCompnay
+
+
+def test_csv_row_to_new_company():
+    """
+    CSV 행 -> 회사 추가 입력 형식 (빈 회사명 제외, 태그는 같은 위치끼리 묶음)
+    pytest tests/test_import_service.py::test_csv_row_to_new_company
+    """
+    item = CsvCompnay(
+        company_ko="원티드랩",
+        company_en="Wantedlab",
+        company_ja="",
+        tag_ko=["태그_4", "태그_20"],
+        tag_en=["tag_4", "tag_20"],
+        tag_ja=["タグ_4"],
+    )
+
+    new_company = ImportService()._to_new_company(item)
+    assert new_company["company_name"] == {"ko": "원티드랩", "en": "Wantedlab"}
+    assert new_company["tags"] == [
+        {"tag_name": {"ko": "태그_4", "en": "tag_4", "ja": "タグ_4"}},
+        {"tag_name": {"ko": "태그_20", "en": "tag_20"}},
+    ]
@@ -0,0 +1,71 @@
+import pytest
+
+import app.utils.schema_manager as schema_manager
+from app.indexes import LanguageRegistry
+from app.utils.schema_manager import SchemaManager
+
+
+def test_language_registry():
+    """
+    언어 id 조회 (중복 language_type은 가장 작은 id)
+    pytest tests/test_language_registry.py::test_language_registry
+    """
+    registry = LanguageRegistry()
+    assert not registry.is_loaded
+    assert registry.get_id("ko") is None
+
+    registry.rebuild([("ko", 3), ("ja", 2), ("ko", 1)])
+    assert registry.is_loaded
+    assert registry.get_id("ko") == 1
+    assert registry.get_type(3) == "ko"
+    assert registry.get_ids(["ko", "en", "ja"]) == {"ko": 1, "ja": 2}
+
+    # 재구축 중에 등록된 언어 유지
+    registry.register("en", 4)
+    registry.rebuild([("ko", 1), ("ja", 2)])
+    assert registry.get_id("en") == 4
+    assert registry.stats() == {"is_loaded": True, "languages": 3, "rows": 4}
+
+
+@pytest.mark.asyncio
+async def test_unique_language_index_requires_no_duplicates(monkeypatch, fake_result):
+    """
+    중복 language_type 행이 있으면 UNIQUE 인덱스를 만들지 않고 실패
+    pytest tests/test_language_registry.py::test_unique_language_index_requires_no_duplicates
+    """
+    executed = []
+
+    class _Connection:
+        async def execution_options(self, **kwargs):
+            return self
+
+        async def execute(self, stmt, params=None):
+            sql = str(stmt)
+            executed.append(sql)
+            if "HAVING count(*) > 1" in sql:
+                return fake_result([("ko",)])
+            return fake_result([])
+
+    class _Engine:
+        def connect(self):
+            class _Context:
+                async def __aenter__(self):
+                    return _Connection()
+
+                async def __aexit__(self, *args):
+                    return False
+
+            return _Context()
+
+    async def verify_indexes(self):
+        return ["tbl_tags_rel_id_idx", "tbl_languages_language_type_key"]
+
+    monkeypatch.setattr(schema_manager, "db_engine", _Engine())
+    monkeypatch.setattr(SchemaManager, "verify_indexes", verify_indexes)
+
+    with pytest.raises(ValueError, match="tbl_languages_language_type_key"):
+        await SchemaManager().ensure_indexes()
+
+    # 다른 인덱스는 생성, 중복이 있는 UNIQUE 인덱스는 생성하지 않음 (INVALID 잔여물 없음)
+    assert any("CREATE INDEX CONCURRENTLY IF NOT EXISTS tbl_tags_rel_id_idx" in sql for sql in executed)
+    assert not any("tbl_languages_language_type_key" in sql for sql in executed)
@@ -3,7 +3,7 @@ import json
 from typing import List, Dict, Any
 
 from app.services import CompanyService
-from app.utils.parser import Parser, CsvCompnay
+from app.utils.parser import Parser, CsvCompnay, CsvCompanyRecord
 
 @pytest.mark.asyncio
 async def test_add_new_company():
@@ -49,4 +49,74 @@ async def test_add_new_company():
         result = await company_service.add_new_company(new_company, language=return_lang_type)
 
         # Then
-        assert result != None
\ No newline at end of file
+        assert result != None
+
+
+@pytest.mark.asyncio
+async def test_iter_csv_batches(tmp_path):
+    """
+    CSV 배치 파싱 (batch_size 행씩, 빈 줄 건너뛰기)
+    pytest tests/test_parse_csv.py::test_iter_csv_batches
+    """
+    file_path = tmp_path / "companies.csv"
+    file_path.write_text(
+        "company_ko,company_en,company_ja,tag_ja,tag_ko,tag_en\n"
+        "원티드랩,Wantedlab,,タグ_4|タグ_20,태그_4|태그_20,tag_4|tag_20\n"
+        "\n"
+        "회사_2,company_2,,タグ_1,태그_1,tag_1\n"
+        "회사_3,,,タグ_2,태그_2,tag_2\n",
+        encoding="utf-8",
+    )
+
+    batches = [batch async for batch in Parser().iter_csv_batches(str(file_path), batch_size=2)]
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert batches[0][0] == CsvCompanyRecord(
+        company_ko="원티드랩",
+        company_en="Wantedlab",
+        company_ja="",
+        tag_ko=["태그_4", "태그_20"],
+        tag_en=["tag_4", "tag_20"],
+        tag_ja=["タグ_4", "タグ_20"],
+    )
+    assert batches[1][0].company_ko == "회사_3"
+
+
+@pytest.mark.asyncio
+async def test_iter_csv_batches_invalid_header(tmp_path):
+    """
+    필수 컬럼이 없는 CSV
+    pytest tests/test_parse_csv.py::test_iter_csv_batches_invalid_header
+    """
+    file_path = tmp_path / "companies.csv"
+    file_path.write_text("company_ko,company_en\n원티드랩,Wantedlab\n", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        [batch async for batch in Parser().iter_csv_batches(str(file_path))]
+
+
+@pytest.mark.asyncio
+async def test_map_csv_ranges(tmp_path):
+    """
+    바이트 범위별 프로세스 풀 파싱 (줄바꿈 기준 분할, 결과는 파일 순서)
+    pytest tests/test_parse_csv.py::test_map_csv_ranges
+    """
+    file_path = tmp_path / "companies.csv"
+    lines = ["company_ko,company_en,company_ja,tag_ko,tag_en,tag_ja"]
+    for no in range(1, 201):
+        lines.append(f"회사_{no},company_{no},,태그_{no}|태그_1,tag_{no}|tag_1,タグ_{no}")
+    file_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    async def collect(func, workers):
+        return [
+            result
+            async for result in Parser().map_csv_ranges(str(file_path), func, workers=workers, chunk_bytes=1024)
+        ]
+
+    counts = await collect(len, 2)
+    assert len(counts) > 1
+    assert sum(counts) == 200
+
+    # 범위 순서대로 이어 붙이면 단일 프로세스 파싱과 같은 결과
+    ranges = await collect(list, 2)
+    streamed = [record async for batch in Parser().iter_csv_batches(str(file_path)) for record in batch]
+    assert [record for records in ranges for record in records] == streamed
@@ -22,10 +22,11 @@ def test_company_name_autocomplete(api):
     # searched_companies = json.loads(resp.data.decode("utf-8")) # Flask
     searched_companies = resp.json() # FastAPI
 
+    # 관련도 순: 둘 다 부분 일치 -> 짧은 회사명 먼저
     assert resp.status_code == 200
     assert searched_companies == [
-        {"company_name": "주식회사 링크드코리아"},
         {"company_name": "스피링크"},
+        {"company_name": "주식회사 링크드코리아"},
     ]
 
 
@@ -66,6 +67,32 @@ def test_company_search(api):
     # assert resp.status_code == 404
 
 
+def test_company_batch_search(api):
+    """
+    회사 이름 목록으로 일괄 검색
+    요청 순서대로 반환하고, 없는 회사는 found=False로 표시합니다.
+
+    pytest tests/test_senior_app.py::test_company_batch_search
+    """
+    resp = api.post(
+        "/companies/batch",
+        json={"company_names": ["Wantedlab", "없는회사", "Wantedlab"]},
+        headers=[("x-wanted-language", "ko")],
+    )
+    companies = resp.json()
+
+    assert resp.status_code == 200
+    assert [company["query"] for company in companies] == ["Wantedlab", "없는회사", "Wantedlab"]
+    assert [company["found"] for company in companies] == [True, False, True]
+    assert companies[0]["company_name"] == "원티드랩"
+    assert companies[1] == {
+        "query": "없는회사",
+        "found": False,
+        "company_name": "",
+        "tags": [],
+    }
+
+
 def test_new_company(api):
     """
     3.  새로운 회사 추가
@@ -0,0 +1,85 @@
+from app.indexes.tag_facets import TagFacets
+from app.main import app
+from app.utils import settings
+
+
+def test_tag_facets_counts():
+    """
+    언어별 태그 회사 수 집계 (재구축, 증감, 상위 태그)
+    pytest tests/test_tag_facets.py::test_tag_facets_counts
+    """
+    facets = TagFacets()
+    facets.rebuild([
+        # (language_type, tag_name, 회사 수)
+        ("ko", "태그_4", 3),
+        ("ko", "태그_16", 2),
+        ("en", "tag_4", 3),
+    ])
+    assert facets.top("ko", 10) == [("태그_4", 3), ("태그_16", 2)]
+
+    facets.add(11, "ko", "태그_16")
+    facets.add(12, "ko", "태그_16")
+    facets.add(13, "ko", "태그_50")
+    assert facets.top("ko", 2) == [("태그_16", 4), ("태그_4", 3)]
+
+    facets.remove(13, "ko", "태그_50")
+    assert facets.count("ko", "태그_50") == 0
+    assert facets.top("ko", 10) == [("태그_16", 4), ("태그_4", 3)]
+    assert facets.top("en", 10) == [("tag_4", 3)]
+    assert facets.top("jp", 10) == []
+
+    # 재구축 중 증감분은 집계에 없는 것만 재구축 결과에 반영 (태그 행 id 기준)
+    facets.begin_rebuild()
+    facets.add(21, "en", "tag_4")     # 집계에 포함된 추가
+    facets.add(22, "en", "tag_4")     # 집계 이후 추가
+    facets.remove(23, "en", "tag_7")  # 집계에 포함된 삭제 (행 없음)
+    facets.remove(24, "en", "tag_9")  # 집계 이후 삭제 (행 있음)
+    assert facets.pending_row_ids() == [21, 22, 23, 24]
+    facets.rebuild([("en", "tag_4", 3), ("en", "tag_7", 1), ("en", "tag_9", 1)], present_row_ids=[21, 24])
+    assert facets.count("en", "tag_4") == 4
+    assert facets.count("en", "tag_7") == 1
+    assert facets.count("en", "tag_9") == 0
+    assert facets.count("ko", "태그_4") == 0
+
+
+def test_tag_facets_autocomplete():
+    """
+    태그명 자동완성 (접두 일치, 회사 수 순, 증감 반영)
+    pytest tests/test_tag_facets.py::test_tag_facets_autocomplete
+    """
+    facets = TagFacets()
+    facets.rebuild([
+        ("en", "tag_1", 2),
+        ("en", "tag_16", 5),
+        ("en", "Tag_10", 1),
+        ("en", "tag_2", 9),
+        ("ko", "태그_1", 3),
+    ])
+
+    assert facets.autocomplete("en", "TAG_1", 10) == [("tag_16", 5), ("tag_1", 2), ("Tag_10", 1)]
+    assert facets.autocomplete("en", "tag_1", 1) == [("tag_16", 5)]
+    assert facets.autocomplete("ko", "태그", 10) == [("태그_1", 3)]
+    assert facets.autocomplete("en", "없는", 10) == []
+
+    # 새 태그 추가 / 마지막 회사 삭제 반영
+    facets.add(1, "en", "tag_100")
+    facets.remove(2, "en", "Tag_10")
+    assert facets.autocomplete("en", "tag_10", 10) == [("tag_100", 1)]
+
+
+
+def test_tag_facets_rebuild_requires_admin_token(monkeypatch):
+    """
+    태그 집계 재구축 API는 관리자 토큰이 없거나 다르면 403 (ADMIN_TOKEN이 비어 있으면 항상 403)
+    pytest tests/test_tag_facets.py::test_tag_facets_rebuild_requires_admin_token
+    """
+    api = app.test_client()
+    headers = {"x-wanted-language": "ko"}
+
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "")
+    assert api.post("/tags/facets/rebuild", headers=headers).status_code == 403
+    assert api.post("/tags/facets/rebuild", headers={**headers, "x-admin-token": ""}).status_code == 403
+
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "secret")
+    assert api.post("/tags/facets/rebuild", headers=headers).status_code == 403
+    assert api.post("/tags/facets/rebuild", headers={**headers, "x-admin-token": "wrong"}).status_code == 403
@@ -0,0 +1,202 @@
+import pytest
+from sqlalchemy import create_engine, insert
+
+import app.repositories.tag_repository as tag_repository_module
+from app.indexes.tag_index import TagIndex, normalize_tag
+from app.models import CompanyID, CompanyName, Language, Tag
+from app.repositories.tag_repository import TagRepository
+from app.utils import settings
+from app.utils.cursor import decode_cursor
+
+
+def test_tag_index_lookup():
+    """
+    태그 역색인 조회 (정규화, 같은 의미의 다른 언어 태그, 회사 중복 제거)
+    pytest tests/test_tag_index.py::test_tag_index_lookup
+    """
+    index = TagIndex()
+    index.rebuild([
+        # (tag_row_id, tag_name, company_id, rel_id)
+        (1, "태그_4", 3, 10),
+        (2, "tag_4", 3, 10),
+        (3, "tag_4", 1, 11),
+        (4, "タグ_4", 1, 11),
+        (5, "tag_16", 2, 12),
+    ])
+
+    assert normalize_tag(" ＴＡＧ＿４ ") == "tag_4"
+    assert index.company_ids("TAG_4") == [1, 3]
+    assert index.company_ids("태그_4") == [1, 3]
+    assert index.company_ids("タグ_4") == [1, 3]
+    assert index.company_ids("없는태그") == []
+    assert index.canonical_id("태그_4") == index.canonical_id("タグ_4")
+    assert sorted(index.equivalent_tags("tag_4")) == ["tag_4", "タグ_4", "태그_4"]
+
+    stats = index.stats()
+    assert stats["rows"] == 5
+    assert stats["canonical_tags"] == 2
+    assert stats["postings"] == 3
+
+
+def test_tag_index_incremental():
+    """
+    태그 추가 / 삭제 반영 (같은 회사에 같은 의미의 태그가 남아 있으면 유지)
+    pytest tests/test_tag_index.py::test_tag_index_incremental
+    """
+    index = TagIndex()
+    index.rebuild([(1, "tag_4", 3, 10)])
+
+    # 새 태그 관계로 다른 언어 태그명이 묶임
+    index.add([(2, "태그_4"), (3, "tag_4")], 1)
+    index.add([(4, "Tag_4")], 3)
+    assert index.company_ids("태그_4") == [1, 3]
+
+    index.remove(1, "tag_4", 3)
+    assert index.company_ids("tag_4") == [1, 3]
+    index.remove(4, "Tag_4", 3)
+    assert index.company_ids("tag_4") == [1]
+    index.remove(2, "태그_4", 1)
+    assert index.company_ids("tag_4") == [1]
+    index.remove(3, "tag_4", 1)
+    assert index.company_ids("tag_4") == []
+
+    # 서로 다른 회사 id 배열을 가진 두 묶음이 합쳐짐
+    index.add([(5, "tag_20")], 5)
+    index.add([(6, "タグ_20")], 2)
+    index.add([(7, "tag_20"), (8, "タグ_20")], 5)
+    assert index.company_ids("タグ_20") == [2, 5]
+    index.remove(7, "tag_20", 5)
+    assert index.company_ids("タグ_20") == [2, 5]
+
+    # 재구축 중 변경분은 재구축 결과에 반영
+    index.begin_rebuild()
+    index.add([(9, "tag_50")], 7)
+    index.rebuild([(3, "tag_4", 1, 10)])
+    assert index.company_ids("tag_50") == [7]
+    assert index.company_ids("tag_4") == [1]
+
+
+def test_tag_index_rebuild_replay_is_idempotent():
+    """
+    재구축 중 변경분이 조회 결과에 이미 반영되어 있으면 다시 반영하지 않음 (태그 행 id 기준)
+    pytest tests/test_tag_index.py::test_tag_index_rebuild_replay_is_idempotent
+    """
+    index = TagIndex()
+    index.begin_rebuild()
+
+    # 조회 전에 commit -> 조회 결과에 포함된 추가 / 삭제
+    index.add([(1, "tag_4"), (2, "태그_4")], 3)
+    index.add([(3, "tag_7")], 3)
+    index.remove(3, "tag_7", 3)
+
+    # 조회 이후 commit -> 조회 결과에 없는 추가 / 삭제
+    index.add([(4, "tag_4")], 5)
+    index.remove(5, "tag_9", 6)
+
+    index.rebuild([
+        (1, "tag_4", 3, 10),
+        (2, "태그_4", 3, 10),
+        (5, "tag_9", 6, 11),
+    ])
+
+    stats = index.stats()
+    assert index.company_ids("태그_4") == [3, 5]
+    assert index.company_ids("tag_7") == []
+    assert index.company_ids("tag_9") == []
+    assert stats["rows"] == 3
+
+    # 중복 행으로 세지 않았으므로 한 행 삭제로 회사 id가 빠짐
+    index.remove(4, "tag_4", 5)
+    assert index.company_ids("tag_4") == [3]
+
+
+def test_tag_search_modes():
+    """
+    TAG_SEARCH_MODE별 태그 일치 기준 (settings.TAG_SEARCH_MODE 참고)
+        - memory: 정규화된 태그명, 태그 관계로 이어진 태그명 전체 (전이적)
+        - db: 태그명 그대로, 태그 관계 한 단계만 확장 (SQLite에서 같은 SQL 실행)
+    pytest tests/test_tag_index.py::test_tag_search_modes
+    """
+    rows = [
+        # (tag_row_id, tag_name, company_id, rel_id, language_id)
+        (1, "tag_4", 1, 10, 2),
+        (2, "태그_4", 1, 10, 1),
+        (3, "태그_4", 2, 11, 1),
+        (4, "タグ_4", 2, 11, 3),
+        (5, "タグ_4", 3, 12, 3),
+    ]
+
+    # memory: tag_4 - 태그_4 - タグ_4 로 이어진 회사 모두
+    index = TagIndex()
+    index.rebuild([(row_id, tag_name, company_id, rel_id) for row_id, tag_name, company_id, rel_id, _ in rows])
+    assert index.company_ids("tag_4") == [1, 2, 3]
+    assert index.company_ids(" TAG_4 ") == [1, 2, 3]
+
+    # db: tag_4와 같은 태그 관계의 태그명(tag_4, 태그_4)까지만
+    engine = create_engine("sqlite://")
+    Tag.__table__.create(engine)
+    repository = TagRepository()
+    with engine.begin() as conn:
+        conn.execute(insert(Tag), [
+            {"id": row_id, "tag_name": tag_name, "company_id": company_id, "rel_id": rel_id, "language_id": language_id}
+            for row_id, tag_name, company_id, rel_id, language_id in rows
+        ])
+        assert set(conn.execute(repository._tag_query_to_select(("tag", "tag_4"))).scalars()) == {1, 2}
+        assert set(conn.execute(repository._tag_query_to_select(("tag", " TAG_4 "))).scalars()) == set()
+
+        # 단일 태그 조회는 company_id 순 limit개까지만
+        assert list(conn.execute(repository._tag_query_to_select(("tag", "태그_4"), limit=1)).scalars()) == [1]
+        assert list(conn.execute(repository._tag_query_to_select(("tag", "태그_4"), after=1, limit=1)).scalars()) == [2]
+
+
+@pytest.mark.asyncio
+async def test_tag_search_db_mode_cursor_skips_companies_without_names(monkeypatch):
+    """
+    db 모드 다음 페이지 커서는 회사 id 기준 (회사명이 없는 회사가 있어도 페이지가 끊기지 않음)
+    pytest tests/test_tag_index.py::test_tag_search_db_mode_cursor_skips_companies_without_names
+    """
+    engine = create_engine("sqlite://")
+    for model in (CompanyID, Language, CompanyName, Tag):
+        model.__table__.create(engine)
+
+    with engine.begin() as conn:
+        conn.execute(insert(CompanyID), [{"id": company_id} for company_id in (1, 2, 3)])
+        conn.execute(insert(Language), [{"id": 1, "language_type": "ko"}, {"id": 2, "language_type": "en"}])
+        conn.execute(insert(CompanyName), [
+            {"id": 1, "name": "", "company_id": 1, "language_id": 1, "rel_id": 1},
+            {"id": 2, "name": "원티드랩", "company_id": 2, "language_id": 1, "rel_id": 1},
+            {"id": 3, "name": "Wantedlab", "company_id": 2, "language_id": 2, "rel_id": 1},
+            {"id": 4, "name": "Dimdimsum", "company_id": 3, "language_id": 2, "rel_id": 1},
+        ])
+        conn.execute(insert(Tag), [
+            {"id": company_id, "tag_name": "tag_4", "company_id": company_id, "rel_id": 10, "language_id": 2}
+            for company_id in (1, 2, 3)
+        ])
+
+    class _SQLiteSession:
+        def __init__(self, conn):
+            self.conn = conn
+
+        async def execute(self, stmt):
+            return self.conn.execute(stmt)
+
+    async def _get_db():
+        with engine.connect() as conn:
+            yield _SQLiteSession(conn)
+
+    monkeypatch.setattr(settings, "TAG_SEARCH_MODE", "db")
+    monkeypatch.setattr(tag_repository_module, "get_db", _get_db)
+    repository = TagRepository()
+
+    # 첫 페이지의 회사(1)는 회사명이 없음 -> 이름은 빠지지만 커서는 회사 id 1
+    page = await repository.search_company_name_by_tag_query(("tag", "tag_4"), language="en", limit=1)
+    assert page["company_names"] == []
+    assert decode_cursor(page["next_cursor"], 1) == (1,)
+
+    page = await repository.search_company_name_by_tag_query(("tag", "tag_4"), language="en", limit=1, after=1)
+    assert page["company_names"] == ["Wantedlab"]
+    assert decode_cursor(page["next_cursor"], 1) == (2,)
+
+    page = await repository.search_company_name_by_tag_query(("tag", "tag_4"), language="ko", limit=1, after=2)
+    assert page["company_names"] == ["Dimdimsum"]
+    assert page["next_cursor"] is None
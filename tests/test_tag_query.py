@@ -0,0 +1,64 @@
+import pytest
+
+from app.utils.tag_query import iterate_tag_query, parse_tag_query, tag_names
+
+
+def test_parse_tag_query():
+    """
+    태그 검색식 파싱 (우선순위, 괄호, 따옴표, 공백 포함 태그명)
+    pytest tests/test_tag_query.py::test_parse_tag_query
+    """
+    assert parse_tag_query("タグ_22") == ("tag", "タグ_22")
+    assert parse_tag_query("tag 4") == ("tag", "tag 4")
+    assert parse_tag_query('a OR b AND NOT "c d"') == (
+        "or", [("tag", "a"), ("and", [("tag", "b"), ("not", ("tag", "c d"))])],
+    )
+    assert parse_tag_query("(a OR b) AND c") == (
+        "and", [("or", [("tag", "a"), ("tag", "b")]), ("tag", "c")],
+    )
+    assert tag_names(parse_tag_query("(a OR b) AND NOT c")) == ["a", "b", "c"]
+
+    for query in ["", "a AND", "(a OR b", "NOT a", "a OR NOT b", 'a AND "b']:
+        with pytest.raises(ValueError):
+            parse_tag_query(query)
+
+
+def test_parse_tag_query_without_operators():
+    """
+    연산자가 없는 검색어는 태그명 그대로 (괄호, 따옴표, 연산자 단어, 연속 공백 포함)
+    pytest tests/test_tag_query.py::test_parse_tag_query_without_operators
+    """
+    for tag_name in ["C++ (언어)", "AND", "OR", "NOT", "tag  4", '"tag 20"', 'say "hi', "(a)"]:
+        assert parse_tag_query(tag_name) == ("tag", tag_name)
+    assert parse_tag_query("  tag_4 ") == ("tag", "tag_4")
+
+    # 연산자가 있으면 검색식 (연산자 단어 태그명은 따옴표로)
+    assert parse_tag_query('"C++ (언어)" OR "AND"') == ("or", [("tag", "C++ (언어)"), ("tag", "AND")])
+    with pytest.raises(ValueError):
+        parse_tag_query('tag_4 AND "b')
+
+
+def test_iterate_tag_query():
+    """
+    태그 검색식 평가 (교집합 / 합집합 / 차집합, 커서 이후부터 오름차순)
+    pytest tests/test_tag_query.py::test_iterate_tag_query
+    """
+    postings = {
+        "tag_4": [1, 2, 3, 4],
+        "tag_16": [2, 3, 5],
+        "tag_20": [3],
+    }
+    lookup = lambda tag_name: postings.get(tag_name, [])
+    evaluate = lambda query, after=None: list(iterate_tag_query(parse_tag_query(query), lookup, after))
+
+    assert evaluate("tag_4 AND tag_16") == [2, 3]
+    assert evaluate("tag_4 AND tag_16 AND NOT tag_20") == [2]
+    assert evaluate("tag_16 OR tag_20") == [2, 3, 5]
+    assert evaluate("tag_4 AND NOT (tag_16 OR tag_20)") == [1, 4]
+    assert evaluate("tag_4 AND 없는태그") == []
+    assert evaluate("(tag_4 AND tag_16) OR tag_20") == [2, 3]
+
+    # 커서 이후부터
+    assert evaluate("tag_4", after=2) == [3, 4]
+    assert evaluate("tag_4 OR tag_16", after=3) == [4, 5]
+    assert evaluate("tag_4 AND tag_16", after=3) == []
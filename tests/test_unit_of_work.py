@@ -0,0 +1,117 @@
+import pytest
+
+import app.repositories.company_repository as company_repository_module
+from app.indexes.language_registry import LanguageRegistry
+from app.indexes.tag_facets import TagFacets
+from app.indexes.tag_index import TagIndex
+from app.repositories import CompanyRepository, UnitOfWork
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_commit(fake_session):
+    """
+    commit 이후에만 on_commit 실행
+    pytest tests/test_unit_of_work.py::test_unit_of_work_commit
+    """
+    applied = []
+
+    async with UnitOfWork() as uow:
+        fake_session.pending = True
+        uow.on_commit(lambda: applied.append(1))
+        uow.on_commit(lambda: applied.append(2))
+        assert applied == []
+        await uow.commit()
+
+    assert applied == [1, 2]
+    assert fake_session.commits == 1
+    assert fake_session.rollbacks == 0
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_rollback(fake_session):
+    """
+    commit 없이 (예외로) 블록을 벗어나면 rollback, on_commit 버림
+    pytest tests/test_unit_of_work.py::test_unit_of_work_rollback
+    """
+    applied = []
+
+    with pytest.raises(ValueError):
+        async with UnitOfWork() as uow:
+            fake_session.pending = True
+            uow.on_commit(lambda: applied.append(1))
+            raise ValueError("unknown languages")
+
+    assert applied == []
+    assert fake_session.commits == 0
+    assert fake_session.rollbacks == 1
+
+
+@pytest.mark.asyncio
+async def test_add_new_tag_joins_existing_relation(monkeypatch, fake_session):
+    """
+    묶음의 일부 언어만 이미 있으면 나머지 태그는 기존 태그 관계에 추가되고 색인에서도 같은 의미로 묶임
+    pytest tests/test_unit_of_work.py::test_add_new_tag_joins_existing_relation
+    """
+    fake_session.script(
+        [(30, "tag_4")],     # 같은 회사에 이미 있는 태그 (en)
+        [(101, 1), (103, 3)], # 추가된 태그 (ko, ja)
+        [],                   # tag_ids UPDATE
+    )
+    statements = fake_session.statements
+
+    index = TagIndex()
+    index.rebuild([(1, "tag_4", 7, 30), (2, "tag_4", 8, 31)])
+    registry = LanguageRegistry()
+    registry.rebuild([("ko", 1), ("en", 2), ("ja", 3)])
+    monkeypatch.setattr(company_repository_module, "tag_index", index)
+    monkeypatch.setattr(company_repository_module, "tag_facets", TagFacets())
+    monkeypatch.setattr(company_repository_module, "language_registry", registry)
+
+    added = await CompanyRepository().add_new_tag(
+        company_id=7,
+        new_tag={"ko": "태그_4", "en": "tag_4", "ja": "タグ_4"},
+    )
+    assert added == ["태그_4", "タグ_4"]
+    assert fake_session.commits == 1
+
+    # 새 관계를 만들지 않고 기존 관계(30)에 추가
+    assert [stmt.table.name for stmt in statements[1:]] == ["tbl_tags", "tbl_tag_relations"]
+    assert statements[1].compile().params["rel_id_m0"] == 30
+    update_params = statements[2].compile().params
+    assert update_params["id_1"] == 30
+    assert update_params["tag_ids_1"] == [101, 103]
+
+    assert index.canonical_id("태그_4") == index.canonical_id("tag_4") == index.canonical_id("タグ_4")
+    assert index.company_ids("タグ_4") == [7, 8]
+
+
+@pytest.mark.asyncio
+async def test_delete_tag_info_loads_language_registry(monkeypatch, fake_session):
+    """
+    레지스트리가 없거나 모르는 언어여도 삭제된 태그의 태그 집계 반영
+    pytest tests/test_unit_of_work.py::test_delete_tag_info_loads_language_registry
+    """
+    fake_session.script(
+        [(101, "태그_4", 7, 1), (102, "tag_4", 7, 2)], # 삭제된 태그 (ko, en)
+        [("en", 2)],                                   # 레지스트리에 없는 언어
+        [(7,)],                                        # 삭제된 태그 관계
+    )
+
+    registry = LanguageRegistry()
+    facets = TagFacets()
+    facets.rebuild([("ko", "태그_4", 2), ("en", "tag_4", 2)])
+
+    async def load_language_registry(self):
+        registry.rebuild([("ko", 1)])
+
+    monkeypatch.setattr(company_repository_module, "tag_index", TagIndex())
+    monkeypatch.setattr(company_repository_module, "tag_facets", facets)
+    monkeypatch.setattr(company_repository_module, "language_registry", registry)
+    monkeypatch.setattr(CompanyRepository, "load_language_registry", load_language_registry)
+
+    deleted = await CompanyRepository().delete_tag_info(tag_rel_id=30)
+    assert deleted == ["태그_4", "tag_4"]
+    assert registry.is_loaded
+    assert registry.get_type(2) == "en"
+    assert facets.count("ko", "태그_4") == 1
+    assert facets.count("en", "tag_4") == 1